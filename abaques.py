@@ -0,0 +1,322 @@
+# =======================================================
+# ABAQUES BAEL ET CRIBLAGE RAPIDE - RAHANI Soulaimane
+# =======================================================
+#
+# Grandeurs adimensionnelles (flexion simple, section rectangulaire) :
+#   μ = Mu / (b·d²·σbc)         δ = d'/d
+#   ω = Ast·fsu / (b·d·σbc)     ω' = Asc·fsu / (b·d·σbc)
+#   α, z/d, εsc (‰)
+#
+# Structure exploitée (organigramme de calcul_elu) :
+#   - armatures simples (μ ≤ μR) : ω, α, z/d ne dépendent que de μ,
+#     avec ω = 1 - √(1 - 2μ) ;
+#   - armatures doubles (μ > μR) : ω = ωR + (μ - μR)·kω(δ) et
+#     ω' = (μ - μR)·kω'(δ), linéaires en μ à δ fixé.
+# Les abaques sont donc des tables à une dimension (en μ, et en δ par
+# nuance), générées par le calcul ELU par lots sur une section unitaire
+# et stockées par maille (valeur au bord gauche et pente).
+#
+# Borne d'erreur : l'interpolation linéaire d'une fonction f sur une maille
+# de pas h s'écarte au plus de h²/8 · max|f''|. Les dérivées secondes sont
+# connues analytiquement et croissantes sur chaque maille. Le changement de
+# branche de σsc (εsc = εels, discontinu avec les εels arrondis) est placé
+# sur un nœud de la grille en δ, et les tables en δ sont relevées juste à
+# l'intérieur des mailles : la borne est garantie, pas seulement estimée.
+
+import numpy as np
+
+from backends_bael import calcul_elu_lot
+from calculs_bael import MU_AB, PARAMETRES_ACIER, E_ACIER_MPA
+
+TABLES_MU = ('omega', 'pente_omega', 'alpha', 'pente_alpha', 'z_d', 'pente_z_d', 'borne_omega')
+TABLES_DELTA = (
+    'k_omega', 'pente_k_omega', 'k_omega_p', 'pente_k_omega_p',
+    'eps_sc_pour_mille', 'pente_eps_sc_pour_mille', 'borne_k_omega', 'borne_k_omega_p',
+)
+
+# Retrait relatif (au pas) des points de relevé à l'intérieur des mailles en δ
+RETRAIT_MAILLE = 1e-9
+
+# Marge relative couvrant les arrondis flottants (tables et calcul exact)
+MARGE_ARRONDI = 1e-12
+
+# Taille des blocs de criblage (tableaux intermédiaires tenant en cache)
+BLOC_CRIBLAGE = 16384
+
+
+class AbaquesBAEL:
+    """
+    Abaques précalculés μ → (α, z/d, ω) et d'/d → (kω, kω', εsc) par nuance
+
+    Les requêtes de criblage sont des interpolations linéaires vectorisées,
+    traitées par blocs ; chaque valeur criblée est accompagnée d'une borne
+    garantie de l'écart au calcul exact (Ast, Asc en m²).
+    """
+
+    def __init__(self, tables, mu_grille, pas_delta, delta_max):
+        # tables[g] : tableau (nuance, maille en μ) pour TABLES_MU, (nuance,
+        # maille en δ) pour TABLES_DELTA, (nuance,) pour 'saut_omega' ;
+        # nuances dans l'ordre de PARAMETRES_ACIER
+        self.tables = tables
+        self.mu_grille = mu_grille
+        self.pas_delta = pas_delta
+        self.delta_max = delta_max
+        self.nuances = np.array(list(PARAMETRES_ACIER), dtype=float)
+        # Paramètres par nuance, plus une ligne NaN pour les nuances inconnues
+        self._parametres = {
+            'muR': np.array([PARAMETRES_ACIER[a]['muR'] for a in PARAMETRES_ACIER] + [np.nan])
+        }
+        # Section refusée pour μ < μAB et μ < μ1
+        self._parametres['mu_min'] = np.array(
+            [min(MU_AB, PARAMETRES_ACIER[a]['mu_1']) for a in PARAMETRES_ACIER] + [np.nan]
+        )
+        self._parametres['saut_omega'] = np.append(tables['saut_omega'], np.nan)
+        self._parametres['pas_delta'] = np.append(pas_delta, np.nan)
+        self._alphaR = np.array([PARAMETRES_ACIER[a]['alphaR'] for a in PARAMETRES_ACIER] + [np.nan])
+        self._plat = {g: tables[g].ravel() for g in TABLES_MU + TABLES_DELTA}
+
+    # ============================================
+    # 1. CONSTRUCTION
+    # ============================================
+
+    @staticmethod
+    def _exact(mu, delta, acier_type):
+        """Grandeurs adimensionnelles exactes (section b = d = 1 m)"""
+        fc28_MPa = 25.0
+        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
+        elu = calcul_elu_lot(mu * sigma_bc_MPa, 1.0, 1.0, delta, fc28_MPa, acier_type)
+        fsu_MPa = acier_type / 1.15
+        return {
+            'omega': elu['Ast_m2'] * fsu_MPa / sigma_bc_MPa,
+            'omega_p': elu['Asc_m2'] * fsu_MPa / sigma_bc_MPa,
+            'alpha': np.where(elu['valide'], elu['alpha'], np.nan),
+            'z_d': np.where(elu['valide'], elu['z_m'], np.nan),
+            'eps_sc_pour_mille': np.where(elu['valide'], elu['eps_sc_pour_mille'], np.nan),
+        }
+
+    @staticmethod
+    def _delta_coude(acier_type):
+        """d'/d pour lequel εsc = εels (changement de branche de σsc)"""
+        eps_els = PARAMETRES_ACIER[acier_type]['eps_els_pour_mille']
+        return 1 - 2 * eps_els / (eps_els + 3.5)
+
+    @classmethod
+    def construire(cls, pas_mu=0.001, delta_max=0.30, pas_delta=0.005):
+        """Génère les abaques et leurs bornes d'erreur d'interpolation"""
+        # Grille régulière en μ jusqu'au plus grand μR : les points singuliers
+        # de l'organigramme (μ1, μAB, μR) doivent tomber sur des nœuds
+        mu_R_max = max(p['muR'] for p in PARAMETRES_ACIER.values())
+        mu_grille = np.round(np.arange(int(round(mu_R_max / pas_mu)) + 1) * pas_mu, 10)
+        singuliers = [MU_AB] + [p[c] for p in PARAMETRES_ACIER.values() for c in ('muR', 'mu_1')]
+        if not np.all(np.isin(singuliers, mu_grille)):
+            raise ValueError("Le pas en μ doit placer μ1, μAB et μR sur la grille")
+
+        # Grille en δ par nuance : pas ≤ pas_delta, changement de branche sur un nœud
+        pas_nuances = []
+        for acier_type in PARAMETRES_ACIER:
+            coude = cls._delta_coude(acier_type)
+            pas_nuances.append(coude / np.ceil(coude / pas_delta) if coude < delta_max else pas_delta)
+        pas_nuances = np.array(pas_nuances)
+        nb_delta = int(np.ceil(delta_max / pas_nuances.min() - 1e-9)) + 1
+
+        tables = {g: [] for g in TABLES_MU + TABLES_DELTA + ('saut_omega',)}
+        for pas, acier_type in zip(pas_nuances, PARAMETRES_ACIER):
+            p = PARAMETRES_ACIER[acier_type]
+            eps_els = p['eps_els_pour_mille']
+            delta_grille = np.arange(nb_delta) * pas
+            if ((1 - delta_grille[-1]) * (eps_els + 3.5) - eps_els) <= 0:
+                raise ValueError("d'/d maximal trop grand : εsc s'annule dans le domaine")
+
+            # Armatures simples : tables en μ sur [min(μ1, μAB), μR], prolongées
+            # par des constantes de part et d'autre (lignes refusées ou plafonnées)
+            i_min = int(np.searchsorted(mu_grille, min(MU_AB, p['mu_1']) - 1e-12))
+            i_R = int(np.searchsorted(mu_grille, p['muR'] - 1e-12))
+            simple = cls._exact(mu_grille[np.clip(np.arange(len(mu_grille)), i_min, i_R)], 0.0, acier_type)
+            for g in ('omega', 'alpha', 'z_d'):
+                tables[g].append(simple[g][:-1])
+                tables['pente_' + g].append(np.diff(simple[g]))
+            # ω = 1 - √(1 - 2μ) : ω'' = (1 - 2μ)^(-3/2), maximale à droite de la maille
+            tables['borne_omega'].append(pas_mu**2 / 8 * (1 - 2 * mu_grille[1:]) ** -1.5)
+
+            # Armatures doubles : pentes en μ à δ fixé, relevées aux deux bouts
+            # de chaque maille en δ (légèrement en retrait : limites de part et
+            # d'autre d'une discontinuité sur un nœud)
+            retrait = RETRAIT_MAILLE * pas
+            bouts = {}
+            for cote, delta in (('gauche', delta_grille[:-1] + retrait), ('droite', delta_grille[1:] - retrait)):
+                un = cls._exact(p['muR'] + 1.0, delta, acier_type)
+                deux = cls._exact(p['muR'] + 2.0, delta, acier_type)
+                bouts[cote] = {
+                    'k_omega': deux['omega'] - un['omega'],
+                    'k_omega_p': deux['omega_p'] - un['omega_p'],
+                    'eps_sc_pour_mille': un['eps_sc_pour_mille'],
+                    'omega_R': 2 * un['omega'] - deux['omega'],
+                }
+            for g in ('k_omega', 'k_omega_p', 'eps_sc_pour_mille'):
+                tables[g].append(bouts['gauche'][g])
+                tables['pente_' + g].append(bouts['droite'][g] - bouts['gauche'][g])
+            # Saut de ω au passage en armatures doubles (αR arrondi)
+            tables['saut_omega'].append(bouts['gauche']['omega_R'][0] - simple['omega'][i_R])
+
+            # kω = 1/(1 - δ) : kω'' = 2/(1 - δ)³ ; kω' = kω tant que σsc = fsu,
+            # sinon c/p(u) avec u = 1 - δ, p = k·u² - εels·u, c = 1000·fsu/E :
+            # (kω')' = -c·(2k·u - εels)/p², (kω')'' = c·(6k·p + 2εels²)/p³.
+            # Toutes croissantes en δ : maximum au nœud de droite ; le côté du
+            # changement de branche est lu au centre de la maille. Le retrait
+            # des points de relevé ajoute au plus retrait × max|f'|.
+            u = 1 - delta_grille[1:]
+            milieu = 1 - (delta_grille[:-1] + delta_grille[1:]) / 2
+            k = eps_els + 3.5
+            c = 1000 * (acier_type / 1.15) / E_ACIER_MPA
+            poly = k * u * u - eps_els * u
+            elastique = milieu * k - eps_els < eps_els
+            d1_k_omega, d2_k_omega = 1 / u**2, 2 / u**3
+            d1_k_omega_p = np.where(elastique, c * (2 * k * u - eps_els) / poly**2, d1_k_omega)
+            d2_k_omega_p = np.where(elastique, c * (6 * k * poly + 2 * eps_els**2) / poly**3, d2_k_omega)
+            tables['borne_k_omega'].append(pas**2 / 8 * d2_k_omega + retrait * d1_k_omega)
+            tables['borne_k_omega_p'].append(pas**2 / 8 * d2_k_omega_p + retrait * d1_k_omega_p)
+
+        tables = {g: np.array(v) for g, v in tables.items()}
+        return cls(tables, mu_grille, pas_nuances, float(delta_max))
+
+    # ============================================
+    # 2. PERSISTANCE
+    # ============================================
+
+    def enregistrer(self, chemin):
+        """Enregistre les abaques (.npz)"""
+        np.savez_compressed(
+            chemin, mu_grille=self.mu_grille, pas_delta=self.pas_delta,
+            delta_max=np.array(self.delta_max), nuances=self.nuances, **self.tables
+        )
+
+    @classmethod
+    def charger(cls, chemin):
+        with np.load(chemin, allow_pickle=False) as f:
+            if not np.array_equal(f['nuances'], list(PARAMETRES_ACIER)):
+                raise KeyError("Abaques générés pour d'autres nuances d'acier")
+            tables = {g: f[g] for g in TABLES_MU + TABLES_DELTA + ('saut_omega',)}
+            return cls(tables, f['mu_grille'], f['pas_delta'], float(f['delta_max']))
+
+    @classmethod
+    def charger_ou_construire(cls, chemin, **options):
+        """Relit les abaques s'ils existent, sinon les construit et les enregistre"""
+        try:
+            return cls.charger(chemin)
+        except (OSError, KeyError):
+            abaques = cls.construire(**options)
+            abaques.enregistrer(chemin)
+            return abaques
+
+    # ============================================
+    # 3. INTERPOLATION ET CRIBLAGE
+    # ============================================
+
+    def _indices_nuance(self, acier_type):
+        """Rang de la nuance dans les tables (-1 : nuance inconnue → ligne NaN)"""
+        n = np.full(acier_type.shape, -1, dtype=np.int64)
+        for rang, nuance in enumerate(self.nuances):
+            n += (acier_type == nuance) * (rang + 1)
+        return n
+
+    def _cribler_bloc(self, Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, details):
+        """Criblage d'un bloc de sections (tableaux à une dimension)"""
+        n = self._indices_nuance(acier_type)
+        par = {c: v[n] for c, v in self._parametres.items()}
+        t = self._plat
+
+        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
+        mu = Mu_MNm / (b_m * d_m * d_m * sigma_bc_MPa)
+        delta = dp_m / d_m
+
+        with np.errstate(invalid='ignore'):
+            # Armatures simples : interpolation en μ, plafonné à μR
+            nb_mailles_mu = t['omega'].size // len(self.nuances)
+            x = np.minimum(mu, par['muR']) / (self.mu_grille[1] - self.mu_grille[0])
+            i = np.clip(np.nan_to_num(x).astype(np.int64), 0, nb_mailles_mu - 1)
+            tu = x - i
+            k = n * nb_mailles_mu + i
+
+            # Armatures doubles : interpolation en δ des pentes en μ, appliquées
+            # à la part de μ au-delà de μR (nulle en armatures simples)
+            nb_mailles_delta = t['k_omega'].size // len(self.nuances)
+            y = np.nan_to_num(delta / par['pas_delta'])
+            j = np.clip(y.astype(np.int64), 0, nb_mailles_delta - 1)
+            tv = y - j
+            q = n * nb_mailles_delta + j
+            Mr = np.maximum(mu - par['muR'], 0.0)
+            doubles = Mr > 0
+
+            hors_domaine = doubles & ~((delta >= 0) & (delta <= self.delta_max))
+            # Échelle ω → A (m²), NaN pour les sections refusées ou hors domaine
+            echelle = np.where(
+                (mu >= par['mu_min']) & ~hors_domaine,
+                b_m * d_m * sigma_bc_MPa / (acier_type / 1.15), np.nan,
+            )
+
+            omega = (t['omega'][k] + tu * t['pente_omega'][k] + doubles * par['saut_omega']
+                     + Mr * (t['k_omega'][q] + tv * t['pente_k_omega'][q]))
+            omega_p = Mr * (t['k_omega_p'][q] + tv * t['pente_k_omega_p'][q])
+            borne_omega = t['borne_omega'][k] + Mr * t['borne_k_omega'][q] + MARGE_ARRONDI * omega
+            borne_omega_p = Mr * t['borne_k_omega_p'][q] + MARGE_ARRONDI * omega_p
+
+            resultat = {
+                'mu': mu,
+                'Ast_m2': omega * echelle,
+                'Asc_m2': omega_p * echelle,
+                'hors_domaine': hors_domaine,
+                'borne_Ast_m2': borne_omega * echelle,
+                'borne_Asc_m2': borne_omega_p * echelle,
+            }
+            if details:
+                retenu = ~np.isnan(echelle)
+                alphaR = self._alphaR[n]
+                alpha = np.where(doubles, alphaR, t['alpha'][k] + tu * t['pente_alpha'][k])
+                z_d = np.where(doubles, 1 - 0.4 * alphaR, t['z_d'][k] + tu * t['pente_z_d'][k])
+                eps = np.where(doubles, t['eps_sc_pour_mille'][q] + tv * t['pente_eps_sc_pour_mille'][q], 0.0)
+                resultat['alpha'] = np.where(retenu, alpha, np.nan)
+                resultat['z_m'] = np.where(retenu, z_d * d_m, np.nan)
+                resultat['eps_sc_pour_mille'] = np.where(retenu, eps, np.nan)
+        return resultat
+
+    def cribler(self, Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, details=False):
+        """
+        Estimation rapide de Ast / Asc pour un grand nombre de sections
+
+        Retourne un dict de tableaux : mu, Ast, Asc (NaN si section non
+        valide ou hors domaine), hors_domaine, et les bornes garanties
+        borne_Ast_m2 / borne_Asc_m2 de l'écart au calcul exact ; avec
+        details=True également α, z et εsc.
+        """
+        entrees = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type)]
+        )
+        forme = entrees[0].shape
+        entrees = [x.ravel() for x in entrees]
+        taille = entrees[0].size
+
+        resultat = {}
+        for debut in range(0, max(taille, 1), BLOC_CRIBLAGE):
+            bloc = self._cribler_bloc(*[x[debut:debut + BLOC_CRIBLAGE] for x in entrees], details)
+            for g, valeurs in bloc.items():
+                if g not in resultat:
+                    resultat[g] = np.empty(taille, dtype=valeurs.dtype)
+                resultat[g][debut:debut + BLOC_CRIBLAGE] = valeurs
+        return {g: valeurs.reshape(forme) for g, valeurs in resultat.items()}
+
+    def cribler_puis_verifier(self, Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, retenir):
+        """
+        Criblage approché de toutes les sections, calcul exact des retenues
+
+        retenir: fonction (résultat du criblage) → masque booléen des sections
+        à vérifier exactement. Retourne (criblage, indices retenus, calcul exact).
+        """
+        criblage = self.cribler(Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type)
+        indices = np.nonzero(retenir(criblage))[0]
+        entrees = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type)]
+        )
+        exact = calcul_elu_lot(*[x[indices] for x in entrees])
+        return criblage, indices, exact
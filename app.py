@@ -15,6 +15,30 @@ except ImportError:
     CALCULS_DISPONIBLES = False
     st.error("⚠️ Erreur : module de calcul BAEL introuvable")
 
+try:
+    from ferraillage import index_defaut
+    FERRAILLAGE_DISPONIBLE = True
+except ImportError:
+    FERRAILLAGE_DISPONIBLE = False
+
+try:
+    from regles_bael import REGLES_BAEL
+    REGLES_DISPONIBLES = True
+except ImportError:
+    REGLES_DISPONIBLES = False
+
+try:
+    from rendu_resultats import rendre_panneau
+    RENDU_DISPONIBLE = True
+except ImportError:
+    RENDU_DISPONIBLE = False
+
+try:
+    from projet_bael import ProjetBAEL
+    PROJET_DISPONIBLE = True
+except ImportError:
+    PROJET_DISPONIBLE = False
+
 
 # =======================================================
 # FOOTER
@@ -109,6 +133,9 @@ if "resultats_elu" not in st.session_state:
 if "resultats_els" not in st.session_state:
     st.session_state.resultats_els = None
 
+if "projet" not in st.session_state:
+    st.session_state.projet = ProjetBAEL() if PROJET_DISPONIBLE else None
+
 
 # =======================================================
 # FONCTIONS UTILES
@@ -153,6 +180,60 @@ def valider_dimensions(h, h_unite, d, d_unite, dp, dp_unite, b, b_unite):
     return True, h_m, d_m, dp_m, b_m
 
 
+def calculer_resultats(data):
+    """Calcule ELU + ELS à partir d'un dict donnees_saisie"""
+    te = data.get("section") == "te"
+    donnees_norm = CalculBAEL.normaliser_donnees(data)
+    if te:
+        resultats_elu = CalculBAEL.calcul_elu_te(
+            Mu_MNm=donnees_norm["Mu_MNm"],
+            b_m=donnees_norm["b_m"],
+            b0_m=data["b0"],
+            h0_m=data["h0"],
+            d_m=donnees_norm["d_m"],
+            dp_m=donnees_norm["dp_m"],
+            fc28_MPa=donnees_norm["fc28_MPa"],
+            acier_type=donnees_norm["acier_type"],
+        )
+        resultats_els = CalculBAEL.verification_els_te(
+            Ms_MNm=donnees_norm["Ms_MNm"],
+            b_m=donnees_norm["b_m"],
+            b0_m=data["b0"],
+            h0_m=data["h0"],
+            d_m=donnees_norm["d_m"],
+            dp_m=donnees_norm["dp_m"],
+            fc28_MPa=donnees_norm["fc28_MPa"],
+            acier_type=donnees_norm["acier_type"],
+            fissuration=donnees_norm["fissuration"],
+            acier_ha=donnees_norm["acier_ha"],
+            Ast_m2=resultats_elu["Ast_m2"],
+            Asc_m2=resultats_elu.get("Asc_m2", 0.0),
+        )
+    else:
+        resultats_elu = CalculBAEL.calcul_elu(
+            Mu_MNm=donnees_norm["Mu_MNm"],
+            b_m=donnees_norm["b_m"],
+            d_m=donnees_norm["d_m"],
+            dp_m=donnees_norm["dp_m"],
+            fc28_MPa=donnees_norm["fc28_MPa"],
+            acier_type=donnees_norm["acier_type"],
+        )
+        resultats_els = CalculBAEL.verification_els(
+            Ms_MNm=donnees_norm["Ms_MNm"],
+            b_m=donnees_norm["b_m"],
+            d_m=donnees_norm["d_m"],
+            dp_m=donnees_norm["dp_m"],
+            fc28_MPa=donnees_norm["fc28_MPa"],
+            acier_type=donnees_norm["acier_type"],
+            fissuration=donnees_norm["fissuration"],
+            acier_ha=donnees_norm["acier_ha"],
+            Ast_m2=resultats_elu["Ast_m2"],
+            Asc_m2=resultats_elu.get("Asc_m2", 0.0),
+        )
+
+    return donnees_norm, resultats_elu, resultats_els
+
+
 # =======================================================
 # PAGE ACCUEIL
 # =======================================================
@@ -193,15 +274,16 @@ def page_accueil():
             '<h3 style="text-align: center; color: #1a365d; margin-bottom: 1.5rem;">Section en T</h3>',
             unsafe_allow_html=True,
         )
-        st.info("🧱 Module en développement (section en T)")
+        if st.button("🚀 Démarrer le calcul", type="primary", use_container_width=True, key="demarrer_te"):
+            st.session_state.page = "saisie_te"
+            st.rerun()
         st.markdown("</div>", unsafe_allow_html=True)
 
     with st.expander("À propos de l'application"):
         st.markdown(
             """
 - Dimensionnement des poutres en BA selon la norme de BAEL 91 
-- La version prochaine appartient Dimensionnement du poutre section en Té 
-  InchaALLAH
+- Sections rectangulaires et sections en Té (table de compression)
 """
         )
 
@@ -211,14 +293,14 @@ def page_accueil():
 # =======================================================
 # PAGE SAISIE
 # =======================================================
-def page_saisie_rectangulaire():
+def page_saisie_rectangulaire(te=False):
     col_title, col_back = st.columns([4, 1])
     with col_title:
         st.markdown(
             '<h2 class="main-title">Saisie des données</h2>', unsafe_allow_html=True
         )
         st.markdown(
-            "<p class='page-subtitle'>Section rectangulaire – BAEL 91</p>",
+            f"<p class='page-subtitle'>{'Section en Té' if te else 'Section rectangulaire'} – BAEL 91</p>",
             unsafe_allow_html=True,
         )
     with col_back:
@@ -235,6 +317,9 @@ def page_saisie_rectangulaire():
 
     # valeurs par défaut
     b_default, h_default, d_default, dp_default = 0.25, 0.50, 0.45, 0.04
+    b0_default, h0_default = 0.25, 0.08
+    if te:
+        b_default = 0.50
     Mu_default, Ms_default, fc28_default = 0.320, 0.177, 25.0
 
     calculer = False
@@ -245,7 +330,7 @@ def page_saisie_rectangulaire():
         col1, col2 = st.columns([4, 1])
         with col1:
             b = st.number_input(
-                "Largeur b",
+                "Largeur de la table b" if te else "Largeur b",
                 min_value=0.01,
                 value=b_default,
                 format="%.3f",
@@ -254,6 +339,32 @@ def page_saisie_rectangulaire():
         with col2:
             b_unite = st.selectbox(" ", ["m", "cm"], index=0, key="b_unit")
 
+        b0, b0_unite, h0, h0_unite = None, "m", None, "m"
+        if te:
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                b0 = st.number_input(
+                    "Largeur de l'âme b0",
+                    min_value=0.01,
+                    value=b0_default,
+                    format="%.3f",
+                    key="b0_input",
+                )
+            with col2:
+                b0_unite = st.selectbox(" ", ["m", "cm"], index=0, key="b0_unit")
+
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                h0 = st.number_input(
+                    "Épaisseur de la table h0",
+                    min_value=0.01,
+                    value=h0_default,
+                    format="%.3f",
+                    key="h0_input",
+                )
+            with col2:
+                h0_unite = st.selectbox(" ", ["m", "cm"], index=0, key="h0_unit")
+
         col1, col2 = st.columns([4, 1])
         with col1:
             h = st.number_input(
@@ -362,6 +473,18 @@ def page_saisie_rectangulaire():
             afficher_footer()
             return
 
+        if te:
+            b0_m = b0 / 100 if b0_unite == "cm" else b0
+            h0_m = h0 / 100 if h0_unite == "cm" else h0
+            if b0_m > b_m:
+                st.error(f"❌ ERREUR : b0 ({b0_m:.2f} m) > b ({b_m:.2f} m) – corriger b et b0.")
+                afficher_footer()
+                return
+            if h0_m >= d_m:
+                st.error(f"❌ ERREUR : h0 ({h0_m:.2f} m) ≥ d ({d_m:.2f} m) – corriger h0 et d.")
+                afficher_footer()
+                return
+
         # Conversion kN.m -> MN.m si nécessaire
         Mu_MNm = Mu / 1000 if Mu_unite == "kN.m" else Mu
         Ms_MNm = Ms / 1000 if Ms_unite == "kN.m" else Ms
@@ -383,7 +506,11 @@ def page_saisie_rectangulaire():
             "acier": 500 if "500" in acier else 400,
             "fissuration": fissuration,
             "acier_ha": acier_ha,
+            "section": "te" if te else "rectangulaire",
         }
+        if te:
+            data["b0"] = round(b0_m, 3)
+            data["h0"] = round(h0_m, 3)
 
         erreurs = verifier_valeurs_positives(data)
         if erreurs:
@@ -391,32 +518,14 @@ def page_saisie_rectangulaire():
                 st.error(err)
         else:
             try:
-                donnees_norm = CalculBAEL.normaliser_donnees(data)
-                resultats_elu = CalculBAEL.calcul_elu(
-                    Mu_MNm=donnees_norm["Mu_MNm"],
-                    b_m=donnees_norm["b_m"],
-                    d_m=donnees_norm["d_m"],
-                    dp_m=donnees_norm["dp_m"],
-                    fc28_MPa=donnees_norm["fc28_MPa"],
-                    acier_type=donnees_norm["acier_type"],
-                )
-                resultats_els = CalculBAEL.verification_els(
-                    Ms_MNm=donnees_norm["Ms_MNm"],
-                    b_m=donnees_norm["b_m"],
-                    d_m=donnees_norm["d_m"],
-                    dp_m=donnees_norm["dp_m"],
-                    fc28_MPa=donnees_norm["fc28_MPa"],
-                    acier_type=donnees_norm["acier_type"],
-                    fissuration=donnees_norm["fissuration"],
-                    acier_ha=donnees_norm["acier_ha"],
-                    Ast_m2=resultats_elu["Ast_m2"],
-                    Asc_m2=resultats_elu.get("Asc_m2", 0.0),
-                )
+                donnees_norm, resultats_elu, resultats_els = calculer_resultats(data)
 
                 st.session_state.donnees_saisie = data
                 st.session_state.donnees_norm = donnees_norm
                 st.session_state.resultats_elu = resultats_elu
                 st.session_state.resultats_els = resultats_els
+                if st.session_state.projet is not None:
+                    st.session_state.projet.ajouter_variante(data, resultats_elu, resultats_els)
                 st.session_state.page = "resultats"
                 st.rerun()
             except Exception:
@@ -436,6 +545,53 @@ def page_saisie_rectangulaire():
 # =======================================================
 # PAGE RÉSULTATS (identique - sans majoration)
 # =======================================================
+@st.cache_data(max_entries=64, show_spinner=False)
+def panneau_resultats(data, elu, els):
+    """Panneau HTML des résultats (mis en cache par jeu de résultats)"""
+    ferraillage = []
+    if FERRAILLAGE_DISPONIBLE:
+        for label, aire_m2 in (("Aₛₜ", elu.get("Ast_m2", 0.0)),
+                               ("Aₛ꜀", elu.get("Asc_m2", 0.0))):
+            if aire_m2 <= 0:
+                continue
+            try:
+                choix = index_defaut().selectionner(aire_m2, data.get("b0", data["b"]), data["dp"])
+                ferraillage.append((label, f"{choix['designation']} "
+                                           f"({choix['As_cm2']:.2f} cm², {choix['nb_lits']} lit(s))"))
+            except ValueError:
+                ferraillage.append((label, "aucune disposition possible"))
+
+    controles = None
+    if REGLES_DISPONIBLES:
+        colonnes = {
+            "Mu_MNm": data["Mu"], "Ms_MNm": data["Ms"], "b_m": data["b"], "h_m": data["h"],
+            "d_m": data["d"], "dp_m": data["dp"], "fc28_MPa": data["fc28"],
+            "acier_type": data["acier"], "fissuration": data["fissuration"],
+            "acier_ha": data["acier_ha"], "b0_m": data.get("b0", float("nan")),
+            "h0_m": data.get("h0", float("nan")), "valide": True,
+            "Ast_m2": elu.get("Ast_m2", 0.0), "Asc_m2": elu.get("Asc_m2", 0.0),
+            "sigma_b_MPa": els.get("sigma_b_MPa", 0.0), "sigma_s_MPa": els.get("sigma_s_MPa", 0.0),
+            "sigma_b_adm_MPa": els.get("sigma_b_adm_MPa", 0.0),
+            "sigma_s_adm_MPa": els.get("sigma_s_adm_MPa", 0.0),
+        }
+        if FERRAILLAGE_DISPONIBLE:
+            barres = index_defaut().selectionner_lot(
+                elu.get("Ast_m2", 0.0), data.get("b0", data["b"]), data["dp"]
+            )
+            colonnes["disposition_trouvee"] = barres["trouve"]
+            if barres["trouve"][0]:
+                for c in ("n1", "phi1_mm", "n2", "phi2_mm", "nb_lits"):
+                    colonnes[c] = barres[c]
+        controle = REGLES_BAEL.evaluer(colonnes)
+        controles = [
+            (not viole, REGLES_BAEL.description(code))
+            for code, viole in zip(controle["codes"], controle["violations"][0])
+            if code not in controle["non_evaluees"]
+        ]
+
+    return rendre_panneau(data, elu, els, ferraillage, controles)
+
+
 def page_resultats():
     if not st.session_state.resultats_elu:
         st.warning("❌ Aucun résultat disponible")
@@ -445,13 +601,16 @@ def page_resultats():
         afficher_footer()
         return
 
+    te = st.session_state.donnees_saisie.get("section") == "te"
+    page_saisie = "saisie_te" if te else "saisie_rectangulaire"
+
     col_title, col_back = st.columns([4, 1])
     with col_title:
         st.markdown(
             '<h2 class="main-title">Résultats BAEL</h2>', unsafe_allow_html=True
         )
         st.markdown(
-            "<p class='page-subtitle'>Section rectangulaire – ELU & ELS</p>",
+            f"<p class='page-subtitle'>{'Section en Té' if te else 'Section rectangulaire'} – ELU & ELS</p>",
             unsafe_allow_html=True,
         )
     with col_back:
@@ -463,157 +622,60 @@ def page_resultats():
     els = st.session_state.resultats_els
     data = st.session_state.donnees_saisie
 
-    st.markdown('<div class="section-card">', unsafe_allow_html=True)
-
-    st.markdown('<hr style="margin: 2rem 0;">', unsafe_allow_html=True)
-
-    # Données de saisie
-    with st.expander("📋 Données de saisie", expanded=False):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("h", f"{data['h']*100:.1f} cm")
-            st.metric("d", f"{data['d']*100:.1f} cm")
-        with col2:
-            st.metric("d'", f"{data['dp']*100:.1f} cm")
-            st.metric("b", f"{data['b']*100:.1f} cm")
-        with col3:
-            st.metric("Mu", f"{data['Mu']:.3f} MN.m")
-            st.metric("Ms", f"{data['Ms']:.3f} MN.m")
-            st.metric("fc28", f"{data['fc28']:.0f} MPa")
-
-    # === ELU ===
-    with st.expander("🔥 ELU – État limite ultime", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown('<div class="results-metric">', unsafe_allow_html=True)
-            st.markdown(
-                '<h4 style="margin: 0 0 0.5rem 0; color: #1a365d;">µ réduit</h4>',
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f'<h2 style="margin: 0; font-size: 2rem;">{elu.get("mu", 0):.3f}</h2>',
-                unsafe_allow_html=True,
-            )
-            st.markdown("</div>", unsafe_allow_html=True)
-
-        with col2:
-            st.markdown('<div class="results-metric">', unsafe_allow_html=True)
-            st.markdown(
-                '<h4 style="margin: 0 0 0.5rem 0; color: #1a365d;">Pivot</h4>',
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f'<h2 style="margin: 0; font-size: 2rem;">{elu.get("pivot", "-")}</h2>',
-                unsafe_allow_html=True,
-            )
-            st.markdown("</div>", unsafe_allow_html=True)
-
-        with col3:
-            Asc_cm2 = round(elu.get("Asc_cm2", 0.0), 2)
-            type_armature = "Armatures doubles 🔩" if Asc_cm2 > 0 else "Armatures simples 🔩"
-            st.markdown(
-                '<div class="results-metric">'
-                '<h4 style="margin: 0 0 0.5rem 0; color: #1a365d;">Type d\'armature</h4>'
-                f'<h2 style="margin: 0; font-size: 1.5rem;">{type_armature}</h2>'
-                "</div>",
-                unsafe_allow_html=True,
-            )
-
-        st.markdown('<hr style="margin: 1.5rem 0;">', unsafe_allow_html=True)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"**Aₛₜ :** {elu.get('Ast_cm2', 0.0):.2f} cm²")
-            if Asc_cm2 > 0:
-                st.markdown(f"**Aₛ꜀ :** {Asc_cm2:.2f} cm²")
-        with col2:
-            st.markdown(f"**α :** {elu.get('alpha', 0.0):.3f}")
-            st.markdown(f"**z :** {elu.get('z_cm', 0.0):.2f} cm")
-            eps_sc = elu.get("eps_sc_pour_mille", 0.0)
-            st.markdown(f"**ε<sub>sc</sub> :** {eps_sc:.3f} ‰", unsafe_allow_html=True)
-
-        if elu.get("type") == "doubles":
-            st.markdown("---")
-            st.markdown(
-                f"**M<sub>R</sub> :** {elu.get('MR_MNm', 0.0):.3f} MN.m",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"**M<sub>r</sub> :** {elu.get('Mr_MNm', 0.0):.3f} MN.m",
-                unsafe_allow_html=True,
-            )
-
-    # === ELS ===
-    with st.expander("✅ ELS – Vérification en service", expanded=True):
-        st.markdown("**📐 Calculs ELS selon BAEL :**")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"**🧭 Axe neutre Y₁ :** {els.get('Y1_cm', 0.0):.2f} cm")
-            st.markdown(
-                f"**📏 Inertie I₉₉' :** {els.get('I_cm4', 0.0):.2f} cm⁴"
-            )
-            Ms_MNm = data["Ms"]
-            I_m4 = els.get("I_m4", 0.0)
-            k_val = Ms_MNm / I_m4 if I_m4 > 0 else 0.0
-            st.markdown(f"**📈 Pente k = Ms/I₉₉' :** {k_val:.4f} MN/m³")
-
-        with col2:
-            st.markdown(f"**🧱 σb calculée :** {els.get('sigma_b_MPa', 0.0):.2f} MPa")
-            st.markdown(
-                f"**🧱 σb admissible :** {els.get('sigma_b_adm_MPa', 0.0):.2f} MPa"
-            )
-            st.markdown(f"**🔩 σs calculée :** {els.get('sigma_s_MPa', 0.0):.2f} MPa")
-            st.markdown(
-                f"**🔩 σs admissible :** {els.get('sigma_s_adm_MPa', 0.0):.2f} MPa"
-            )
-
-        st.markdown("---")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            beton_ok = els.get("verif_beton", "NON") == "OK"
-            acier_ok = els.get("verif_acier", "NON") == "OK"
-            st.markdown("### 🧮 Vérifications")
-            st.markdown(
-                f"**🧱 σb ≤ σb,adm :** {'✅ OUI' if beton_ok else '❌ NON'}"
-            )
-            st.markdown(
-                f"**🔩 σs ≤ σs,adm :** {'✅ OUI' if acier_ok else '❌ NON'}"
-            )
-
-        with col2:
-            cas_num = els.get("cas", 1)
-            if cas_num == 1:
-                titre = "🏗️ Cas 1 ELU"
-            elif cas_num == 2:
-                titre = "🏗️ Cas 2 ELS armatures simples"
-            else:
-                titre = "🏗️ Cas 3 ELS armatures doubles"
-
-            st.markdown(
-                f"""
-                <div style="background:#fff3cd; border:3px solid #ffc107; border-radius:12px;
-                            padding:1.8rem; text-align:center; font-weight:800;
-                            font-size:1.2rem; color:#22543d;">
-                    {titre}
-                </div>
-                """,
-                unsafe_allow_html=True,
+    # === DONNÉES, ELU, ELS, CONFORMITÉ : un seul élément HTML ===
+    if RENDU_DISPONIBLE:
+        st.markdown(panneau_resultats(data, elu, els), unsafe_allow_html=True)
+    else:
+        # Sans module de rendu : grandeurs ELU / ELS dans l'ordre d'affichage du calcul
+        for titre, resultats in (("🔥 ELU – État limite ultime", elu), ("✅ ELS – Vérification en service", els)):
+            st.markdown(f"### {titre}")
+            for ligne in resultats.get("display_order", []):
+                st.markdown(f"{ligne['label']} : **{ligne['value']}** {ligne['unit']}", unsafe_allow_html=True)
+
+    # === HISTORIQUE ===
+    projet = st.session_state.projet
+    if projet is not None and len(projet) > 0:
+        with st.expander(f"🗂️ Historique des variantes ({len(projet)})", expanded=False):
+            noms = projet.noms()
+            choix = st.multiselect(
+                "Variantes à comparer", noms, default=noms[-4:], key="variantes_comparees"
             )
+            if choix:
+                st.dataframe(
+                    projet.comparer([noms.index(n) for n in choix]),
+                    use_container_width=True,
+                )
 
-    st.markdown("</div>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+            with col1:
+                nom_variante = st.selectbox("Variante", noms, index=len(noms) - 1, key="variante_affichee")
+                if st.button("📂 Afficher cette variante", use_container_width=True):
+                    data = projet.donnees_saisie(noms.index(nom_variante))
+                    donnees_norm, resultats_elu, resultats_els = calculer_resultats(data)
+                    st.session_state.donnees_saisie = data
+                    st.session_state.donnees_norm = donnees_norm
+                    st.session_state.resultats_elu = resultats_elu
+                    st.session_state.resultats_els = resultats_els
+                    st.rerun()
+            with col2:
+                st.download_button(
+                    "💾 Enregistrer le projet",
+                    data=projet.vers_octets(),
+                    file_name="projet_bael.npz",
+                    mime="application/octet-stream",
+                    use_container_width=True,
+                )
 
     col1, col2, col3 = st.columns(3)
     with col1:
         if st.button("🔄 Nouveau calcul", use_container_width=True):
             for key in ["resultats_elu", "resultats_els", "donnees_saisie", "donnees_norm"]:
                 st.session_state[key] = {} if key == "donnees_saisie" else None
-            st.session_state.page = "saisie_rectangulaire"
+            st.session_state.page = page_saisie
             st.rerun()
     with col2:
         if st.button("📝 Modifier la saisie", use_container_width=True):
-            st.session_state.page = "saisie_rectangulaire"
+            st.session_state.page = page_saisie
             st.rerun()
     with col3:
         if st.button("🏠 Accueil", use_container_width=True):
@@ -638,6 +700,30 @@ def main():
         st.session_state.page = "resultats"
         st.rerun()
 
+    if PROJET_DISPONIBLE:
+        fichier = st.sidebar.file_uploader("📂 Ouvrir un projet", type=["npz"])
+        if fichier is not None and st.session_state.get("projet_ouvert") != fichier.file_id:
+            st.session_state.projet_ouvert = fichier.file_id
+            try:
+                projet = ProjetBAEL.depuis_octets(fichier.getvalue())
+            except Exception:
+                st.sidebar.error("❌ Fichier projet illisible")
+            else:
+                st.session_state.projet = projet
+                if len(projet) > 0:
+                    data = projet.donnees_saisie(len(projet) - 1)
+                    try:
+                        donnees_norm, resultats_elu, resultats_els = calculer_resultats(data)
+                    except Exception:
+                        st.sidebar.error("❌ Dernière variante du projet non calculable")
+                    else:
+                        st.session_state.donnees_saisie = data
+                        st.session_state.donnees_norm = donnees_norm
+                        st.session_state.resultats_elu = resultats_elu
+                        st.session_state.resultats_els = resultats_els
+                        st.session_state.page = "resultats"
+                        st.rerun()
+
     st.sidebar.markdown("---")
     st.sidebar.markdown("**RAHANI Soulaimane**")
     st.sidebar.markdown("**Futur Ingénieur d'État BTP**")
@@ -647,6 +733,8 @@ def main():
         page_accueil()
     elif st.session_state.page == "saisie_rectangulaire":
         page_saisie_rectangulaire()
+    elif st.session_state.page == "saisie_te":
+        page_saisie_rectangulaire(te=True)
     elif st.session_state.page == "resultats":
         page_resultats()
 
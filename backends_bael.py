@@ -0,0 +1,313 @@
+# =======================================================
+# BACKENDS DE CALCUL DES NOYAUX BAEL - RAHANI Soulaimane
+# =======================================================
+#
+# Les formules ELU / ELS sont écrites une seule fois, dans
+# calculs_bael.definir_noyaux. Un lot peut être calculé par trois backends,
+# tous construits sur cette définition :
+# - 'scalaire' : boucle Python sur les noyaux scalaires (référence) ;
+# - 'numpy'    : mêmes noyaux évalués sur des tableaux (si = np.where),
+#                via CalculBAEL.calcul_elu_lot / verification_els_lot ;
+# - 'jit'      : noyaux compilés par numba, si installé ; sinon repli sur 'numpy'.
+#
+# Le backend se choisit à l'appel (backend=...) ou globalement
+# (choisir_backend, variable d'environnement BAEL_BACKEND) ; tous les calculs
+# par lots des autres modules passent par ce module.
+# verifier_backends() contrôle que tous les backends concordent.
+
+import os
+import warnings
+
+import numpy as np
+
+from calculs_bael import (
+    CAS_INVALIDE, CalculBAEL, SORTIES_ELU, SORTIES_ELS, _racine, _si, definir_noyaux, noyau_elu,
+    noyau_els,
+)
+
+try:
+    import numba
+    JIT_DISPONIBLE = True
+except ImportError:
+    numba = None
+    JIT_DISPONIBLE = False
+
+BACKENDS = ('scalaire', 'numpy', 'jit')
+
+_backend_global = 'numpy'
+_boucles_jit = None
+
+
+# ============================================
+# 1. CHOIX DU BACKEND
+# ============================================
+
+def choisir_backend(nom):
+    """Backend utilisé par défaut par tous les appels ; retourne le précédent"""
+    global _backend_global
+    if nom not in BACKENDS:
+        raise ValueError(f"Backend inconnu: {nom} (choix: {', '.join(BACKENDS)})")
+    precedent, _backend_global = _backend_global, nom
+    return precedent
+
+
+def backend_effectif(backend=None):
+    """Backend réellement utilisé pour backend (None → global) après repli éventuel"""
+    nom = _backend_global if backend is None else backend
+    if nom not in BACKENDS:
+        raise ValueError(f"Backend inconnu: {nom} (choix: {', '.join(BACKENDS)})")
+    if nom == 'jit' and _compiler_jit() is None:
+        return 'numpy'
+    return nom
+
+
+def _backend_environnement():
+    """Backend de la variable BAEL_BACKEND ; repli sur numpy (avertissement) si inconnu"""
+    nom = os.environ.get('BAEL_BACKEND', 'numpy')
+    if nom not in BACKENDS:
+        warnings.warn(f"BAEL_BACKEND inconnu: {nom} (choix: {', '.join(BACKENDS)}) : repli sur numpy")
+        return 'numpy'
+    return nom
+
+
+choisir_backend(_backend_environnement())
+
+
+# ============================================
+# 2. BOUCLES SUR LES NOYAUX
+# ============================================
+
+def _boucles(elu, els):
+    """Boucles sur les lignes d'un lot (entrées et sorties en colonnes) autour des noyaux"""
+    def boucle_elu(n, e, sorties):
+        for i in range(n):
+            r = elu(e[0][i], e[1][i], e[2][i], e[3][i], e[4][i], e[5][i],
+                    e[6][i], e[7][i], e[8][i], e[9][i], e[10][i], e[11][i])
+            for j in range(len(r)):
+                sorties[j, i] = r[j]
+
+    def boucle_els(n, e, sorties):
+        for i in range(n):
+            r = els(e[0][i], e[1][i], e[2][i], e[3][i], e[4][i], e[5][i],
+                    e[6][i], e[7][i], e[8][i], e[9][i])
+            for j in range(len(r)):
+                sorties[j, i] = r[j]
+
+    return boucle_elu, boucle_els
+
+
+_boucles_scalaires = _boucles(noyau_elu, noyau_els)
+
+
+def _compiler_jit():
+    """Boucles compilées par numba (compilation au premier appel) ; None si indisponible"""
+    global _boucles_jit, JIT_DISPONIBLE
+    if not JIT_DISPONIBLE:
+        return None
+    if _boucles_jit is None:
+        try:
+            elu, els = definir_noyaux(numba.njit(_si), numba.njit(_racine))
+            boucles = _boucles(numba.njit(elu), numba.njit(els))
+            boucles = tuple(numba.njit(f) for f in boucles)
+            # Compilation immédiate sur une poutre type : un échec bascule sur NumPy
+            elu = np.array([[0.3], [0.3], [0.3], [0.0], [0.5], [0.05], [25.0], [400.0],
+                            [0.391], [0.669], [1.74], [0.185]])
+            els = np.array([[0.07], [0.3], [0.3], [0.0], [0.5], [0.05], [5e-4], [0.0], [15.0], [200.0]])
+            boucles[0](1, elu, np.empty((len(SORTIES_ELU), 1)))
+            boucles[1](1, els, np.empty((len(SORTIES_ELS), 1)))
+        except Exception as erreur:
+            warnings.warn(f"Backend jit indisponible ({erreur}) : repli sur numpy")
+            JIT_DISPONIBLE = False
+            return None
+        _boucles_jit = boucles
+    return _boucles_jit
+
+
+def _executer(boucle, entrees, nb_sorties, jit):
+    n = entrees.shape[1]
+    sorties = np.empty((nb_sorties, n))
+    if jit:
+        boucle(n, np.ascontiguousarray(entrees), sorties)
+    else:
+        # Flottants Python : mêmes opérations et mêmes erreurs que calcul_elu / verification_els
+        boucle(n, entrees.tolist(), sorties)
+    return sorties
+
+
+# ============================================
+# 3. CALCUL PAR LOTS
+# ============================================
+
+def calcul_elu_lot(Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, b0_m=None, h0_m=None,
+                   refus_mu_1=True, backend=None):
+    """
+    Calcul ELU d'un lot avec le backend choisi (cf. CalculBAEL.calcul_elu_lot)
+
+    Mêmes entrées et mêmes clés de résultat quel que soit le backend
+    """
+    nom = backend_effectif(backend)
+    if nom == 'numpy':
+        return CalculBAEL.calcul_elu_lot(
+            Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, b0_m, h0_m, refus_mu_1
+        )
+
+    Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(x, dtype=float))
+          for x in (Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type)]
+    )
+    b0_m, h0_m = CalculBAEL._section_te_lot(b_m, b0_m, h0_m)
+    p = CalculBAEL._parametres_acier_lot(acier_type)
+    if not refus_mu_1:
+        p['mu_1'] = np.full_like(p['mu_1'], -np.inf)
+    entrees = np.stack([
+        Mu_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, p['fe_MPa'],
+        p['muR'], p['alphaR'], p['eps_els_pour_mille'], p['mu_1'],
+    ]).reshape(12, -1)
+
+    boucles = _compiler_jit() if nom == 'jit' else _boucles_scalaires
+    sorties = _executer(boucles[0], entrees, len(SORTIES_ELU), nom == 'jit')
+    return CalculBAEL._resultat_elu_lot([v.reshape(b_m.shape) for v in sorties], b_m.shape)
+
+
+def verification_els_lot(Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+                         Ast_m2, Asc_m2, b0_m=None, h0_m=None, backend=None):
+    """
+    Vérification ELS d'un lot avec le backend choisi (cf. CalculBAEL.verification_els_lot)
+
+    Mêmes entrées et mêmes clés de résultat quel que soit le backend
+    """
+    nom = backend_effectif(backend)
+    if nom == 'numpy':
+        return CalculBAEL.verification_els_lot(
+            Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+            Ast_m2, Asc_m2, b0_m, h0_m,
+        )
+
+    Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2 = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(x, dtype=float))
+          for x in (Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2)]
+    )
+    b0_m, h0_m = CalculBAEL._section_te_lot(b_m, b0_m, h0_m)
+    sigma_b_adm_MPa, sigma_s_adm_MPa = CalculBAEL.calcul_contraintes_admissibles_lot(
+        fc28_MPa, acier_type,
+        np.broadcast_to(np.asarray(fissuration), b_m.shape),
+        np.broadcast_to(np.asarray(acier_ha), b_m.shape),
+    )
+    entrees = np.stack([
+        Ms_MNm, b_m, b0_m, h0_m, d_m, dp_m, Ast_m2, Asc_m2, sigma_b_adm_MPa, sigma_s_adm_MPa,
+    ]).reshape(10, -1)
+
+    boucles = _compiler_jit() if nom == 'jit' else _boucles_scalaires
+    sorties = _executer(boucles[1], entrees, len(SORTIES_ELS), nom == 'jit')
+    return CalculBAEL._resultat_els_lot(
+        [v.reshape(b_m.shape) for v in sorties], b_m.shape, sigma_b_adm_MPa, sigma_s_adm_MPa
+    )
+
+
+def calcul_elu_els_lot(Mu_MNm, Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration,
+                      acier_ha, b0_m=None, h0_m=None, backend=None):
+    """
+    ELU puis ELS d'un lot avec le backend choisi
+
+    L'ELS est vérifié avec les armatures de l'ELU (nulles pour une section
+    refusée) ; cas = CAS_INVALIDE pour les sections refusées à l'ELU.
+    Retourne (elu, els)
+    """
+    elu = calcul_elu_lot(Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, b0_m, h0_m, backend=backend)
+    els = verification_els_lot(
+        Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+        np.nan_to_num(elu['Ast_m2']), np.nan_to_num(elu['Asc_m2']), b0_m, h0_m, backend=backend,
+    )
+    els['cas'] = np.where(elu['valide'], els['cas'], CAS_INVALIDE)
+    return elu, els
+
+
+# ============================================
+# 4. AUTO-CONTRÔLE
+# ============================================
+
+def _lot_controle(n, graine):
+    """Lot aléatoire: sections rectangulaires et en Té, pivots A / B, armatures simples et doubles"""
+    rng = np.random.default_rng(graine)
+    b_m = rng.uniform(0.15, 0.60, n)
+    d_m = rng.uniform(0.25, 0.90, n)
+    fc28_MPa = rng.choice([20.0, 25.0, 30.0, 35.0], n)
+    te = rng.random(n) < 0.5
+    b_table_m = np.where(te, b_m * rng.uniform(1.5, 4.0, n), b_m)
+    mu_cible = rng.uniform(0.05, 0.60, n)
+    Mu_MNm = mu_cible * b_table_m * d_m**2 * 0.85 * fc28_MPa / 1.5
+    return {
+        'Mu_MNm': Mu_MNm,
+        'Ms_MNm': Mu_MNm / rng.uniform(1.30, 1.50, n),
+        'b_m': b_table_m,
+        'b0_m': np.where(te, b_m, np.nan),
+        'h0_m': np.where(te, rng.uniform(0.06, 0.20, n), np.nan),
+        'd_m': d_m,
+        'dp_m': rng.uniform(0.02, 0.06, n),
+        'fc28_MPa': fc28_MPa,
+        'acier_type': rng.choice([400, 500], n),
+        'fissuration': rng.choice(['FPP', 'FP', 'FTP'], n),
+        'acier_ha': rng.choice(['HA', 'RL'], n),
+    }
+
+
+def _ecart_relatif(a, b, masque):
+    a, b = np.asarray(a, dtype=float)[masque], np.asarray(b, dtype=float)[masque]
+    if a.size == 0:
+        return 0.0
+    meme_nan = np.isnan(a) & np.isnan(b)
+    with np.errstate(invalid='ignore'):
+        ecart = np.abs(a - b) / np.maximum(np.abs(a), 1e-12)
+    return float(np.where(meme_nan, 0.0, np.nan_to_num(ecart, nan=np.inf)).max())
+
+
+def verifier_backends(n=2000, rtol=1e-9, graine=0):
+    """
+    Auto-contrôle: ELU puis ELS d'un lot aléatoire par chaque backend disponible,
+    comparés au backend scalaire de référence
+
+    Retourne un dict: backends comparés, écart relatif maximal par backend
+    (inf si une grandeur discrète diffère) et conforme (tous ≤ rtol)
+    """
+    lot = _lot_controle(n, graine)
+    section = (lot['b_m'], lot['d_m'], lot['dp_m'], lot['fc28_MPa'], lot['acier_type'])
+    te = {'b0_m': lot['b0_m'], 'h0_m': lot['h0_m']}
+
+    elu_ref = calcul_elu_lot(lot['Mu_MNm'], *section, backend='scalaire', **te)
+    valide = elu_ref['valide']
+    # Mêmes armatures (celles de la référence) pour tous les backends : ELS isolé
+    armatures = (np.nan_to_num(elu_ref['Ast_m2']), np.nan_to_num(elu_ref['Asc_m2']))
+
+    def calculer(backend):
+        elu = calcul_elu_lot(lot['Mu_MNm'], *section, backend=backend, **te)
+        els = verification_els_lot(
+            lot['Ms_MNm'], *section, lot['fissuration'], lot['acier_ha'], *armatures,
+            backend=backend, **te,
+        )
+        return elu, els
+
+    els_ref = calculer('scalaire')[1]
+
+    backends = ['numpy'] + (['jit'] if backend_effectif('jit') == 'jit' else [])
+    ecarts = {}
+    for nom in backends:
+        elu, els = calculer(nom)
+        discrets = (
+            all(np.array_equal(elu[c], elu_ref[c]) for c in ('valide', 'doubles', 'pivot'))
+            and np.array_equal(elu['table'][valide], elu_ref['table'][valide])
+            and all(np.array_equal(els[c][valide], els_ref[c][valide])
+                    for c in ('table', 'cas', 'verif_beton', 'verif_acier'))
+        )
+        if not discrets:
+            ecarts[nom] = float('inf')
+            continue
+        ecarts[nom] = max(
+            [_ecart_relatif(elu_ref[c], elu[c], valide) for c in SORTIES_ELU if c not in ('code', 'table')]
+            + [_ecart_relatif(els_ref[c], els[c], valide) for c in SORTIES_ELS if c not in ('cas', 'table')]
+        )
+
+    return {
+        'backends': backends,
+        'ecarts': ecarts,
+        'conforme': all(e <= rtol for e in ecarts.values()),
+    }
@@ -4,6 +4,252 @@
 
 import math
 
+import numpy as np
+
+# Paramètres de calcul selon la nuance d'acier (FeE 400 / FeE 500)
+PARAMETRES_ACIER = {
+    400: {'muR': 0.391, 'alphaR': 0.669, 'eps_els_pour_mille': 1.74, 'mu_1': 0.185},
+    500: {'muR': 0.371, 'alphaR': 0.617, 'eps_els_pour_mille': 2.17, 'mu_1': 0.180},
+}
+
+# Frontière pivot A / pivot B
+MU_AB = 0.186
+
+# Module d'élasticité de l'acier (MPa)
+E_ACIER_MPA = 200000
+
+# Coefficient d'équivalence acier/béton
+COEF_EQUIVALENCE = 15
+
+
+# ============================================
+# NOYAUX (formules ELU / ELS)
+# ============================================
+#
+# Définition unique des formules, écrite sans branchement : les choix de
+# l'organigramme passent par si(condition, alors, sinon). Les mêmes noyaux
+# servent aux calculs unitaires (calcul_elu / verification_els : flottants,
+# si = expression conditionnelle), aux calculs par lots (tableaux,
+# si = np.where) et aux backends de backends_bael (numba). Arguments et
+# résultats uniquement flottants ; section rectangulaire pour b0 = b et h0 = 0.
+
+# Codes de retour de noyau_elu
+ELU_INVALIDE = 0.0
+ELU_PIVOT_A = 1.0
+ELU_PIVOT_B = 2.0
+ELU_DOUBLES = 3.0
+
+# Cas ELS enregistré pour une section refusée à l'ELU (cas vérifiés : 1 à 4)
+CAS_INVALIDE = 0
+
+SORTIES_ELU = (
+    'code', 'mu', 'alpha', 'z_m', 'Ast_m2', 'Asc_m2', 'MR_MNm', 'Mr_MNm',
+    'eps_sc_pour_mille', 'sigma_sc_MPa', 'sigma_bc_MPa', 'sigma_st_MPa',
+    'MTu_MNm', 'Mu_ailes_MNm', 'table',
+)
+
+SORTIES_ELS = ('Y1_m', 'I_m4', 'K_MN_m3', 'sigma_b_MPa', 'sigma_s_MPa', 'cas', 'table')
+
+
+def definir_noyaux(si, racine):
+    """
+    Noyaux ELU / ELS pour une sélection si(condition, alors, sinon) et une
+    racine carrée (NaN pour un argument négatif) donnés
+
+    Retourne (noyau_elu, noyau_els)
+    """
+    def noyau_elu(Mu_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, fe_MPa,
+                  muR, alphaR, eps_els_pour_mille, mu_1):
+        """
+        Organigramme ELU d'une section (rectangulaire ou en Té)
+
+        Retourne le tuple SORTIES_ELU ; code ELU_INVALIDE (résultats à NaN) si
+        la section rectangulaire est sous-dimensionnée en pivot A ou la nuance
+        d'acier inconnue
+        """
+        # 1. Contraintes de calcul
+        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
+        sigma_st_MPa = fe_MPa / 1.15
+
+        # 2. Section en Té: table seule ou âme participante
+        MTu_MNm = b_m * h0_m * sigma_bc_MPa * (d_m - h0_m / 2)
+        table = (b0_m == b_m) | (Mu_MNm <= MTu_MNm)
+        Mu_ailes_MNm = si(table, 0.0, (b_m - b0_m) * h0_m * sigma_bc_MPa * (d_m - h0_m / 2))
+        Ast_ailes_m2 = si(table, 0.0, Mu_ailes_MNm / ((d_m - h0_m / 2) * sigma_st_MPa))
+        b_calc_m = si(table, b_m, b0_m)
+        Mu_calc_MNm = Mu_MNm - Mu_ailes_MNm
+
+        # 3. Moment réduit μ
+        mu = Mu_calc_MNm / (b_calc_m * d_m * d_m * sigma_bc_MPa)
+
+        # 4. Section rectangulaire en pivot A avec μ < μ₁ (simplifié) ou acier
+        #    inconnu: section refusée. En Té, table seule ou âme en pivot A avec
+        #    μ < μ₁ restent des armatures simples ordinaires.
+        invalide = (muR != muR) | ((mu < MU_AB) & (mu < mu_1) & (b0_m == b_m))
+        doubles = mu > muR
+
+        # 5. Armatures simples (pivot A, ou pivot B avec μ ≤ μR), sinon α = αR
+        alpha = si(doubles, alphaR, 1.25 * (1 - racine(1 - 2 * mu)))
+        z_m = d_m * (1 - 0.4 * alpha)
+
+        # 6. Armatures doubles: μ = μR
+        MR_MNm = si(doubles, muR * b_calc_m * d_m * d_m * sigma_bc_MPa, 0.0)
+        Mr_MNm = si(doubles, Mu_calc_MNm - MR_MNm, 0.0)
+
+        # εsc = ((d - d')/d) × (εels + 3.5‰) - εels
+        eps_sc_pour_mille = si(
+            doubles, ((d_m - dp_m) / d_m) * (eps_els_pour_mille + 3.5) - eps_els_pour_mille, 0.0
+        )
+        sigma_sc_MPa = si(
+            doubles,
+            si(eps_sc_pour_mille < eps_els_pour_mille, E_ACIER_MPA * (eps_sc_pour_mille / 1000.0),
+               fe_MPa / 1.15),
+            0.0,
+        )
+
+        # Armatures simples: Mr = 0 sur des dénominateurs neutres
+        bras_m = si(doubles, d_m - dp_m, 1.0)
+        Asc_m2 = Mr_MNm / (bras_m * si(doubles, sigma_sc_MPa, 1.0))
+        Ast_m2 = si(
+            doubles,
+            MR_MNm / (z_m * sigma_st_MPa) + Mr_MNm / (bras_m * sigma_st_MPa),
+            Mu_calc_MNm / (z_m * sigma_st_MPa),
+        )
+
+        code = si(invalide, ELU_INVALIDE,
+                  si(doubles, ELU_DOUBLES, si(mu < MU_AB, ELU_PIVOT_A, ELU_PIVOT_B)))
+        # Section refusée: résultats à NaN (x + NaN), inchangés sinon (x + 0)
+        refus = si(invalide, math.nan, 0.0)
+        return (code, mu, alpha + refus, z_m + refus, Ast_m2 + Ast_ailes_m2 + refus,
+                Asc_m2 + refus, MR_MNm + refus, Mr_MNm + refus, eps_sc_pour_mille + refus,
+                sigma_sc_MPa + refus, sigma_bc_MPa, sigma_st_MPa, MTu_MNm, Mu_ailes_MNm,
+                si(table, 1.0, 0.0))
+
+    def noyau_els(Ms_MNm, b_m, b0_m, h0_m, d_m, dp_m, Ast_m2, Asc_m2,
+                  sigma_b_adm_MPa, sigma_s_adm_MPa):
+        """
+        Organigramme ELS d'une section (rectangulaire ou en Té)
+
+        Retourne le tuple SORTIES_ELS ; Y1 à NaN si l'axe neutre n'a pas de
+        solution réelle, K à NaN si Igg' est nul
+        """
+        # 1. Axe neutre dans la table → largeur b partout
+        f_h0 = b_m * h0_m**2 / 2 + 15 * Asc_m2 * (h0_m - dp_m) - 15 * Ast_m2 * (d_m - h0_m)
+        table = (b0_m == b_m) | (f_h0 >= 0)
+        b0_m = si(table, b_m, b0_m)
+
+        # 2. Axe neutre Y1
+        # b0Y1² + 2[(b-b0)h0 + 15(Ast + Asc)]Y1 - [(b-b0)h0² + 30(Asc×d' + Ast×d)] = 0
+        A = b0_m
+        B = 2 * ((b_m - b0_m) * h0_m + 15 * (Ast_m2 + Asc_m2))
+        C = -((b_m - b0_m) * h0_m**2 + 30 * (Asc_m2 * dp_m + Ast_m2 * d_m))
+        delta = B**2 - 4 * A * C
+        Y1_m = (-B + racine(delta)) / (2 * A)
+
+        # 3. Inertie Igg'
+        I_m4 = (b_m * Y1_m**3) / 3 - ((b_m - b0_m) * (Y1_m - h0_m)**3) / 3
+        I_m4 += 15 * Asc_m2 * (dp_m - Y1_m)**2
+        I_m4 += 15 * Ast_m2 * (d_m - Y1_m)**2
+
+        # 4. Pente K et contraintes
+        K_MN_m3 = Ms_MNm / si(I_m4 != 0, I_m4, math.nan)
+        sigma_b_MPa = K_MN_m3 * Y1_m
+        sigma_s_MPa = 15 * K_MN_m3 * (d_m - Y1_m)
+
+        # 5. Vérification et cas
+        verif_beton = sigma_b_MPa <= sigma_b_adm_MPa
+        verif_acier = sigma_s_MPa <= sigma_s_adm_MPa
+        cas = si(verif_beton & verif_acier, 1.0,
+                 si(verif_beton, 2.0, si(verif_acier, 4.0, 3.0)))
+        return (Y1_m, I_m4, K_MN_m3, sigma_b_MPa, sigma_s_MPa, cas, si(table, 1.0, 0.0))
+
+    return noyau_elu, noyau_els
+
+
+def _si(condition, alors, sinon):
+    """Sélection sur des flottants (pendant scalaire de np.where)"""
+    return alors if condition else sinon
+
+
+def _racine(x):
+    """Racine carrée d'un flottant, NaN si négatif (pendant scalaire de np.sqrt)"""
+    return math.sqrt(x) if x >= 0 else math.nan
+
+
+# Noyaux scalaires (calculs unitaires, backend 'scalaire') et noyaux sur
+# tableaux (calculs par lots, backend 'numpy') : une seule définition
+noyau_elu, noyau_els = definir_noyaux(_si, _racine)
+noyau_elu_lot, noyau_els_lot = definir_noyaux(np.where, np.sqrt)
+
+
+# ============================================
+# VALIDATION DES DONNÉES D'UNE POUTRE (JSON)
+# ============================================
+#
+# Contrôle commun au service HTTP (service_bael) et aux notes de calcul
+# (notes_calcul).
+
+CHAMPS_NUMERIQUES = ('Mu_MNm', 'Ms_MNm', 'b_m', 'd_m', 'dp_m', 'fc28_MPa', 'acier_type')
+CHAMPS_TEXTE = ('fissuration', 'acier_ha')
+CHAMPS_TE = ('b0_m', 'h0_m')
+CHAMPS_OPTIONNELS = ('h_m',) + CHAMPS_TE
+FISSURATIONS = ('FPP', 'FP', 'FTP')
+TYPES_BARRES = ('HA', 'RL')
+
+
+def _nombre(valeur, champ):
+    try:
+        nombre = float(valeur)
+    except (TypeError, ValueError):
+        raise ValueError(f"Valeur numérique invalide : {champ}")
+    if not math.isfinite(nombre):
+        raise ValueError(f"Valeur numérique invalide : {champ}")
+    return nombre
+
+
+def valider_poutre(poutre):
+    """
+    Contrôle et conversion d'une poutre JSON (ValueError si invalide)
+
+    h_m, b0_m / h0_m absents ou null : NaN (b0_m / h0_m : section rectangulaire)
+    Dimensions : b, d > 0, 0 ≤ d' < d, d < h ; en Té 0 < b0 ≤ b et 0 < h0 < d
+    """
+    if not isinstance(poutre, dict):
+        raise ValueError("Poutre invalide : objet JSON attendu")
+    for c in CHAMPS_NUMERIQUES + CHAMPS_TEXTE:
+        if c not in poutre:
+            raise ValueError(f"Champ manquant : {c}")
+
+    ligne = {c: _nombre(poutre[c], c) for c in CHAMPS_NUMERIQUES}
+    for c in CHAMPS_OPTIONNELS:
+        ligne[c] = np.nan if poutre.get(c) is None else _nombre(poutre[c], c)
+    for c in CHAMPS_TEXTE:
+        ligne[c] = str(poutre[c])
+
+    if ligne['b_m'] <= 0 or ligne['d_m'] <= 0:
+        raise ValueError("Dimensions invalides : b et d doivent être positifs")
+    if not 0 <= ligne['dp_m'] < ligne['d_m']:
+        raise ValueError("Dimensions invalides : d' doit vérifier 0 ≤ d' < d")
+    if not np.isnan(ligne['h_m']) and not ligne['d_m'] < ligne['h_m']:
+        raise ValueError("Dimensions invalides : h doit vérifier d < h")
+    if not np.isnan(ligne['b0_m']) and not np.isnan(ligne['h0_m']):
+        if not 0 < ligne['b0_m'] <= ligne['b_m']:
+            raise ValueError("Dimensions invalides : b0 doit vérifier 0 < b0 ≤ b")
+        if not 0 < ligne['h0_m'] < ligne['d_m']:
+            raise ValueError("Dimensions invalides : h0 doit vérifier 0 < h0 < d")
+
+    if ligne['acier_type'] not in PARAMETRES_ACIER:
+        raise ValueError(
+            f"Nuance d'acier inconnue : {poutre['acier_type']} "
+            f"(choix : {', '.join(str(n) for n in PARAMETRES_ACIER)})"
+        )
+    if ligne['fissuration'] not in FISSURATIONS:
+        raise ValueError(f"Fissuration inconnue : {ligne['fissuration']} (choix : {', '.join(FISSURATIONS)})")
+    if ligne['acier_ha'] not in TYPES_BARRES:
+        raise ValueError(f"Type de barres inconnu : {ligne['acier_ha']} (choix : {', '.join(TYPES_BARRES)})")
+    return ligne
+
+
 class CalculBAEL:
     """
     Classe principale pour tous les calculs BAEL
@@ -71,47 +317,28 @@ class CalculBAEL:
         - Pour armatures simples: α, z, Ast
         - Pour armatures doubles: MR, Mr, zR, εsc (‰), Ast, Asc
         """
-        # 1. Paramètres acier
-        if acier_type == 400:
-            muR = 0.391
-            alphaR = 0.669
-            eps_els_pour_mille = 1.74  # en ‰
-            fe_MPa = 400
-        elif acier_type == 500:
-            muR = 0.371
-            alphaR = 0.617
-            eps_els_pour_mille = 2.17  # en ‰
-            fe_MPa = 500
-        
-        # 2. Contraintes de calcul
-        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
-        sigma_st_MPa = fe_MPa / 1.15
+        parametres = PARAMETRES_ACIER[acier_type]
+        sorties = noyau_elu(
+            Mu_MNm, b_m, b_m, 0.0, d_m, dp_m, fc28_MPa, acier_type, parametres['muR'],
+            parametres['alphaR'], parametres['eps_els_pour_mille'], parametres['mu_1'],
+        )
+        return CalculBAEL._resultat_elu(dict(zip(SORTIES_ELU, sorties)))
+    
+    @staticmethod
+    def _resultat_elu(r):
+        """Résultats ELU affichables à partir des sorties de noyau_elu"""
+        if r['code'] == ELU_INVALIDE:
+            raise ValueError("Section sous-dimensionnée. Augmentez b ou d.")
         
-        # 3. Moment réduit μ
-        mu = Mu_MNm / (b_m * d_m * d_m * sigma_bc_MPa)
+        mu, alpha, z_m = r['mu'], r['alpha'], r['z_m']
+        Ast_m2, Asc_m2 = r['Ast_m2'], r['Asc_m2']
+        pivot = 'A' if r['code'] == ELU_PIVOT_A else 'B'
         
-        # 4. Détermination pivot
-        mu_AB = 0.186
-        if mu < mu_AB:
-            pivot = "A"
-        else:
-            pivot = "B"
-        
-        # 5. PIVOT A
-        if pivot == "A":
-            # Vérification μ < μ₁ (simplifié)
-            mu_1 = 0.185 if acier_type == 400 else 0.180
-            if mu < mu_1:
-                raise ValueError("Section sous-dimensionnée. Augmentez b ou d.")
-            
-            # Armatures simples pivot A
-            alpha = 1.25 * (1 - math.sqrt(1 - 2 * mu))
-            z_m = d_m * (1 - 0.4 * alpha)
-            Ast_m2 = Mu_MNm / (z_m * sigma_st_MPa)
-            
+        # Armatures simples (pivot A ou B)
+        if r['code'] != ELU_DOUBLES:
             return {
                 'type': 'simples',
-                'pivot': 'A',
+                'pivot': pivot,
                 'mu': round(mu, 4),
                 'alpha': round(alpha, 4),
                 'z_m': z_m,
@@ -120,108 +347,47 @@ class CalculBAEL:
                 'Ast_cm2': round(Ast_m2 * 10000, 2),
                 'Asc_m2': 0.0,
                 'Asc_cm2': 0.0,
-                'sigma_bc_MPa': round(sigma_bc_MPa, 2),
-                'sigma_st_MPa': round(sigma_st_MPa, 2),
+                'sigma_bc_MPa': round(r['sigma_bc_MPa'], 2),
+                'sigma_st_MPa': round(r['sigma_st_MPa'], 2),
                 'display_order': [
                     {'label': 'Moment réduit μ', 'value': round(mu, 4), 'unit': ''},
-                    {'label': 'Pivot', 'value': 'A', 'unit': ''},
+                    {'label': 'Pivot', 'value': pivot, 'unit': ''},
                     {'label': 'α', 'value': round(alpha, 4), 'unit': ''},
                     {'label': 'z', 'value': round(z_m * 100, 2), 'unit': 'cm'},
                     {'label': 'A<sub>st</sub>', 'value': round(Ast_m2 * 10000, 2), 'unit': 'cm²'}
                 ]
             }
         
-        # 6. PIVOT B
-        else:
-            if mu <= muR:
-                # Armatures simples pivot B
-                alpha = 1.25 * (1 - math.sqrt(1 - 2 * mu))
-                z_m = d_m * (1 - 0.4 * alpha)
-                Ast_m2 = Mu_MNm / (z_m * sigma_st_MPa)
-                
-                return {
-                    'type': 'simples',
-                    'pivot': 'B',
-                    'mu': round(mu, 4),
-                    'alpha': round(alpha, 4),
-                    'z_m': z_m,
-                    'z_cm': round(z_m * 100, 2),
-                    'Ast_m2': Ast_m2,
-                    'Ast_cm2': round(Ast_m2 * 10000, 2),
-                    'Asc_m2': 0.0,
-                    'Asc_cm2': 0.0,
-                    'sigma_bc_MPa': round(sigma_bc_MPa, 2),
-                    'sigma_st_MPa': round(sigma_st_MPa, 2),
-                    'display_order': [
-                        {'label': 'Moment réduit μ', 'value': round(mu, 4), 'unit': ''},
-                        {'label': 'Pivot', 'value': 'B', 'unit': ''},
-                        {'label': 'α', 'value': round(alpha, 4), 'unit': ''},
-                        {'label': 'z', 'value': round(z_m * 100, 2), 'unit': 'cm'},
-                        {'label': 'A<sub>st</sub>', 'value': round(Ast_m2 * 10000, 2), 'unit': 'cm²'}
-                    ]
-                }
-            
-            else:
-                # ARMATURES DOUBLES
-                # Fixer μ = μR, α = αR
-                alpha = alphaR
-                z_R = d_m * (1 - 0.4 * alphaR)
-                
-                # Moment résistant MR
-                MR_MNm = muR * b_m * d_m * d_m * sigma_bc_MPa
-                
-                # Moment résiduel Mr
-                Mr_MNm = Mu_MNm - MR_MNm
-                
-                # Calcul εsc en ‰ (CORRECTION IMPORTANTE)
-                # Formula: εsc = ((d - d')/d) × (εels + 3.5‰) - εels
-                eps_sc_pour_mille = ((d_m - dp_m) / d_m) * (eps_els_pour_mille + 3.5) - eps_els_pour_mille
-                
-                # Calcul σsc
-                if eps_sc_pour_mille < eps_els_pour_mille:
-                    # Convertir en décimal pour calcul
-                    eps_sc_decimal = eps_sc_pour_mille / 1000.0
-                    E_MPa = 200000
-                    sigma_sc_MPa = E_MPa * eps_sc_decimal
-                else:
-                    sigma_sc_MPa = fe_MPa / 1.15
-                
-                # Calcul Asc
-                Asc_m2 = Mr_MNm / ((d_m - dp_m) * sigma_sc_MPa)
-                
-                # Calcul Ast
-                Ast_MR = MR_MNm / (z_R * sigma_st_MPa)
-                Ast_Mr = Mr_MNm / ((d_m - dp_m) * sigma_st_MPa)
-                Ast_m2 = Ast_MR + Ast_Mr
-                
-                return {
-                    'type': 'doubles',
-                    'pivot': 'B',
-                    'mu': round(mu, 4),
-                    'alpha': round(alpha, 4),
-                    'z_m': z_R,
-                    'z_cm': round(z_R * 100, 2),
-                    'Ast_m2': Ast_m2,
-                    'Ast_cm2': round(Ast_m2 * 10000, 2),
-                    'Asc_m2': Asc_m2,
-                    'Asc_cm2': round(Asc_m2 * 10000, 2),
-                    'MR_MNm': round(MR_MNm, 6),
-                    'Mr_MNm': round(Mr_MNm, 6),
-                    'eps_sc_pour_mille': round(eps_sc_pour_mille, 2),
-                    'sigma_sc_MPa': round(sigma_sc_MPa, 2),
-                    'sigma_bc_MPa': round(sigma_bc_MPa, 2),
-                    'sigma_st_MPa': round(sigma_st_MPa, 2),
-                    'display_order': [
-                        {'label': 'Moment réduit μ', 'value': round(mu, 4), 'unit': ''},
-                        {'label': 'Pivot', 'value': 'B', 'unit': ''},
-                        {'label': 'M<sub>R</sub>', 'value': round(MR_MNm, 6), 'unit': 'MN.m'},
-                        {'label': 'M<sub>r</sub>', 'value': round(Mr_MNm, 6), 'unit': 'MN.m'},
-                        {'label': 'z<sub>R</sub>', 'value': round(z_R * 100, 2), 'unit': 'cm'},
-                        {'label': 'ε<sub>sc</sub>', 'value': round(eps_sc_pour_mille, 2), 'unit': '‰'},
-                        {'label': 'A<sub>st</sub>', 'value': round(Ast_m2 * 10000, 2), 'unit': 'cm²'},
-                        {'label': 'A<sub>sc</sub>', 'value': round(Asc_m2 * 10000, 2), 'unit': 'cm²'}
-                    ]
-                }
+        # Armatures doubles
+        MR_MNm, Mr_MNm, eps_sc_pour_mille = r['MR_MNm'], r['Mr_MNm'], r['eps_sc_pour_mille']
+        return {
+            'type': 'doubles',
+            'pivot': 'B',
+            'mu': round(mu, 4),
+            'alpha': round(alpha, 4),
+            'z_m': z_m,
+            'z_cm': round(z_m * 100, 2),
+            'Ast_m2': Ast_m2,
+            'Ast_cm2': round(Ast_m2 * 10000, 2),
+            'Asc_m2': Asc_m2,
+            'Asc_cm2': round(Asc_m2 * 10000, 2),
+            'MR_MNm': round(MR_MNm, 6),
+            'Mr_MNm': round(Mr_MNm, 6),
+            'eps_sc_pour_mille': round(eps_sc_pour_mille, 2),
+            'sigma_sc_MPa': round(r['sigma_sc_MPa'], 2),
+            'sigma_bc_MPa': round(r['sigma_bc_MPa'], 2),
+            'sigma_st_MPa': round(r['sigma_st_MPa'], 2),
+            'display_order': [
+                {'label': 'Moment réduit μ', 'value': round(mu, 4), 'unit': ''},
+                {'label': 'Pivot', 'value': 'B', 'unit': ''},
+                {'label': 'M<sub>R</sub>', 'value': round(MR_MNm, 6), 'unit': 'MN.m'},
+                {'label': 'M<sub>r</sub>', 'value': round(Mr_MNm, 6), 'unit': 'MN.m'},
+                {'label': 'z<sub>R</sub>', 'value': round(z_m * 100, 2), 'unit': 'cm'},
+                {'label': 'ε<sub>sc</sub>', 'value': round(eps_sc_pour_mille, 2), 'unit': '‰'},
+                {'label': 'A<sub>st</sub>', 'value': round(Ast_m2 * 10000, 2), 'unit': 'cm²'},
+                {'label': 'A<sub>sc</sub>', 'value': round(Asc_m2 * 10000, 2), 'unit': 'cm²'}
+            ]
+        }
     
     # ============================================
     # 3. VÉRIFICATION ELS
@@ -274,48 +440,31 @@ class CalculBAEL:
             fc28_MPa, acier_type, fissuration, acier_ha
         )
         
-        # 2. Calcul axe neutre Y1
-        # Équation: bY1² + 30(Ast + Asc)Y1 - 30(Asc×d' + Ast×d) = 0
-        A = b_m
-        B = 30 * (Ast_m2 + Asc_m2)
-        C = -30 * (Asc_m2 * dp_m + Ast_m2 * d_m)
-        
-        delta = B**2 - 4 * A * C
-        
-        if delta < 0:
+        # 2. Axe neutre Y1, inertie Igg', contraintes et cas
+        sorties = noyau_els(
+            Ms_MNm, b_m, b_m, 0.0, d_m, dp_m, Ast_m2, Asc_m2, sigma_b_adm_MPa, sigma_s_adm_MPa
+        )
+        return CalculBAEL._resultat_els(
+            dict(zip(SORTIES_ELS, sorties)), sigma_b_adm_MPa, sigma_s_adm_MPa
+        )
+    
+    @staticmethod
+    def _resultat_els(r, sigma_b_adm_MPa, sigma_s_adm_MPa):
+        """Résultats ELS affichables à partir des sorties de noyau_els"""
+        Y1_m, I_m4, K_MN_m3 = r['Y1_m'], r['I_m4'], r['K_MN_m3']
+        sigma_b_MPa, sigma_s_MPa = r['sigma_b_MPa'], r['sigma_s_MPa']
+        if math.isnan(Y1_m):
             raise ValueError("Pas de solution réelle pour l'axe neutre")
         
-        Y1_m = (-B + math.sqrt(delta)) / (2 * A)
-        
-        # 3. Calcul inertie Igg'
-        I_m4 = (b_m * Y1_m**3) / 3
-        I_m4 += 15 * Asc_m2 * (dp_m - Y1_m)**2
-        I_m4 += 15 * Ast_m2 * (d_m - Y1_m)**2
-        
-        # 4. Calcul pente K
-        K_MN_m3 = Ms_MNm / I_m4
-        
-        # 5. Calcul contraintes
-        sigma_b_MPa = K_MN_m3 * Y1_m
-        sigma_s_MPa = 15 * K_MN_m3 * (d_m - Y1_m)
-        
-        # 6. Vérification
-        verif_beton = sigma_b_MPa <= sigma_b_adm_MPa
-        verif_acier = sigma_s_MPa <= sigma_s_adm_MPa
-        
-        # 7. Détermination du cas
-        if verif_beton and verif_acier:
-            cas = 1
-            message = "Cas 1: ELU déterminant"
-        elif verif_beton and not verif_acier:
-            cas = 2
-            message = "Cas 2: ELS Armatures simples"
-        elif not verif_beton and not verif_acier:
-            cas = 3
-            message = "Cas 3: ELS Armatures doubles"
-        else:
-            cas = 4
-            message = "Cas 4: ELS Armatures doubles"
+        cas = int(r['cas'])
+        message = {
+            1: "Cas 1: ELU déterminant",
+            2: "Cas 2: ELS Armatures simples",
+            3: "Cas 3: ELS Armatures doubles",
+            4: "Cas 4: ELS Armatures doubles",
+        }[cas]
+        verif_beton = cas in (1, 2)
+        verif_acier = cas in (1, 4)
         
         return {
             'Y1_m': Y1_m,
@@ -343,3 +492,320 @@ class CalculBAEL:
                 {'label': 'Vérification acier', 'value': 'OK' if verif_acier else 'NON', 'unit': ''}
             ]
         }
+    
+    # ============================================
+    # 4. SECTION EN TÉ
+    # ============================================
+    
+    @staticmethod
+    def calcul_elu_te(Mu_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, acier_type):
+        """
+        Calcul ELU d'une section en Té
+        
+        b: largeur de la table, b0: largeur de l'âme, h0: épaisseur de la table
+        
+        - Mu ≤ MTu: seule la table est comprimée → section rectangulaire b × d
+        - Mu > MTu: l'âme participe → ailes (b - b0) + section rectangulaire b0 × d
+        """
+        parametres = PARAMETRES_ACIER[acier_type]
+        r = dict(zip(SORTIES_ELU, noyau_elu(
+            Mu_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, acier_type, parametres['muR'],
+            parametres['alphaR'], parametres['eps_els_pour_mille'], parametres['mu_1'],
+        )))
+        resultat = CalculBAEL._resultat_elu(r)
+        MTu_MNm = r['MTu_MNm']
+        
+        # Mu ≤ MTu: table seule comprimée
+        if r['table']:
+            resultat['cas_te'] = 'table'
+        
+        # Âme participante: moment repris par les ailes (Ast des ailes inclus)
+        else:
+            Mu_ailes_MNm = r['Mu_ailes_MNm']
+            resultat['cas_te'] = 'ame'
+            resultat['Mu_ailes_MNm'] = round(Mu_ailes_MNm, 6)
+            resultat['display_order'].insert(
+                1, {'label': 'M<sub>u,ailes</sub>', 'value': round(Mu_ailes_MNm, 6), 'unit': 'MN.m'}
+            )
+        
+        resultat['section'] = 'te'
+        resultat['MTu_MNm'] = round(MTu_MNm, 6)
+        resultat['display_order'].insert(
+            0, {'label': 'M<sub>Tu</sub>', 'value': round(MTu_MNm, 6), 'unit': 'MN.m'}
+        )
+        return resultat
+    
+    @staticmethod
+    def verification_els_te(Ms_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, acier_type,
+                            fissuration, acier_ha, Ast_m2, Asc_m2):
+        """
+        Vérification ELS d'une section en Té
+        
+        Axe neutre dans la table → section rectangulaire b × d,
+        sinon axe neutre et inertie de la section en Té
+        """
+        sigma_b_adm_MPa, sigma_s_adm_MPa = CalculBAEL.calcul_contraintes_admissibles(
+            fc28_MPa, acier_type, fissuration, acier_ha
+        )
+        r = dict(zip(SORTIES_ELS, noyau_els(
+            Ms_MNm, b_m, b0_m, h0_m, d_m, dp_m, Ast_m2, Asc_m2, sigma_b_adm_MPa, sigma_s_adm_MPa
+        )))
+        resultat = CalculBAEL._resultat_els(r, sigma_b_adm_MPa, sigma_s_adm_MPa)
+        resultat['cas_te'] = 'table' if r['table'] else 'ame'
+        resultat['section'] = 'te'
+        return resultat
+    
+    # ============================================
+    # 5. CALCUL PAR LOTS (VECTORISÉ)
+    # ============================================
+    
+    @staticmethod
+    def _parametres_acier_lot(acier_type):
+        """Paramètres acier sous forme de tableaux (NaN si nuance inconnue)"""
+        acier_type = np.asarray(acier_type)
+        parametres = {}
+        for cle in ('muR', 'alphaR', 'eps_els_pour_mille', 'mu_1'):
+            valeur = np.full(acier_type.shape, np.nan)
+            for nuance, p in PARAMETRES_ACIER.items():
+                valeur = np.where(acier_type == nuance, p[cle], valeur)
+            parametres[cle] = valeur
+        parametres['fe_MPa'] = np.where(np.isnan(parametres['muR']), np.nan, acier_type)
+        return parametres
+    
+    @staticmethod
+    def _section_te_lot(b_m, b0_m, h0_m):
+        """Largeur d'âme et épaisseur de table (rectangle si b0 absent ou NaN)"""
+        if b0_m is None:
+            return b_m, np.zeros_like(b_m)
+        b0_m = np.broadcast_to(np.asarray(b0_m, dtype=float), b_m.shape)
+        h0_m = np.broadcast_to(np.asarray(h0_m, dtype=float), b_m.shape)
+        rectangle = np.isnan(b0_m) | np.isnan(h0_m)
+        return np.where(rectangle, b_m, b0_m), np.where(rectangle, 0.0, h0_m)
+    
+    @staticmethod
+    def calcul_elu_lot(Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, b0_m=None, h0_m=None,
+                       refus_mu_1=True):
+        """
+        Calcul ELU vectorisé (même organigramme que calcul_elu / calcul_elu_te)
+        
+        Sections rectangulaires et en Té mélangées dans un même lot:
+        b0/h0 à NaN (ou absents) pour les sections rectangulaires.
+        refus_mu_1=False: pas de refus en pivot A pour μ < μ₁ (flexion simple
+        fictive de la flexion composée).
+        
+        Retourne un dict de tableaux; 'valide' est faux là où calcul_elu
+        lèverait une erreur (Ast, Asc à NaN).
+        """
+        Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (Mu_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type)]
+        )
+        b0_m, h0_m = CalculBAEL._section_te_lot(b_m, b0_m, h0_m)
+        p = CalculBAEL._parametres_acier_lot(acier_type)
+        if not refus_mu_1:
+            p['mu_1'] = np.full_like(p['mu_1'], -np.inf)
+        
+        # Organigramme complet sur toutes les lignes, branches choisies par np.where
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sorties = noyau_elu_lot(
+                Mu_MNm, b_m, b0_m, h0_m, d_m, dp_m, fc28_MPa, p['fe_MPa'],
+                p['muR'], p['alphaR'], p['eps_els_pour_mille'], p['mu_1'],
+            )
+        return CalculBAEL._resultat_elu_lot(sorties, b_m.shape)
+    
+    @staticmethod
+    def _resultat_elu_lot(sorties, forme):
+        """Dict de tableaux de calcul_elu_lot à partir des sorties de noyau_elu"""
+        r = {c: np.array(np.broadcast_to(v, forme)) for c, v in zip(SORTIES_ELU, sorties)}
+        code = r.pop('code')
+        r['valide'] = code != ELU_INVALIDE
+        r['doubles'] = code == ELU_DOUBLES
+        r['pivot'] = np.where(r['mu'] >= MU_AB, 'B', 'A')
+        r['table'] = r['table'] == 1.0
+        return r
+    
+    @staticmethod
+    def calcul_contraintes_admissibles_lot(fc28_MPa, acier_type, fissuration, acier_ha):
+        """Contraintes admissibles vectorisées (cf. calcul_contraintes_admissibles)"""
+        fc28_MPa = np.asarray(fc28_MPa, dtype=float)
+        fissuration = np.asarray(fissuration)
+        
+        sigma_b_adm_MPa = 0.6 * fc28_MPa
+        ft28_MPa = 0.6 + 0.06 * fc28_MPa
+        eta = np.where(np.asarray(acier_ha) == "HA", 1.6, 1.0)
+        fe_MPa = np.where(np.asarray(acier_type) == 400, 400.0, 500.0)
+        
+        sigma_s_adm_MPa = np.select(
+            [fissuration == "FPP", fissuration == "FP", fissuration == "FTP"],
+            [
+                fe_MPa,
+                np.minimum((2/3) * fe_MPa, 110 * np.sqrt(eta * ft28_MPa)),
+                np.minimum(0.5 * fe_MPa, 90 * np.sqrt(eta * ft28_MPa)),
+            ],
+            default=np.nan,
+        )
+        return sigma_b_adm_MPa, sigma_s_adm_MPa
+    
+    @staticmethod
+    def verification_els_lot(Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+                             Ast_m2, Asc_m2, b0_m=None, h0_m=None):
+        """
+        Vérification ELS vectorisée (même organigramme que verification_els / verification_els_te)
+        
+        Retourne un dict de tableaux: Y1, Igg', K, σb, σs, admissibles et cas (1 à 4)
+        """
+        Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2 = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2)]
+        )
+        b0_m, h0_m = CalculBAEL._section_te_lot(b_m, b0_m, h0_m)
+        fissuration = np.broadcast_to(np.asarray(fissuration), b_m.shape)
+        acier_ha = np.broadcast_to(np.asarray(acier_ha), b_m.shape)
+        
+        # 1. Contraintes admissibles
+        sigma_b_adm_MPa, sigma_s_adm_MPa = CalculBAEL.calcul_contraintes_admissibles_lot(
+            fc28_MPa, acier_type, fissuration, acier_ha
+        )
+        
+        # 2. Axe neutre, inertie, contraintes et cas (branches choisies par np.where)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sorties = noyau_els_lot(
+                Ms_MNm, b_m, b0_m, h0_m, d_m, dp_m, Ast_m2, Asc_m2, sigma_b_adm_MPa, sigma_s_adm_MPa
+            )
+        return CalculBAEL._resultat_els_lot(sorties, b_m.shape, sigma_b_adm_MPa, sigma_s_adm_MPa)
+    
+    @staticmethod
+    def _resultat_els_lot(sorties, forme, sigma_b_adm_MPa, sigma_s_adm_MPa):
+        """Dict de tableaux de verification_els_lot à partir des sorties de noyau_els"""
+        r = {c: np.array(np.broadcast_to(v, forme)) for c, v in zip(SORTIES_ELS, sorties)}
+        r['cas'] = r['cas'].astype(int)
+        r['table'] = r['table'] == 1.0
+        r['sigma_b_adm_MPa'] = sigma_b_adm_MPa
+        r['sigma_s_adm_MPa'] = sigma_s_adm_MPa
+        r['verif_beton'] = (r['cas'] == 1) | (r['cas'] == 2)
+        r['verif_acier'] = (r['cas'] == 1) | (r['cas'] == 4)
+        return r
+    
+    # ============================================
+    # 6. MOMENT RÉSISTANT D'UNE SECTION EXISTANTE
+    # ============================================
+    
+    @staticmethod
+    def moment_resistant_lot(b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+                             Ast_m2, Asc_m2=0.0, Mu_MNm=None, Ms_MNm=None,
+                             b0_m=None, h0_m=None, nb_iterations=40):
+        """
+        Calcul inverse vectorisé: armatures connues → moments admissibles
+        
+        ELU: axe neutre y par dichotomie sur l'équilibre des efforts
+        (diagramme rectangulaire 0.8y, pivots A / B, acier élasto-plastique),
+        puis MRu par les moments autour des aciers tendus.
+        ELS: Ms,adm = min(σb,adm·I/Y1 ; σs,adm·I/(15(d - Y1))).
+        Si Mu / Ms sont donnés: taux de travail Mu/MRu, Ms/Ms,adm.
+        """
+        b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2 = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (b_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2)]
+        )
+        b0_m, h0_m = CalculBAEL._section_te_lot(b_m, b0_m, h0_m)
+        p = CalculBAEL._parametres_acier_lot(acier_type)
+        
+        # 1. Contraintes de calcul
+        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
+        fsu_MPa = p['fe_MPa'] / 1.15
+        
+        def efforts(y_m):
+            """Déformations (pivot A ou B), contraintes et effort béton pour un axe neutre y"""
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Pivot A: εst = 10 ‰ ; pivot B: εbc = 3.5 ‰
+                courbure = np.minimum(3.5 / y_m, 10.0 / (d_m - y_m))
+                courbure = np.where(y_m >= d_m, 3.5 / y_m, courbure)
+            sigma_st = np.clip(E_ACIER_MPA / 1000.0 * courbure * (d_m - y_m), -fsu_MPa, fsu_MPa)
+            sigma_sc = np.clip(E_ACIER_MPA / 1000.0 * courbure * (y_m - dp_m), -fsu_MPa, fsu_MPa)
+            # Béton comprimé: âme sur 0.8y + débords de table sur min(0.8y, h0)
+            Fb_ame = b0_m * 0.8 * y_m * sigma_bc_MPa
+            h_table_m = np.minimum(0.8 * y_m, h0_m)
+            Fb_table = (b_m - b0_m) * h_table_m * sigma_bc_MPa
+            return Fb_ame, Fb_table, h_table_m, sigma_st, sigma_sc
+        
+        # 2. Axe neutre: N(y) = Fb + Asc·σsc - Ast·σst croissant en y
+        y_min = np.zeros_like(d_m)
+        y_max = d_m.copy()
+        for _ in range(nb_iterations):
+            y_m = (y_min + y_max) / 2
+            Fb_ame, Fb_table, _, sigma_st, sigma_sc = efforts(y_m)
+            compression = Fb_ame + Fb_table + Asc_m2 * sigma_sc >= Ast_m2 * sigma_st
+            y_max = np.where(compression, y_m, y_max)
+            y_min = np.where(compression, y_min, y_m)
+        y_m = (y_min + y_max) / 2
+        
+        # 3. Moment résistant ultime (moments autour des aciers tendus)
+        Fb_ame, Fb_table, h_table_m, sigma_st, sigma_sc = efforts(y_m)
+        MRu_MNm = (Fb_ame * (d_m - 0.4 * y_m) + Fb_table * (d_m - h_table_m / 2)
+                   + Asc_m2 * sigma_sc * (d_m - dp_m))
+        alpha = y_m / d_m
+        pivot = np.where(alpha < 3.5 / 13.5, 'A', 'B')
+        
+        # 4. Moment de service admissible (contraintes pour Ms = 1 MN.m)
+        els = CalculBAEL.verification_els_lot(
+            1.0, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+            Ast_m2, Asc_m2, b0_m, h0_m,
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Ms_adm_MNm = np.minimum(
+                els['sigma_b_adm_MPa'] / els['sigma_b_MPa'],
+                els['sigma_s_adm_MPa'] / els['sigma_s_MPa'],
+            )
+        
+        resultat = {
+            'y_m': y_m,
+            'alpha': alpha,
+            'pivot': pivot,
+            'sigma_st_MPa': sigma_st,
+            'sigma_sc_MPa': sigma_sc,
+            'MRu_MNm': MRu_MNm,
+            'Y1_m': els['Y1_m'],
+            'I_m4': els['I_m4'],
+            'Ms_adm_MNm': Ms_adm_MNm,
+        }
+        
+        # 5. Taux de travail
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if Mu_MNm is not None:
+                resultat['taux_elu'] = np.asarray(Mu_MNm, dtype=float) / MRu_MNm
+            if Ms_MNm is not None:
+                resultat['taux_els'] = np.asarray(Ms_MNm, dtype=float) / Ms_adm_MNm
+        taux = [resultat[c] for c in ('taux_elu', 'taux_els') if c in resultat]
+        if taux:
+            resultat['taux'] = np.maximum.reduce(np.broadcast_arrays(*taux))
+            resultat['verifie'] = resultat['taux'] <= 1.0
+        return resultat
+    
+    @staticmethod
+    def moment_resistant(b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+                         Ast_m2, Asc_m2=0.0, Mu_MNm=None, Ms_MNm=None, b0_m=None, h0_m=None):
+        """
+        Moments admissibles d'une section existante (cf. moment_resistant_lot)
+        
+        Affiche: y, α, pivot, MRu, Ms,adm et taux de travail
+        """
+        lot = CalculBAEL.moment_resistant_lot(
+            b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha,
+            Ast_m2, Asc_m2, Mu_MNm, Ms_MNm,
+            None if b0_m is None else [b0_m], None if h0_m is None else [h0_m],
+        )
+        r = {c: v[0].item() for c, v in lot.items()}
+        
+        display_order = [
+            {'label': 'Axe neutre y<sub>u</sub>', 'value': round(r['y_m'] * 100, 2), 'unit': 'cm'},
+            {'label': 'α', 'value': round(r['alpha'], 4), 'unit': ''},
+            {'label': 'Pivot', 'value': r['pivot'], 'unit': ''},
+            {'label': 'M<sub>Ru</sub>', 'value': round(r['MRu_MNm'], 6), 'unit': 'MN.m'},
+            {'label': 'M<sub>s,adm</sub>', 'value': round(r['Ms_adm_MNm'], 6), 'unit': 'MN.m'},
+        ]
+        if 'taux_elu' in r:
+            display_order.append({'label': 'Taux ELU M<sub>u</sub>/M<sub>Ru</sub>', 'value': round(r['taux_elu'], 3), 'unit': ''})
+        if 'taux_els' in r:
+            display_order.append({'label': 'Taux ELS M<sub>s</sub>/M<sub>s,adm</sub>', 'value': round(r['taux_els'], 3), 'unit': ''})
+        r['display_order'] = display_order
+        return r
@@ -0,0 +1,217 @@
+# =======================================================
+# CHOIX AUTOMATIQUE DU FERRAILLAGE - RAHANI Soulaimane
+# =======================================================
+
+import numpy as np
+
+# Diamètres commerciaux des barres HA (mm)
+DIAMETRES_HA_MM = (6, 8, 10, 12, 14, 16, 20, 25, 32)
+
+# Masse volumique de l'acier (kg/m³)
+MASSE_VOLUMIQUE_ACIER = 7850.0
+
+
+class IndexFerraillage:
+    """
+    Index précalculé des dispositions de barres, trié par section d'acier
+
+    Une disposition = n1 barres φ1 (+ n2 barres φ2 < φ1) réparties en lits.
+    Pour chaque classe de largeur disponible (b - 2d'), les dispositions
+    réalisables sont triées par section croissante : le choix de la
+    disposition la plus légère est une simple recherche dichotomique.
+    """
+
+    def __init__(self, diametres_mm=DIAMETRES_HA_MM, nb_lits_max=3,
+                 nb_barres_max=24, dg_m=0.025, pas_largeur_m=0.005,
+                 nb_diametres_secondaires=2):
+        self.diametres_mm = tuple(sorted(diametres_mm))
+        self.nb_lits_max = int(nb_lits_max)
+        self.nb_barres_max = int(nb_barres_max)
+        self.dg_m = float(dg_m)
+        self.pas_largeur_m = float(pas_largeur_m)
+        self.nb_diametres_secondaires = int(nb_diametres_secondaires)
+
+        self._generer_combinaisons()
+        self._classes = {}
+
+    # ============================================
+    # 1. GÉNÉRATION DES COMBINAISONS
+    # ============================================
+
+    def _generer_combinaisons(self):
+        """Énumère toutes les combinaisons (n1 φ1 + n2 φ2) candidates"""
+        n1, phi1, n2, phi2 = [], [], [], []
+
+        for i, d1 in enumerate(self.diametres_mm):
+            # φ2 = aucun ou un des diamètres immédiatement inférieurs
+            secondaires = [0] + list(
+                self.diametres_mm[max(0, i - self.nb_diametres_secondaires):i]
+            )
+            for d2 in secondaires:
+                for a in range(2, self.nb_barres_max + 1):
+                    n2_max = 0 if d2 == 0 else min(a, self.nb_barres_max - a)
+                    for b in range(0, n2_max + 1):
+                        if d2 != 0 and b == 0:
+                            continue
+                        n1.append(a)
+                        phi1.append(d1)
+                        n2.append(b)
+                        phi2.append(d2)
+
+        self.n1 = np.array(n1, dtype=np.int16)
+        self.phi1_mm = np.array(phi1, dtype=np.int16)
+        self.n2 = np.array(n2, dtype=np.int16)
+        self.phi2_mm = np.array(phi2, dtype=np.int16)
+
+        # Section d'acier (m²)
+        self.As_m2 = (
+            self.n1 * np.pi * (self.phi1_mm / 1000.0) ** 2 / 4
+            + self.n2 * np.pi * (self.phi2_mm / 1000.0) ** 2 / 4
+        )
+
+        # Entraxe minimal des barres : φmax + max(φmax, 1.5 × Dg)
+        phi_max_m = self.phi1_mm / 1000.0
+        self._entraxe_m = phi_max_m + np.maximum(phi_max_m, 1.5 * self.dg_m)
+
+    # ============================================
+    # 2. INDEX PAR CLASSE DE LARGEUR
+    # ============================================
+
+    def classe_largeur(self, b_m, dp_m):
+        """Classe de largeur (arrondie par défaut) de la portée utile b - 2d'"""
+        portee = np.asarray(b_m, dtype=float) - 2 * np.asarray(dp_m, dtype=float)
+        return np.floor(portee / self.pas_largeur_m + 1e-9).astype(np.int64)
+
+    def _index_classe(self, classe):
+        """Construit (ou relit en cache) l'index trié d'une classe de largeur"""
+        index = self._classes.get(classe)
+        if index is not None:
+            return index
+
+        portee_m = classe * self.pas_largeur_m
+
+        # Nombre maximal de barres par lit pour chaque combinaison
+        par_lit = np.floor(portee_m / self._entraxe_m + 1e-9).astype(np.int64) + 1
+        n_total = (self.n1 + self.n2).astype(np.int64)
+        nb_lits = -(-n_total // np.maximum(par_lit, 1))
+
+        realisable = (portee_m > 0) & (par_lit >= 2) & (nb_lits <= self.nb_lits_max)
+        ids = np.nonzero(realisable)[0]
+
+        # Tri : section, puis nombre de lits, puis nombre de barres
+        ordre = np.lexsort((n_total[ids], nb_lits[ids], self.As_m2[ids]))
+        ids = ids[ordre]
+
+        index = {
+            'ids': ids,
+            'As_m2': self.As_m2[ids],
+            'nb_lits': nb_lits[ids].astype(np.int16),
+        }
+        self._classes[classe] = index
+        return index
+
+    def precalculer(self, b_max_m, dp_m):
+        """Précalcule toutes les classes de largeur jusqu'à b_max_m"""
+        classe_max = int(self.classe_largeur(b_max_m, dp_m))
+        for classe in range(classe_max + 1):
+            self._index_classe(classe)
+
+    # ============================================
+    # 3. SÉLECTION
+    # ============================================
+
+    def designation(self, i):
+        """Désignation usuelle d'une combinaison, ex: '3HA16 + 2HA14'"""
+        texte = f"{self.n1[i]}HA{self.phi1_mm[i]}"
+        if self.n2[i] > 0:
+            texte += f" + {self.n2[i]}HA{self.phi2_mm[i]}"
+        return texte
+
+    def selectionner(self, Ast_m2, b_m, dp_m):
+        """
+        Disposition la plus légère pour une section requise
+
+        Retourne: désignation, n1, φ1, n2, φ2, nombre de lits, As (cm²)
+        """
+        lot = self.selectionner_lot([Ast_m2], [b_m], [dp_m])
+        if not lot['trouve'][0]:
+            raise ValueError(
+                "Aucune disposition de barres ne convient. Augmentez b ou d."
+            )
+
+        i = int(lot['id'][0])
+        As_cm2 = float(lot['As_cm2'][0])
+        return {
+            'designation': self.designation(i),
+            'n1': int(self.n1[i]),
+            'phi1_mm': int(self.phi1_mm[i]),
+            'n2': int(self.n2[i]),
+            'phi2_mm': int(self.phi2_mm[i]),
+            'nb_lits': int(lot['nb_lits'][0]),
+            'As_cm2': round(As_cm2, 2),
+            'masse_kg_m': round(float(lot['masse_kg_m'][0]), 3),
+            'display_order': [
+                {'label': 'Ferraillage', 'value': self.designation(i), 'unit': ''},
+                {'label': 'Nombre de lits', 'value': int(lot['nb_lits'][0]), 'unit': ''},
+                {'label': 'A<sub>s</sub> réelle', 'value': round(As_cm2, 2), 'unit': 'cm²'}
+            ]
+        }
+
+    def selectionner_lot(self, Ast_m2, b_m, dp_m):
+        """
+        Sélection vectorisée pour tout un bordereau de poutres
+
+        Retourne un dict de tableaux : id (combinaison, -1 si aucune),
+        trouve, n1, φ1, n2, φ2, nb_lits, As (cm²), masse (kg/m)
+        """
+        Ast_m2, b_m, dp_m = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(Ast_m2, dtype=float)),
+            np.atleast_1d(np.asarray(b_m, dtype=float)),
+            np.atleast_1d(np.asarray(dp_m, dtype=float)),
+        )
+
+        n = Ast_m2.shape[0]
+        ids = np.full(n, -1, dtype=np.int64)
+        nb_lits = np.zeros(n, dtype=np.int16)
+
+        classes = self.classe_largeur(b_m, dp_m)
+        valeurs, inverse = np.unique(classes, return_inverse=True)
+
+        for k, classe in enumerate(valeurs):
+            lignes = np.nonzero(inverse == k)[0]
+            index = self._index_classe(int(classe))
+            if index['ids'].size == 0:
+                continue
+
+            # Recherche dichotomique de la première section >= Ast requise
+            pos = np.searchsorted(index['As_m2'], Ast_m2[lignes], side='left')
+            ok = pos < index['ids'].size
+            ids[lignes[ok]] = index['ids'][pos[ok]]
+            nb_lits[lignes[ok]] = index['nb_lits'][pos[ok]]
+
+        trouve = ids >= 0
+        sel = np.where(trouve, ids, 0)
+        As_m2 = np.where(trouve, self.As_m2[sel], np.nan)
+
+        return {
+            'id': ids,
+            'trouve': trouve,
+            'n1': np.where(trouve, self.n1[sel], 0),
+            'phi1_mm': np.where(trouve, self.phi1_mm[sel], 0),
+            'n2': np.where(trouve, self.n2[sel], 0),
+            'phi2_mm': np.where(trouve, self.phi2_mm[sel], 0),
+            'nb_lits': nb_lits,
+            'As_cm2': As_m2 * 10000,
+            'masse_kg_m': As_m2 * MASSE_VOLUMIQUE_ACIER,
+        }
+
+
+_INDEX_DEFAUT = None
+
+
+def index_defaut():
+    """Index partagé avec les paramètres par défaut (construit une seule fois)"""
+    global _INDEX_DEFAUT
+    if _INDEX_DEFAUT is None:
+        _INDEX_DEFAUT = IndexFerraillage()
+    return _INDEX_DEFAUT
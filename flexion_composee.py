@@ -0,0 +1,353 @@
+# =======================================================
+# FLEXION COMPOSÉE (N + M) - RAHANI Soulaimane
+# =======================================================
+#
+# Conventions :
+# - N > 0 : compression, N < 0 : traction (MN)
+# - M ≥ 0 : moment au centre de gravité du béton (h/2), fibre supérieure comprimée (MN.m)
+# - Ast : armatures inférieures (à d), Asc : armatures supérieures (à d')
+
+import numpy as np
+
+from backends_bael import calcul_elu_lot
+from calculs_bael import CalculBAEL, COEF_EQUIVALENCE, E_ACIER_MPA
+
+
+def _tableaux(*valeurs):
+    """Convertit et diffuse les arguments en tableaux 1D de même taille"""
+    return np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in valeurs])
+
+
+class FlexionComposee:
+    """
+    Calculs BAEL en flexion composée (sections rectangulaires)
+    """
+
+    # ============================================
+    # 1. CALCUL ELU
+    # ============================================
+
+    @staticmethod
+    def calcul_elu_lot(Nu_MN, Mu_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type):
+        """
+        Dimensionnement ELU vectorisé en flexion composée
+
+        - Section entièrement tendue : répartition de N entre les deux nappes
+        - Section partiellement comprimée : flexion simple fictive sous MuA
+          (moment ramené aux aciers tendus), puis Ast = Ast,fictif - Nu/σst
+        - Section entièrement comprimée : formules BAEL (ψ)
+
+        Retourne un dict de tableaux : etat ('ET', 'PC', 'EC'), e0, MuA, Ast, Asc, valide
+        """
+        Nu_MN, Mu_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type = _tableaux(
+            Nu_MN, Mu_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type
+        )
+
+        # 1. Contraintes de calcul
+        sigma_bc_MPa = (0.85 * fc28_MPa) / 1.5
+        sigma_st_MPa = acier_type / 1.15
+        sigma_2_MPa = np.minimum(sigma_st_MPa, E_ACIER_MPA * 0.002)  # acier à ε = 2‰
+
+        # 2. Excentricité et moment ramené aux aciers tendus
+        with np.errstate(divide='ignore', invalid='ignore'):
+            e0_m = np.where(Nu_MN != 0, Mu_MNm / np.abs(Nu_MN), np.inf)
+        MuA_MNm = Mu_MNm + Nu_MN * (d_m - h_m / 2)
+
+        # 3. Détermination de l'état de la section
+        traction = Nu_MN < 0
+        entierement_tendue = traction & (e0_m <= d_m - h_m / 2)
+
+        moment_limite = Nu_MN * (d_m - dp_m) - MuA_MNm
+        limite_pc = (0.337 * h_m - 0.81 * dp_m) * b_m * h_m * sigma_bc_MPa
+        entierement_comprimee = ~traction & (moment_limite > limite_pc)
+        partiellement_comprimee = ~entierement_tendue & ~entierement_comprimee
+
+        etat = np.where(entierement_tendue, 'ET', np.where(entierement_comprimee, 'EC', 'PC'))
+
+        # 4. Section partiellement comprimée : flexion simple fictive (μ < μ₁
+        #    courant sous MuA, armatures simples sans refus)
+        fictif = calcul_elu_lot(
+            np.where(partiellement_comprimee, MuA_MNm, 0.0), b_m, d_m, dp_m, fc28_MPa, acier_type,
+            refus_mu_1=False,
+        )
+        Ast_pc = np.maximum(fictif['Ast_m2'] - Nu_MN / sigma_st_MPa, 0.0)
+        Asc_pc = fictif['Asc_m2']
+
+        # 5. Section entièrement tendue
+        T_MN = -Nu_MN
+        with np.errstate(invalid='ignore'):
+            Ast_et = T_MN * (h_m / 2 - dp_m + e0_m) / ((d_m - dp_m) * sigma_st_MPa)
+            Asc_et = T_MN * (d_m - h_m / 2 - e0_m) / ((d_m - dp_m) * sigma_st_MPa)
+
+        # 6. Section entièrement comprimée
+        limite_ec = (0.5 * h_m - dp_m) * b_m * h_m * sigma_bc_MPa
+        tres_comprimee = moment_limite > limite_ec
+        psi = (0.3571 + moment_limite / (b_m * h_m**2 * sigma_bc_MPa)) / (0.8571 - dp_m / h_m)
+        Asc_ec = np.where(
+            tres_comprimee,
+            (MuA_MNm - (d_m - 0.5 * h_m) * b_m * h_m * sigma_bc_MPa) / ((d_m - dp_m) * sigma_2_MPa),
+            (Nu_MN - psi * b_m * h_m * sigma_bc_MPa) / sigma_2_MPa,
+        )
+        Ast_ec = np.where(
+            tres_comprimee,
+            (Nu_MN - b_m * h_m * sigma_bc_MPa) / sigma_2_MPa - Asc_ec,
+            0.0,
+        )
+
+        Ast_m2 = np.select(
+            [entierement_tendue, entierement_comprimee], [Ast_et, Ast_ec], default=Ast_pc
+        )
+        Asc_m2 = np.select(
+            [entierement_tendue, entierement_comprimee], [Asc_et, Asc_ec], default=Asc_pc
+        )
+        valide = np.where(partiellement_comprimee, fictif['valide'], True)
+
+        return {
+            'etat': etat,
+            'valide': valide,
+            'e0_m': e0_m,
+            'MuA_MNm': MuA_MNm,
+            'mu': np.where(partiellement_comprimee, fictif['mu'], np.nan),
+            'Ast_m2': np.where(valide, np.maximum(Ast_m2, 0.0), np.nan),
+            'Asc_m2': np.where(valide, np.maximum(Asc_m2, 0.0), np.nan),
+            'sigma_bc_MPa': sigma_bc_MPa,
+            'sigma_st_MPa': sigma_st_MPa,
+        }
+
+    @staticmethod
+    def calcul_elu(Nu_MN, Mu_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type):
+        """
+        Dimensionnement ELU en flexion composée d'une seule section
+
+        Retourne: état de la section, e0, MuA, Ast, Asc
+        """
+        lot = FlexionComposee.calcul_elu_lot(
+            Nu_MN, Mu_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type
+        )
+        if not lot['valide'][0]:
+            raise ValueError("Section sous-dimensionnée. Augmentez b ou d.")
+
+        libelles = {
+            'ET': 'Section entièrement tendue',
+            'PC': 'Section partiellement comprimée',
+            'EC': 'Section entièrement comprimée',
+        }
+        etat = str(lot['etat'][0])
+        e0_m = float(lot['e0_m'][0])
+        MuA_MNm = float(lot['MuA_MNm'][0])
+        Ast_m2 = float(lot['Ast_m2'][0])
+        Asc_m2 = float(lot['Asc_m2'][0])
+
+        return {
+            'etat': etat,
+            'message_etat': libelles[etat],
+            'e0_m': e0_m,
+            'e0_cm': round(e0_m * 100, 2),
+            'MuA_MNm': round(MuA_MNm, 6),
+            'Ast_m2': Ast_m2,
+            'Ast_cm2': round(Ast_m2 * 10000, 2),
+            'Asc_m2': Asc_m2,
+            'Asc_cm2': round(Asc_m2 * 10000, 2),
+            'display_order': [
+                {'label': 'État de la section', 'value': libelles[etat], 'unit': ''},
+                {'label': 'e<sub>0</sub>', 'value': round(e0_m * 100, 2), 'unit': 'cm'},
+                {'label': 'M<sub>uA</sub>', 'value': round(MuA_MNm, 6), 'unit': 'MN.m'},
+                {'label': 'A<sub>st</sub>', 'value': round(Ast_m2 * 10000, 2), 'unit': 'cm²'},
+                {'label': 'A<sub>sc</sub>', 'value': round(Asc_m2 * 10000, 2), 'unit': 'cm²'}
+            ]
+        }
+
+    # ============================================
+    # 2. VÉRIFICATION ELS
+    # ============================================
+
+    @staticmethod
+    def verification_els_lot(Ns_MN, Ms_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type,
+                             fissuration, acier_ha, Ast_m2, Asc_m2, nb_iterations=60):
+        """
+        Vérification ELS vectorisée en flexion composée
+
+        L'axe neutre Y1 de la section partiellement comprimée est obtenu par
+        dichotomie (nombre fixe d'itérations) sur l'équation M·S(Y1) = N·T(Y1),
+        S et T étant les moments statique et d'inertie réduits de la section
+        homogène. Sans effort normal on retrouve verification_els.
+        """
+        Ns_MN, Ms_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2 = _tableaux(
+            Ns_MN, Ms_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2
+        )
+        n = COEF_EQUIVALENCE
+        fissuration = np.broadcast_to(np.asarray(fissuration), b_m.shape)
+        acier_ha = np.broadcast_to(np.asarray(acier_ha), b_m.shape)
+
+        # 1. Contraintes admissibles
+        sigma_b_adm_MPa, sigma_s_adm_MPa = CalculBAEL.calcul_contraintes_admissibles_lot(
+            fc28_MPa, acier_type, fissuration, acier_ha
+        )
+
+        def statique(y):
+            return b_m * y**2 / 2 + n * Asc_m2 * (y - dp_m) - n * Ast_m2 * (d_m - y)
+
+        def moment(y):
+            return (b_m * y**2 / 2 * (h_m / 2 - y / 3)
+                    + n * Asc_m2 * (y - dp_m) * (h_m / 2 - dp_m)
+                    + n * Ast_m2 * (d_m - y) * (d_m - h_m / 2))
+
+        def residu(y):
+            return Ms_MNm * statique(y) - Ns_MN * moment(y)
+
+        # 2. Section entièrement tendue
+        with np.errstate(divide='ignore', invalid='ignore'):
+            e0_m = np.where(Ns_MN != 0, Ms_MNm / np.abs(Ns_MN), np.inf)
+        entierement_tendue = (Ns_MN < 0) & (e0_m <= d_m - h_m / 2)
+
+        # 3. Section partiellement comprimée : axe neutre par dichotomie
+        # Y0 : axe neutre en flexion simple (S(Y0) = 0). La racine cherchée est
+        # au-dessous de Y0 en compression, au-dessus en traction.
+        B = 2 * n * (Ast_m2 + Asc_m2)
+        C = -2 * n * (Asc_m2 * dp_m + Ast_m2 * d_m)
+        Y0_m = (-B + np.sqrt(B**2 - 4 * b_m * C)) / (2 * b_m)
+        compression = Ns_MN > 0
+        bas = np.where(compression, Y0_m, np.where(Ns_MN < 0, 1e-9, Y0_m))
+        haut = np.where(compression, h_m, Y0_m)
+
+        r_bas = residu(bas)
+        partielle = ~entierement_tendue & (
+            (Ns_MN == 0) | (np.sign(r_bas) != np.sign(residu(haut)))
+        )
+        for _ in range(nb_iterations):
+            milieu = (bas + haut) / 2
+            r_milieu = residu(milieu)
+            meme_signe = np.sign(r_milieu) == np.sign(r_bas)
+            bas = np.where(meme_signe, milieu, bas)
+            r_bas = np.where(meme_signe, r_milieu, r_bas)
+            haut = np.where(meme_signe, haut, milieu)
+        Y1_m = (bas + haut) / 2
+
+        # Traction sans racine : le béton ne participe pas
+        entierement_tendue = entierement_tendue | (~partielle & (Ns_MN < 0))
+
+        S, T = statique(Y1_m), moment(Y1_m)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            K_MN_m3 = (Ms_MNm * T + Ns_MN * S) / (T**2 + S**2)
+        sigma_b_pc = K_MN_m3 * Y1_m
+        sigma_s_pc = n * K_MN_m3 * (d_m - Y1_m)
+
+        # 4. Section entièrement comprimée : section homogène
+        B_m2 = b_m * h_m + n * (Ast_m2 + Asc_m2)
+        v_m = (b_m * h_m**2 / 2 + n * (Asc_m2 * dp_m + Ast_m2 * d_m)) / B_m2
+        I_m4 = (b_m * h_m**3 / 12 + b_m * h_m * (h_m / 2 - v_m)**2
+                + n * Asc_m2 * (v_m - dp_m)**2 + n * Ast_m2 * (d_m - v_m)**2)
+        M_G = Ms_MNm + Ns_MN * (v_m - h_m / 2)
+        sigma_b_ec = Ns_MN / B_m2 + M_G * v_m / I_m4
+        sigma_s_ec = -n * (Ns_MN / B_m2 - M_G * (d_m - v_m) / I_m4)
+
+        # 5. Section entièrement tendue : aciers seuls
+        T_MN = -Ns_MN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma_s_et = T_MN * (h_m / 2 - dp_m + e0_m) / ((d_m - dp_m) * Ast_m2)
+
+        etat = np.where(entierement_tendue, 'ET', np.where(partielle, 'PC', 'EC'))
+        sigma_b_MPa = np.select([entierement_tendue, partielle], [0.0, sigma_b_pc], default=sigma_b_ec)
+        sigma_s_MPa = np.select([entierement_tendue, partielle], [sigma_s_et, sigma_s_pc], default=sigma_s_ec)
+
+        return {
+            'etat': etat,
+            'Y1_m': np.where(partielle, Y1_m, np.nan),
+            'sigma_b_MPa': sigma_b_MPa,
+            'sigma_s_MPa': sigma_s_MPa,
+            'sigma_b_adm_MPa': sigma_b_adm_MPa,
+            'sigma_s_adm_MPa': sigma_s_adm_MPa,
+            'verif_beton': sigma_b_MPa <= sigma_b_adm_MPa,
+            'verif_acier': sigma_s_MPa <= sigma_s_adm_MPa,
+        }
+
+
+class DiagrammeInteraction:
+    """
+    Diagramme d'interaction ELU (N, M) d'une section rectangulaire armée
+
+    Le diagramme est calculé une seule fois (pivots A, B et C, diagramme
+    rectangulaire simplifié du béton sur 0.8·y) puis interrogé par
+    interpolation pour autant de couples (N, M) que nécessaire.
+    """
+
+    def __init__(self, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type, Ast_m2, Asc_m2, nb_points=200):
+        self.b_m = float(b_m)
+        self.h_m = float(h_m)
+        self.sigma_bc_MPa = (0.85 * float(fc28_MPa)) / 1.5
+        self.fsu_MPa = float(acier_type) / 1.15
+
+        # Branche M > 0 (fibre supérieure comprimée) et branche M < 0 (symétrique)
+        self.N_sup, self.M_sup = self._branche(
+            [(float(dp_m), float(Asc_m2)), (float(d_m), float(Ast_m2))], nb_points
+        )
+        N_inf, M_inf = self._branche(
+            [(self.h_m - float(d_m), float(Ast_m2)), (self.h_m - float(dp_m), float(Asc_m2))],
+            nb_points,
+        )
+        self.N_inf, self.M_inf = N_inf, -M_inf
+
+        self.N_min_MN = max(self.N_sup[0], self.N_inf[0])
+        self.N_max_MN = min(self.N_sup[-1], self.N_inf[-1])
+
+    def _branche(self, nappes, nb_points):
+        """Points (N, M) de la frontière pour une fibre supérieure comprimée"""
+        h = self.h_m
+        d_max = max(x for x, _ in nappes)
+        tiers = nb_points // 3
+
+        # 1. Déformations (‰, compression positive) en fonction de la profondeur x
+        # Pivot A : εs = -10‰ à d_max, ε supérieure de -10‰ à 3.5‰
+        eps_a = np.linspace(-10.0, 3.5, tiers, endpoint=False)
+        # Pivot B : εbc = 3.5‰, axe neutre de αAB·d à h
+        y_b = np.linspace(3.5 / 13.5 * d_max, h, tiers, endpoint=False)
+        # Pivot C : 2‰ à 3h/7, ε supérieure de 3.5‰ à 2‰
+        eps_c = np.linspace(3.5, 2.0, nb_points - 2 * tiers)
+
+        def deformation(x):
+            pivot_a = eps_a[:, None] + (-10.0 - eps_a[:, None]) * x / d_max
+            pivot_b = 3.5 * (1 - x / y_b[:, None])
+            pivot_c = eps_c[:, None] - (eps_c[:, None] - 2.0) * x / (3 * h / 7)
+            return np.concatenate([pivot_a, pivot_b, pivot_c])
+
+        # 2. Hauteur comprimée du béton
+        y_a = np.where(eps_a > 0, eps_a * d_max / np.maximum(eps_a + 10.0, 1e-9), 0.0)
+        a_m = np.minimum(0.8 * np.concatenate([y_a, y_b, np.full(eps_c.shape, np.inf)]), h)
+
+        # 3. Efforts résistants
+        Fc = self.b_m * a_m * self.sigma_bc_MPa
+        N = Fc.copy()
+        M = Fc * (h / 2 - a_m / 2)
+        for x, A in nappes:
+            eps = deformation(np.array([x]))[:, 0]
+            sigma = np.clip(E_ACIER_MPA * eps / 1000.0, -self.fsu_MPa, self.fsu_MPa)
+            N += A * sigma
+            M += A * sigma * (h / 2 - x)
+
+        ordre = np.argsort(N, kind='stable')
+        return N[ordre], M[ordre]
+
+    def moments_resistants(self, N_MN):
+        """Moments résistants (M_min, M_max) pour des efforts normaux donnés"""
+        N_MN = np.asarray(N_MN, dtype=float)
+        M_max = np.interp(N_MN, self.N_sup, self.M_sup, left=np.nan, right=np.nan)
+        M_min = np.interp(N_MN, self.N_inf, self.M_inf, left=np.nan, right=np.nan)
+        return M_min, M_max
+
+    def verifier(self, N_MN, M_MNm):
+        """
+        Vérifie un ensemble de couples (N, M)
+
+        Retourne un dict de tableaux : ok (point intérieur au diagramme) et
+        taux (M / M résistant du même signe, inf hors plage d'effort normal)
+        """
+        N_MN = np.atleast_1d(np.asarray(N_MN, dtype=float))
+        M_MNm = np.atleast_1d(np.asarray(M_MNm, dtype=float))
+        M_min, M_max = self.moments_resistants(N_MN)
+
+        hors_plage = np.isnan(M_max) | np.isnan(M_min)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            taux = np.where(M_MNm >= 0, M_MNm / M_max, M_MNm / M_min)
+        taux = np.where(hors_plage, np.inf, np.where(np.isnan(taux), 0.0, taux))
+        ok = ~hors_plage & (M_MNm <= M_max) & (M_MNm >= M_min)
+        return {'ok': ok, 'taux': taux, 'M_min_MNm': M_min, 'M_max_MNm': M_max}
@@ -0,0 +1,183 @@
+# =======================================================
+# MÉTRÉ DES ACIERS (NOMENCLATURE) - RAHANI Soulaimane
+# =======================================================
+
+import csv
+
+import numpy as np
+
+from ferraillage import MASSE_VOLUMIQUE_ACIER, index_defaut
+
+
+class MetreAcier:
+    """
+    Agrégation en flux du métré des aciers d'un projet
+
+    Les lots de poutres (résultats ELU + dispositions de barres + longueurs)
+    sont consommés au fil de l'eau : seuls les cumuls par
+    (niveau, famille, diamètre) sont conservés, la mémoire reste donc
+    bornée par le nombre de groupes et non par le nombre de poutres.
+    """
+
+    COLONNES = ('niveau', 'famille', 'diametre_mm', 'nb_barres', 'longueur_m', 'masse_kg')
+
+    def __init__(self, coefficient_chutes=1.0):
+        self.coefficient_chutes = float(coefficient_chutes)
+        self.nb_poutres = 0
+        # Poutres écartées faute de disposition de barres (identifiants ou rangs)
+        self.non_metrees = []
+        # (niveau, famille, φ) -> [nb_barres, longueur_m, masse_kg]
+        self._cumuls = {}
+
+    # ============================================
+    # 1. ALIMENTATION
+    # ============================================
+
+    def ajouter(self, lot_tendu, longueur_m, niveau, famille, lot_comprime=None):
+        """
+        Ajoute un lot de poutres à partir de dispositions déjà choisies
+
+        lot_tendu / lot_comprime: dicts renvoyés par
+        IndexFerraillage.selectionner_lot (n1, phi1_mm, n2, phi2_mm)
+        """
+        longueur_m = np.atleast_1d(np.asarray(longueur_m, dtype=float))
+        n = np.atleast_1d(lot_tendu['n1']).shape[0]
+        longueur_m = np.broadcast_to(longueur_m, (n,))
+        niveau = np.broadcast_to(np.atleast_1d(np.asarray(niveau)), (n,))
+        famille = np.broadcast_to(np.atleast_1d(np.asarray(famille)), (n,))
+
+        # 1. Une ligne par (poutre, diamètre)
+        lots = [lot_tendu] if lot_comprime is None else [lot_tendu, lot_comprime]
+        nb, phi, lignes = [], [], []
+        for lot in lots:
+            for cle_n, cle_phi in (('n1', 'phi1_mm'), ('n2', 'phi2_mm')):
+                nb.append(np.asarray(lot[cle_n], dtype=np.int64))
+                phi.append(np.asarray(lot[cle_phi], dtype=np.int64))
+                lignes.append(np.arange(n))
+        nb = np.concatenate(nb)
+        phi = np.concatenate(phi)
+        lignes = np.concatenate(lignes)
+
+        utile = (nb > 0) & (phi > 0)
+        nb, phi, lignes = nb[utile], phi[utile], lignes[utile]
+        self.nb_poutres += n
+        if nb.size == 0:
+            return
+
+        # 2. Codage des clés de regroupement
+        niveaux, code_niv = np.unique(niveau[lignes], return_inverse=True)
+        familles, code_fam = np.unique(famille[lignes], return_inverse=True)
+        diametres, code_phi = np.unique(phi, return_inverse=True)
+        code = (code_niv * familles.size + code_fam) * diametres.size + code_phi
+
+        # 3. Sommes par groupe
+        longueur = nb * longueur_m[lignes] * self.coefficient_chutes
+        masse = longueur * np.pi * (phi / 1000.0) ** 2 / 4 * MASSE_VOLUMIQUE_ACIER
+        groupes, inverse = np.unique(code, return_inverse=True)
+        somme_nb = np.bincount(inverse, weights=nb)
+        somme_long = np.bincount(inverse, weights=longueur)
+        somme_masse = np.bincount(inverse, weights=masse)
+
+        # 4. Fusion dans les cumuls
+        for k, g in enumerate(groupes):
+            i_phi = g % diametres.size
+            i_fam = (g // diametres.size) % familles.size
+            i_niv = g // (diametres.size * familles.size)
+            cle = (niveaux[i_niv].item(), familles[i_fam].item(), int(diametres[i_phi]))
+            cumul = self._cumuls.setdefault(cle, [0, 0.0, 0.0])
+            cumul[0] += int(somme_nb[k])
+            cumul[1] += float(somme_long[k])
+            cumul[2] += float(somme_masse[k])
+
+    def ajouter_poutres(self, Ast_m2, b_m, dp_m, longueur_m, niveau, famille,
+                        Asc_m2=None, index=None, ids=None):
+        """
+        Ajoute un lot de résultats ELU en choisissant le ferraillage
+
+        Les poutres sans disposition de barres (ou d'Ast / Asc non fini) ne
+        sont pas métrées : leur identifiant (ids, à défaut leur rang dans le
+        flux) est ajouté à non_metrees et le reste du lot est traité.
+        """
+        index = index_defaut() if index is None else index
+        lot_tendu = index.selectionner_lot(Ast_m2, b_m, dp_m)
+        n = lot_tendu['trouve'].shape[0]
+        introuvable = ~lot_tendu['trouve'] | ~np.isfinite(
+            np.broadcast_to(np.asarray(Ast_m2, dtype=float), (n,))
+        )
+        lot_comprime = None
+        if Asc_m2 is not None:
+            Asc_m2 = np.broadcast_to(np.asarray(Asc_m2, dtype=float), (n,))
+            lot_comprime = index.selectionner_lot(Asc_m2, b_m, dp_m)
+            # Pas d'aciers comprimés pour les armatures simples
+            requis = Asc_m2 > 0
+            for cle in ('n1', 'n2'):
+                lot_comprime[cle] = np.where(requis, lot_comprime[cle], 0)
+            introuvable = introuvable | (requis & ~lot_comprime['trouve']) | ~np.isfinite(Asc_m2)
+
+        if np.any(introuvable):
+            rangs = np.nonzero(introuvable)[0]
+            if ids is None:
+                # Rang dans le flux : poutres déjà métrées ou écartées
+                self.non_metrees.extend((self.nb_poutres + len(self.non_metrees) + rangs).tolist())
+            else:
+                self.non_metrees.extend(np.broadcast_to(np.asarray(ids), (n,))[rangs].tolist())
+            garder = ~introuvable
+            lot_tendu = {c: v[garder] for c, v in lot_tendu.items()}
+            if lot_comprime is not None:
+                lot_comprime = {c: v[garder] for c, v in lot_comprime.items()}
+            longueur_m, niveau, famille = (
+                np.broadcast_to(np.atleast_1d(np.asarray(x)), (n,))[garder]
+                for x in (longueur_m, niveau, famille)
+            )
+        self.ajouter(lot_tendu, longueur_m, niveau, famille, lot_comprime)
+
+    def consommer(self, flux):
+        """Consomme un itérable de lots (dicts d'arguments de ajouter_poutres)"""
+        for lot in flux:
+            self.ajouter_poutres(**lot)
+        return self
+
+    # ============================================
+    # 2. RESTITUTION
+    # ============================================
+
+    def totaux(self, par=('niveau', 'famille', 'diametre_mm')):
+        """
+        Totaux regroupés selon les colonnes demandées
+
+        Retourne une liste de dicts triée par clé de regroupement
+        """
+        positions = [self.COLONNES.index(c) for c in par]
+        regroupe = {}
+        for cle, (nb, longueur, masse) in self._cumuls.items():
+            sous_cle = tuple(cle[p] for p in positions)
+            cumul = regroupe.setdefault(sous_cle, [0, 0.0, 0.0])
+            cumul[0] += nb
+            cumul[1] += longueur
+            cumul[2] += masse
+
+        def ordre(c):
+            # Diamètres triés numériquement, libellés alphabétiquement
+            return tuple((0, v, '') if isinstance(v, (int, float)) else (1, 0, str(v)) for v in c)
+
+        lignes = []
+        for sous_cle in sorted(regroupe, key=ordre):
+            nb, longueur, masse = regroupe[sous_cle]
+            ligne = dict(zip(par, sous_cle))
+            ligne['nb_barres'] = nb
+            ligne['longueur_m'] = round(longueur, 2)
+            ligne['masse_kg'] = round(masse, 2)
+            lignes.append(ligne)
+        return lignes
+
+    def masse_totale_kg(self):
+        """Tonnage total du projet en kg"""
+        return sum(c[2] for c in self._cumuls.values())
+
+    def exporter_csv(self, chemin, par=('niveau', 'famille', 'diametre_mm')):
+        """Exporte les totaux regroupés au format CSV (séparateur ;)"""
+        colonnes = list(par) + ['nb_barres', 'longueur_m', 'masse_kg']
+        with open(chemin, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=colonnes, delimiter=';')
+            writer.writeheader()
+            writer.writerows(self.totaux(par))
@@ -0,0 +1,375 @@
+# =======================================================
+# NOTES DE CALCUL PAR LOTS (HTML / PDF) - RAHANI Soulaimane
+# =======================================================
+#
+# Lancement :  python notes_calcul.py poutres.json notes/ [--pdf]
+#
+# Les poutres sont décrites comme pour le service HTTP :
+#   {"repere": "P1", "Mu_MNm": 0.32, "Ms_MNm": 0.177, "b_m": 0.25, "d_m": 0.45,
+#    "dp_m": 0.04, "fc28_MPa": 25, "acier_type": 500, "fissuration": "FP",
+#    "acier_ha": "HA"}   (+ "h_m", et "b0_m", "h0_m" pour une section en Té)
+#
+# Chaque processus rend un fichier HTML paginé (une page par poutre) en
+# écrivant les notes au fur et à mesure ; un index récapitule le dossier.
+
+import argparse
+import html
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from string import Template
+
+from calculs_bael import CalculBAEL, valider_poutre
+from ferraillage import index_defaut
+
+try:
+    import weasyprint
+    PDF_DISPONIBLE = True
+except ImportError:
+    PDF_DISPONIBLE = False
+
+
+# ============================================
+# 1. MODÈLES (compilés une seule fois)
+# ============================================
+
+MODELE_DEBUT = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>$titre</title>
+<style>
+  @page { size: A4; margin: 15mm; }
+  body { font-family: Arial, sans-serif; color: #1a202c; font-size: 11pt; }
+  .page { page-break-after: always; }
+  .page:last-child { page-break-after: auto; }
+  .entete { display: flex; justify-content: space-between; border-bottom: 2px solid #1a365d; }
+  h1 { color: #1a365d; font-size: 16pt; margin: 0 0 4px 0; }
+  h2 { color: #1a365d; font-size: 12pt; margin: 14px 0 4px 0; }
+  table { border-collapse: collapse; width: 100%; }
+  td, th { border: 1px solid #cbd5e0; padding: 3px 6px; text-align: left; }
+  th { background: #edf2f7; width: 45%; }
+  .ok { color: #276749; font-weight: bold; }
+  .non { color: #c53030; font-weight: bold; }
+  .pied { margin-top: 12px; font-size: 9pt; color: #718096; text-align: right; }
+</style>
+</head>
+<body>
+""")
+
+MODELE_NOTE = Template("""<section class="page">
+<div class="entete"><h1>Note de calcul – Poutre $repere</h1><span>$projet</span></div>
+<h2>1. Données</h2>
+<table>$donnees</table>
+<h2>2. ELU – État limite ultime ($section)</h2>
+<table>$elu</table>
+<h2>3. ELS – État limite de service</h2>
+<table>$els</table>
+<h2>4. Conclusion</h2>
+<p class="$classe_conclusion">$conclusion</p>
+<div class="pied">Note $numero – page $page / $nb_pages – $fichier – BAEL 91</div>
+</section>
+""")
+
+MODELE_LIGNE = Template("<tr><th>$label</th><td>$valeur</td></tr>")
+
+MODELE_FIN = "</body>\n</html>\n"
+
+MODELE_INDEX = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head><meta charset="utf-8"><title>$titre</title></head>
+<body style="font-family: Arial, sans-serif;">
+<h1 style="color: #1a365d;">$titre</h1>
+<p>$nb_poutres poutres – $nb_non_conformes non conforme(s) – généré en $duree s</p>
+<table border="1" cellpadding="4" style="border-collapse: collapse;">
+<tr><th>Fichier</th><th>Notes</th><th>Non conformes</th></tr>
+$lignes
+</table>
+</body>
+</html>
+""")
+
+
+def _lignes(display_order):
+    return "".join(
+        MODELE_LIGNE.substitute(label=l['label'], valeur=f"{l['value']} {l['unit']}".rstrip())
+        for l in display_order
+    )
+
+
+# ============================================
+# 2. NOTE D'UNE POUTRE
+# ============================================
+
+def calculer_poutre(poutre):
+    """
+    Calcul ELU + ELS détaillé d'une poutre (formules de CalculBAEL)
+
+    Retourne (resultats_elu, resultats_els) ; lève ValueError si la
+    section est sous-dimensionnée.
+    """
+    p = {c: float(poutre[c]) for c in ('Mu_MNm', 'Ms_MNm', 'b_m', 'd_m', 'dp_m', 'fc28_MPa')}
+    acier_type = int(poutre['acier_type'])
+    te = poutre.get('b0_m') is not None and poutre.get('h0_m') is not None
+
+    if te:
+        b0_m, h0_m = float(poutre['b0_m']), float(poutre['h0_m'])
+        elu = CalculBAEL.calcul_elu_te(
+            p['Mu_MNm'], p['b_m'], b0_m, h0_m, p['d_m'], p['dp_m'], p['fc28_MPa'], acier_type
+        )
+        els = CalculBAEL.verification_els_te(
+            p['Ms_MNm'], p['b_m'], b0_m, h0_m, p['d_m'], p['dp_m'], p['fc28_MPa'], acier_type,
+            poutre['fissuration'], poutre['acier_ha'], elu['Ast_m2'], elu.get('Asc_m2', 0.0)
+        )
+    else:
+        elu = CalculBAEL.calcul_elu(
+            p['Mu_MNm'], p['b_m'], p['d_m'], p['dp_m'], p['fc28_MPa'], acier_type
+        )
+        els = CalculBAEL.verification_els(
+            p['Ms_MNm'], p['b_m'], p['d_m'], p['dp_m'], p['fc28_MPa'], acier_type,
+            poutre['fissuration'], poutre['acier_ha'], elu['Ast_m2'], elu.get('Asc_m2', 0.0)
+        )
+    return elu, els
+
+
+def _donnees(poutre, te):
+    """Données d'une poutre valide, mises en forme"""
+    donnees = [
+        {'label': 'M<sub>u</sub>', 'value': f"{float(poutre['Mu_MNm']):.4f}", 'unit': 'MN.m'},
+        {'label': 'M<sub>ser</sub>', 'value': f"{float(poutre['Ms_MNm']):.4f}", 'unit': 'MN.m'},
+        {'label': 'b', 'value': f"{float(poutre['b_m']) * 100:.1f}", 'unit': 'cm'},
+    ]
+    if te:
+        donnees += [
+            {'label': 'b<sub>0</sub>', 'value': f"{float(poutre['b0_m']) * 100:.1f}", 'unit': 'cm'},
+            {'label': 'h<sub>0</sub>', 'value': f"{float(poutre['h0_m']) * 100:.1f}", 'unit': 'cm'},
+        ]
+    if poutre.get('h_m') is not None:
+        donnees.append({'label': 'h', 'value': f"{float(poutre['h_m']) * 100:.1f}", 'unit': 'cm'})
+    donnees += [
+        {'label': 'd', 'value': f"{float(poutre['d_m']) * 100:.1f}", 'unit': 'cm'},
+        {'label': "d'", 'value': f"{float(poutre['dp_m']) * 100:.1f}", 'unit': 'cm'},
+        {'label': 'f<sub>c28</sub>', 'value': f"{float(poutre['fc28_MPa']):.0f}", 'unit': 'MPa'},
+        {'label': 'Acier', 'value': f"FeE{int(float(poutre['acier_type']))} {poutre['acier_ha']}", 'unit': ''},
+        {'label': 'Fissuration', 'value': poutre['fissuration'], 'unit': ''},
+    ]
+    return donnees
+
+
+def _donnees_brutes(poutre):
+    """Données d'une poutre invalide, telles que reçues"""
+    if not isinstance(poutre, dict):
+        return [{'label': 'Poutre', 'value': html.escape(repr(poutre)), 'unit': ''}]
+    return [{'label': html.escape(str(c)), 'value': html.escape(str(v)), 'unit': ''}
+            for c, v in poutre.items()]
+
+
+def _resultats(poutre, te):
+    """Lignes ELU / ELS, conformité et conclusion d'une poutre valide"""
+    elu, els = calculer_poutre(poutre)
+    ferraillage = []
+    for label, aire_m2 in (('A<sub>st</sub>', elu['Ast_m2']), ('A<sub>sc</sub>', elu.get('Asc_m2', 0.0))):
+        if aire_m2 <= 0:
+            continue
+        try:
+            choix = index_defaut().selectionner(
+                aire_m2, float(poutre.get('b0_m') if te else poutre['b_m']), float(poutre['dp_m'])
+            )
+            valeur = f"{choix['designation']} ({choix['As_cm2']:.2f} cm², {choix['nb_lits']} lit(s))"
+        except ValueError:
+            valeur = "aucune disposition possible"
+        ferraillage.append({'label': f"Ferraillage {label}", 'value': valeur, 'unit': ''})
+
+    lignes_elu = _lignes(elu['display_order'] + ferraillage)
+    lignes_els = _lignes(els['display_order'] + [
+        {'label': 'Cas', 'value': f"{els['cas']} – {els['message_cas']}", 'unit': ''},
+    ])
+    conforme = els['verif_beton'] == 'OK' and els['verif_acier'] == 'OK'
+    conclusion = ("Section justifiée à l'ELU et à l'ELS" if conforme
+                  else "Contraintes ELS dépassées : redimensionner la section")
+    return lignes_elu, lignes_els, conforme, conclusion
+
+
+def _resultats_erreur(erreur):
+    """Note non conforme d'une poutre en erreur"""
+    message = html.escape(str(erreur) or type(erreur).__name__)
+    lignes_elu = _lignes([{'label': 'Erreur', 'value': message, 'unit': ''}])
+    lignes_els = _lignes([{'label': 'Vérification', 'value': 'non effectuée', 'unit': ''}])
+    return lignes_elu, lignes_els, False, f"Section non justifiée : {message}"
+
+
+def rendre_note(poutre, numero, page, nb_pages, fichier, projet=""):
+    """
+    HTML d'une note de calcul (une page)
+
+    Une poutre invalide ou en erreur de calcul donne une note non conforme
+    (l'erreur y est affichée) sans interrompre le dossier.
+    Retourne (html, conforme)
+    """
+    est_dict = isinstance(poutre, dict)
+    te = est_dict and poutre.get('b0_m') is not None and poutre.get('h0_m') is not None
+
+    try:
+        valider_poutre(poutre)
+    except ValueError as e:
+        donnees = _donnees_brutes(poutre)
+        lignes_elu, lignes_els, conforme, conclusion = _resultats_erreur(e)
+    else:
+        donnees = _donnees(poutre, te)
+        try:
+            lignes_elu, lignes_els, conforme, conclusion = _resultats(poutre, te)
+        except Exception as e:
+            lignes_elu, lignes_els, conforme, conclusion = _resultats_erreur(e)
+
+    note = MODELE_NOTE.substitute(
+        repere=html.escape(str(poutre.get('repere', numero) if est_dict else numero)),
+        projet=html.escape(projet),
+        donnees=_lignes(donnees),
+        section='section en Té' if te else 'section rectangulaire',
+        elu=lignes_elu,
+        els=lignes_els,
+        classe_conclusion='ok' if conforme else 'non',
+        conclusion=conclusion,
+        numero=numero,
+        page=page,
+        nb_pages=nb_pages,
+        fichier=html.escape(fichier),
+    )
+    return note, conforme
+
+
+# ============================================
+# 3. FICHIERS PAGINÉS ET GÉNÉRATION PARALLÈLE
+# ============================================
+
+def rendre_fichier(chemin, poutres, premier_numero=1, projet="", pdf=False):
+    """
+    Écrit un fichier HTML paginé (une page par poutre), note après note
+
+    Retourne un résumé : fichier, nb_notes, nb_non_conformes
+    """
+    nom = os.path.basename(chemin)
+    temporaire = chemin + '.tmp'
+    nb_non_conformes = 0
+    with open(temporaire, 'w', encoding='utf-8') as f:
+        f.write(MODELE_DEBUT.substitute(titre=html.escape(f"{projet} – {nom}")))
+        for page, poutre in enumerate(poutres, start=1):
+            note, conforme = rendre_note(
+                poutre, premier_numero + page - 1, page, len(poutres), nom, projet
+            )
+            f.write(note)
+            nb_non_conformes += not conforme
+        f.write(MODELE_FIN)
+    os.replace(temporaire, chemin)
+
+    if pdf:
+        weasyprint.HTML(filename=chemin).write_pdf(os.path.splitext(chemin)[0] + '.pdf')
+
+    return {'fichier': nom, 'nb_notes': len(poutres), 'nb_non_conformes': nb_non_conformes}
+
+
+class GenerateurNotes:
+    """
+    Génération parallèle des notes de calcul d'un ensemble de poutres
+
+    Les poutres sont découpées en fichiers de `poutres_par_fichier` notes,
+    rendus par un pool de processus ; la liste des poutres peut être un
+    itérable quelconque (lu au fur et à mesure).
+    """
+
+    def __init__(self, dossier, projet="Projet BAEL", poutres_par_fichier=100,
+                 nb_processus=None, pdf=False):
+        if pdf and not PDF_DISPONIBLE:
+            raise ValueError("Export PDF indisponible : installer weasyprint")
+        self.dossier = dossier
+        self.projet = projet
+        self.poutres_par_fichier = int(poutres_par_fichier)
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.pdf = pdf
+
+    def _paquets(self, poutres):
+        iterateur = iter(poutres)
+        numero = 1
+        for k in itertools.count(1):
+            paquet = list(itertools.islice(iterateur, self.poutres_par_fichier))
+            if not paquet:
+                return
+            yield os.path.join(self.dossier, f"notes_{k:05d}.html"), paquet, numero
+            numero += len(paquet)
+
+    def generer(self, poutres, progression=None):
+        """
+        Rend toutes les notes puis l'index (index.html)
+
+        progression: fonction optionnelle (nb_notes_rendues) appelée à chaque fichier.
+        Retourne la liste des résumés de fichiers.
+        """
+        os.makedirs(self.dossier, exist_ok=True)
+        debut = time.perf_counter()
+        resumes, en_cours, nb_rendues = [], [], 0
+
+        with ProcessPoolExecutor(max_workers=self.nb_processus) as pool:
+            # Nombre de paquets en vol borné : la liste des poutres n'est jamais
+            # entièrement matérialisée
+            for chemin, paquet, numero in self._paquets(poutres):
+                en_cours.append(pool.submit(
+                    rendre_fichier, chemin, paquet, numero, self.projet, self.pdf
+                ))
+                if len(en_cours) >= 2 * self.nb_processus:
+                    resume = en_cours.pop(0).result()
+                    resumes.append(resume)
+                    nb_rendues += resume['nb_notes']
+                    if progression:
+                        progression(nb_rendues)
+            for futur in en_cours:
+                resume = futur.result()
+                resumes.append(resume)
+                nb_rendues += resume['nb_notes']
+                if progression:
+                    progression(nb_rendues)
+
+        self._ecrire_index(resumes, time.perf_counter() - debut)
+        return resumes
+
+    def _ecrire_index(self, resumes, duree_s):
+        lignes = "\n".join(
+            f"<tr><td><a href=\"{r['fichier']}\">{r['fichier']}</a></td>"
+            f"<td>{r['nb_notes']}</td><td>{r['nb_non_conformes']}</td></tr>"
+            for r in resumes
+        )
+        with open(os.path.join(self.dossier, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(MODELE_INDEX.substitute(
+                titre=html.escape(f"Notes de calcul – {self.projet}"),
+                nb_poutres=sum(r['nb_notes'] for r in resumes),
+                nb_non_conformes=sum(r['nb_non_conformes'] for r in resumes),
+                duree=f"{duree_s:.1f}",
+                lignes=lignes,
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notes de calcul BAEL par lots")
+    parser.add_argument('poutres', help="fichier JSON : liste de poutres ou {\"poutres\": [...]}")
+    parser.add_argument('dossier', help="dossier de sortie")
+    parser.add_argument('--projet', default="Projet BAEL")
+    parser.add_argument('--par-fichier', type=int, default=100, help="notes par fichier")
+    parser.add_argument('--processus', type=int, default=None)
+    parser.add_argument('--pdf', action='store_true', help="export PDF (weasyprint)")
+    args = parser.parse_args()
+
+    with open(args.poutres, encoding='utf-8') as f:
+        poutres = json.load(f)
+    if isinstance(poutres, dict):
+        poutres = poutres.get('poutres', [])
+
+    generateur = GenerateurNotes(args.dossier, args.projet, args.par_fichier, args.processus, args.pdf)
+    resumes = generateur.generer(
+        poutres, progression=lambda n: print(f"\r{n}/{len(poutres)} notes", end='', flush=True)
+    )
+    print(f"\n{len(resumes)} fichier(s) dans {args.dossier}")
+
+
+if __name__ == "__main__":
+    main()
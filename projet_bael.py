@@ -0,0 +1,153 @@
+# =======================================================
+# PROJET BAEL : HISTORIQUE DES VARIANTES - RAHANI Soulaimane
+# =======================================================
+
+import io
+import time
+
+import numpy as np
+
+# Données de saisie conservées pour chaque variante (même clés que donnees_saisie)
+COLONNES_SAISIE = {
+    'Mu': 'f8', 'Ms': 'f8', 'b': 'f8', 'h': 'f8', 'd': 'f8', 'dp': 'f8',
+    'fc28': 'f8', 'acier': 'i2', 'fissuration': 'U3', 'acier_ha': 'U2',
+    'section': 'U13', 'b0': 'f8', 'h0': 'f8',
+}
+
+# Résultats ELU / ELS résumés (les détails se recalculent depuis la saisie)
+COLONNES_RESULTATS = {
+    'mu': 'f4', 'pivot': 'U1', 'type': 'U7', 'z_cm': 'f4', 'Ast_cm2': 'f4', 'Asc_cm2': 'f4',
+    'Y1_cm': 'f4', 'I_cm4': 'f4', 'sigma_b_MPa': 'f4', 'sigma_s_MPa': 'f4',
+    'sigma_b_adm_MPa': 'f4', 'sigma_s_adm_MPa': 'f4', 'cas': 'i1',
+}
+
+COLONNES_META = {'nom': 'U40', 'horodatage': 'f8'}
+
+VERSION_FORMAT = 1
+
+
+class ProjetBAEL:
+    """
+    Historique colonnaire des variantes calculées pendant une session
+
+    Chaque variante occupe une ligne de tableaux NumPy typés (quelques
+    centaines d'octets) ; le projet s'enregistre en un seul fichier .npz
+    binaire et se recharge sans pickle.
+    """
+
+    COLONNES = {**COLONNES_META, **COLONNES_SAISIE, **COLONNES_RESULTATS}
+
+    def __init__(self, nom="Projet BAEL", capacite=16):
+        self.nom = nom
+        self.nb_variantes = 0
+        self._colonnes = {c: np.zeros(capacite, dtype=t) for c, t in self.COLONNES.items()}
+
+    def __len__(self):
+        return self.nb_variantes
+
+    # ============================================
+    # 1. AJOUT ET LECTURE DES VARIANTES
+    # ============================================
+
+    def ajouter_variante(self, donnees_saisie, resultats_elu, resultats_els, nom=None):
+        """Ajoute une variante et retourne son indice"""
+        i = self.nb_variantes
+        if i == len(self._colonnes['nom']):
+            for c, valeurs in self._colonnes.items():
+                extension = np.zeros(max(len(valeurs), 1), dtype=valeurs.dtype)
+                self._colonnes[c] = np.concatenate([valeurs, extension])
+
+        ligne = {'nom': nom or f"Variante {i + 1}", 'horodatage': time.time()}
+        for c in COLONNES_SAISIE:
+            ligne[c] = donnees_saisie.get(c, np.nan if COLONNES_SAISIE[c].startswith('f') else '')
+        ligne['section'] = donnees_saisie.get('section', 'rectangulaire')
+        for c in COLONNES_RESULTATS:
+            source = resultats_els if c in resultats_els else resultats_elu
+            ligne[c] = source.get(c, 0)
+
+        for c, valeur in ligne.items():
+            self._colonnes[c][i] = valeur
+        self.nb_variantes += 1
+        return i
+
+    def supprimer_variante(self, i):
+        """Supprime une variante (les suivantes sont décalées)"""
+        for c, valeurs in self._colonnes.items():
+            valeurs[i:self.nb_variantes - 1] = valeurs[i + 1:self.nb_variantes].copy()
+        self.nb_variantes -= 1
+
+    def colonne(self, nom):
+        """Vue sur une colonne de l'historique"""
+        return self._colonnes[nom][:self.nb_variantes]
+
+    def noms(self):
+        return [str(n) for n in self.colonne('nom')]
+
+    def donnees_saisie(self, i):
+        """Reconstitue le dict donnees_saisie d'une variante (unités SI)"""
+        data = {}
+        for c in COLONNES_SAISIE:
+            valeur = self._colonnes[c][i].item()
+            if c in ('b0', 'h0') and (valeur != valeur):  # NaN : section rectangulaire
+                continue
+            data[c] = valeur
+        data.update({
+            'Mu_unite': 'MN.m', 'Ms_unite': 'MN.m', 'b_unite': 'm',
+            'h_unite': 'm', 'd_unite': 'm', 'dp_unite': 'm',
+        })
+        return data
+
+    def comparer(self, indices=None):
+        """
+        Tableau comparatif des variantes (dict colonne → liste de valeurs)
+
+        Les colonnes de résultats sont arrondies comme à l'affichage.
+        """
+        indices = list(range(self.nb_variantes)) if indices is None else list(indices)
+        tableau = {}
+        for c in ('nom', 'section', 'b', 'h', 'd', 'Mu', 'Ms', 'fc28', 'acier') + tuple(COLONNES_RESULTATS):
+            valeurs = self._colonnes[c][indices]
+            if valeurs.dtype.kind == 'f':
+                valeurs = np.round(valeurs.astype(float), 4)
+            tableau[c] = valeurs.tolist()
+        return tableau
+
+    # ============================================
+    # 2. FICHIER BINAIRE
+    # ============================================
+
+    def vers_octets(self):
+        """Sérialise le projet au format .npz compressé"""
+        tampon = io.BytesIO()
+        np.savez_compressed(
+            tampon,
+            _version=np.array(VERSION_FORMAT),
+            _nom=np.array(self.nom),
+            **{c: self.colonne(c) for c in self.COLONNES},
+        )
+        return tampon.getvalue()
+
+    def enregistrer(self, chemin):
+        with open(chemin, 'wb') as f:
+            f.write(self.vers_octets())
+
+    @classmethod
+    def depuis_octets(cls, octets):
+        """Recharge un projet sérialisé par vers_octets"""
+        with np.load(io.BytesIO(octets), allow_pickle=False) as fichier:
+            if int(fichier['_version']) > VERSION_FORMAT:
+                raise ValueError("Fichier projet d'une version plus récente")
+            projet = cls(nom=str(fichier['_nom']), capacite=1)
+            n = len(fichier['nom'])
+            for c, t in cls.COLONNES.items():
+                if c in fichier.files:
+                    projet._colonnes[c] = fichier[c].astype(t)
+                else:
+                    projet._colonnes[c] = np.zeros(n, dtype=t)
+            projet.nb_variantes = n
+        return projet
+
+    @classmethod
+    def charger(cls, chemin):
+        with open(chemin, 'rb') as f:
+            return cls.depuis_octets(f.read())
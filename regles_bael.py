@@ -0,0 +1,312 @@
+# =======================================================
+# MOTEUR DE RÈGLES BAEL (VECTORISÉ) - RAHANI Soulaimane
+# =======================================================
+#
+# Chaque règle est une fonction vectorisée qui reçoit les colonnes d'un bloc
+# de poutres et retourne le masque des poutres en infraction. Toutes les
+# règles sont évaluées dans la même passe sur chaque bloc ; les grandeurs
+# dérivées (ft28, bw, aire de béton, espacements...) sont calculées une
+# seule fois par bloc et partagées entre règles.
+
+import numpy as np
+
+from backends_bael import calcul_elu_els_lot
+from ferraillage import index_defaut
+
+# Pourcentage maximal d'acier rapporté à la section de béton
+RATIO_ACIER_MAX = 0.04
+
+# Granulat (m) pour l'espacement minimal des barres
+DG_DEFAUT_M = 0.025
+
+# Fissuration → (diamètre minimal (mm), espacement maximal (m), multiple de h)
+LIMITES_FISSURATION = {
+    'FP': (6, 0.25, 2.0),
+    'FTP': (8, 0.20, 1.5),
+}
+
+
+# ============================================
+# 1. GRANDEURS DÉRIVÉES
+# ============================================
+
+DERIVEES = {}
+
+
+def derivee(nom):
+    """Déclare une grandeur dérivée, calculée à la demande une fois par bloc"""
+    def decorateur(fonction):
+        DERIVEES[nom] = fonction
+        return fonction
+    return decorateur
+
+
+class _Colonnes(dict):
+    """Colonnes d'un bloc ; les grandeurs dérivées sont mémorisées au premier accès"""
+
+    def __missing__(self, nom):
+        if nom not in DERIVEES:
+            raise KeyError(nom)
+        valeur = DERIVEES[nom](self)
+        self[nom] = valeur
+        return valeur
+
+
+@derivee('ft28_MPa')
+def _ft28(c):
+    return 0.6 + 0.06 * c['fc28_MPa']
+
+
+@derivee('bw_m')
+def _largeur_ame(c):
+    """Largeur de l'âme (b0 pour une section en Té, b sinon)"""
+    if 'b0_m' not in c:
+        return c['b_m']
+    return np.where(np.isnan(c['b0_m']), c['b_m'], c['b0_m'])
+
+
+@derivee('h_calcul_m')
+def _hauteur(c):
+    """Hauteur totale (d + d' à défaut de h)"""
+    h = c['h_m'] if 'h_m' in c else np.full(c['d_m'].shape, np.nan)
+    return np.where(np.isnan(h), c['d_m'] + c['dp_m'], h)
+
+
+@derivee('aire_beton_m2')
+def _aire_beton(c):
+    aire = c['bw_m'] * c['h_calcul_m']
+    if 'h0_m' in c:
+        aire = aire + np.nan_to_num((c['b_m'] - c['bw_m']) * c['h0_m'])
+    return aire
+
+
+@derivee('phi_max_m')
+def _phi_max(c):
+    return np.maximum(c['phi1_mm'], c['phi2_mm']) / 1000.0
+
+
+@derivee('phi_min_mm')
+def _phi_min(c):
+    return np.where(c['n2'] > 0, np.minimum(c['phi1_mm'], c['phi2_mm']), c['phi1_mm'])
+
+
+@derivee('entraxe_m')
+def _entraxe(c):
+    """Entraxe des barres du lit le plus chargé (même convention que ferraillage.py)"""
+    n_total = c['n1'] + c['n2']
+    par_lit = -(-n_total // np.maximum(c['nb_lits'], 1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(
+            par_lit >= 2, (c['bw_m'] - 2 * c['dp_m']) / (par_lit - 1), np.nan
+        )
+
+
+# ============================================
+# 2. MOTEUR
+# ============================================
+
+class MoteurRegles:
+    """
+    Registre de règles vectorisées et évaluation en une passe par bloc
+
+    evaluer() retourne la matrice booléenne poutres × règles des
+    infractions ; une règle dont une colonne manque au lot n'est pas
+    évaluée (colonne à False, code listé dans 'non_evaluees').
+    """
+
+    def __init__(self):
+        self._regles = {}
+
+    def regle(self, code, article, message, colonnes):
+        """
+        Décorateur d'enregistrement : fonction(colonnes) → masque des infractions
+
+        message: exigence vérifiée par la règle (ex: "σb ≤ σb admissible")
+        """
+        def decorateur(fonction):
+            if code in self._regles:
+                raise ValueError(f"Règle déjà enregistrée : {code}")
+            self._regles[code] = {
+                'article': article,
+                'message': message,
+                'colonnes': tuple(colonnes),
+                'fonction': fonction,
+            }
+            return fonction
+        return decorateur
+
+    def retirer(self, code):
+        del self._regles[code]
+
+    @property
+    def codes(self):
+        return list(self._regles)
+
+    def description(self, code):
+        regle = self._regles[code]
+        return f"{regle['article']} – {regle['message']}"
+
+    def evaluer(self, colonnes, codes=None, taille_bloc=1 << 16):
+        """
+        Évalue les règles sur un lot (dict colonne → tableau)
+
+        Retourne: codes, violations (n × nb_règles), conforme (n),
+        nb_infractions (par règle), non_evaluees
+        """
+        codes = self.codes if codes is None else list(codes)
+        colonnes = {c: np.atleast_1d(np.asarray(v)) for c, v in colonnes.items()}
+        n = max(len(v) for v in colonnes.values())
+        colonnes = {c: np.broadcast_to(v, (n,)) for c, v in colonnes.items()}
+
+        actives = [k for k, code in enumerate(codes)
+                   if all(c in colonnes for c in self._regles[code]['colonnes'])]
+        non_evaluees = [codes[k] for k in range(len(codes)) if k not in actives]
+
+        violations = np.zeros((n, len(codes)), dtype=bool)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for debut in range(0, n, taille_bloc):
+                fin = min(debut + taille_bloc, n)
+                bloc = _Colonnes({c: v[debut:fin] for c, v in colonnes.items()})
+                for k in actives:
+                    masque = self._regles[codes[k]]['fonction'](bloc)
+                    violations[debut:fin, k] = np.broadcast_to(masque, (fin - debut,))
+
+        return {
+            'codes': codes,
+            'violations': violations,
+            'conforme': ~violations.any(axis=1),
+            'nb_infractions': dict(zip(codes, violations.sum(axis=0).tolist())),
+            'non_evaluees': non_evaluees,
+        }
+
+    def messages(self, resultat, i):
+        """Exigences non satisfaites par la poutre i"""
+        return [
+            self.description(code)
+            for code, viole in zip(resultat['codes'], resultat['violations'][i]) if viole
+        ]
+
+
+REGLES_BAEL = MoteurRegles()
+
+
+# ============================================
+# 3. RÈGLES BAEL
+# ============================================
+
+@REGLES_BAEL.regle('POSITIVITE', "Données", "b, d, d', fc28, Mu et Ms doivent être positifs",
+                   ('b_m', 'd_m', 'dp_m', 'fc28_MPa', 'Mu_MNm', 'Ms_MNm'))
+def _positivite(c):
+    return ~((c['b_m'] > 0) & (c['d_m'] > 0) & (c['dp_m'] > 0)
+             & (c['fc28_MPa'] > 0) & (c['Mu_MNm'] > 0) & (c['Ms_MNm'] > 0))
+
+
+@REGLES_BAEL.regle('GEOMETRIE', "Données", "il faut d' < d < h",
+                   ('d_m', 'dp_m'))
+def _geometrie(c):
+    return (c['dp_m'] >= c['d_m']) | (c['d_m'] >= c['h_calcul_m'])
+
+
+@REGLES_BAEL.regle('ELU_SECTION', "A.4.3", "section calculable selon l'organigramme ELU",
+                   ('valide',))
+def _elu_section(c):
+    return ~c['valide'].astype(bool)
+
+
+@REGLES_BAEL.regle('ELS_BETON', "A.4.5,2", "σb ≤ σb admissible",
+                   ('sigma_b_MPa', 'sigma_b_adm_MPa'))
+def _els_beton(c):
+    return c['sigma_b_MPa'] > c['sigma_b_adm_MPa']
+
+
+@REGLES_BAEL.regle('ELS_ACIER', "A.4.5,3", "σs ≤ σs admissible",
+                   ('sigma_s_MPa', 'sigma_s_adm_MPa'))
+def _els_acier(c):
+    return c['sigma_s_MPa'] > c['sigma_s_adm_MPa']
+
+
+@REGLES_BAEL.regle('NON_FRAGILITE', "A.4.2", "condition de non-fragilité Ast ≥ 0,23·b0·d·ft28/fe",
+                   ('Ast_m2', 'b_m', 'd_m', 'fc28_MPa', 'acier_type'))
+def _non_fragilite(c):
+    Ast_min_m2 = 0.23 * c['bw_m'] * c['d_m'] * c['ft28_MPa'] / c['acier_type']
+    return c['Ast_m2'] < Ast_min_m2
+
+
+@REGLES_BAEL.regle('RATIO_MAX', "Disposition", f"Ast + Asc ≤ {RATIO_ACIER_MAX:.0%} de la section de béton",
+                   ('Ast_m2', 'Asc_m2', 'b_m', 'd_m', 'dp_m'))
+def _ratio_max(c):
+    return c['Ast_m2'] + c['Asc_m2'] > RATIO_ACIER_MAX * c['aire_beton_m2']
+
+
+@REGLES_BAEL.regle('DISPOSITION', "Disposition", "une disposition de barres loge Ast dans la largeur de l'âme",
+                   ('valide', 'disposition_trouvee'))
+def _disposition(c):
+    return c['valide'].astype(bool) & ~c['disposition_trouvee'].astype(bool)
+
+
+@REGLES_BAEL.regle('ESPACEMENT_MIN', "A.7.2,8", "espacement libre des barres ≥ max(φ, 1,5·Dg)",
+                   ('n1', 'phi1_mm', 'n2', 'phi2_mm', 'nb_lits', 'b_m', 'dp_m'))
+def _espacement_min(c):
+    dg_m = c['dg_m'] if 'dg_m' in c else DG_DEFAUT_M
+    libre_m = c['entraxe_m'] - c['phi_max_m']
+    return libre_m < np.maximum(c['phi_max_m'], 1.5 * dg_m) - 1e-9
+
+
+@REGLES_BAEL.regle('ESPACEMENT_MAX', "A.4.5,3", "espacement maximal des barres selon la fissuration",
+                   ('n1', 'phi1_mm', 'n2', 'phi2_mm', 'nb_lits', 'b_m', 'dp_m', 'fissuration'))
+def _espacement_max(c):
+    infraction = np.zeros(c['b_m'].shape, dtype=bool)
+    for fissuration, (_, espacement_m, multiple_h) in LIMITES_FISSURATION.items():
+        lignes = c['fissuration'] == fissuration
+        limite_m = np.minimum(espacement_m, multiple_h * c['h_calcul_m'])
+        infraction |= lignes & (c['entraxe_m'] > limite_m)
+    return infraction
+
+
+@REGLES_BAEL.regle('DIAMETRE_MIN', "A.4.5,3", "diamètre minimal des barres selon la fissuration",
+                   ('n1', 'phi1_mm', 'n2', 'phi2_mm', 'fissuration'))
+def _diametre_min(c):
+    infraction = np.zeros(c['phi1_mm'].shape, dtype=bool)
+    for fissuration, (phi_min_mm, _, _) in LIMITES_FISSURATION.items():
+        infraction |= (c['fissuration'] == fissuration) & (c['n1'] > 0) & (c['phi_min_mm'] < phi_min_mm)
+    return infraction
+
+
+# ============================================
+# 4. CALCUL + CONTRÔLE D'UN BORDEREAU
+# ============================================
+
+def verifier_lot(entrees, moteur=REGLES_BAEL, index=None):
+    """
+    Calcul ELU + ELS + ferraillage vectorisés puis contrôle de toutes les règles
+
+    entrees: Mu_MNm, Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration,
+    acier_ha (+ h_m, b0_m, h0_m). Retourne (colonnes calculées, résultat d'evaluer)
+    """
+    n = max(len(np.atleast_1d(v)) for v in entrees.values())
+    c = {k: np.broadcast_to(np.atleast_1d(v), (n,)) for k, v in entrees.items()}
+    b0_m, h0_m = c.get('b0_m'), c.get('h0_m')
+
+    elu, els = calcul_elu_els_lot(
+        c['Mu_MNm'], c['Ms_MNm'], c['b_m'], c['d_m'], c['dp_m'], c['fc28_MPa'], c['acier_type'],
+        c['fissuration'], c['acier_ha'], b0_m, h0_m,
+    )
+    Ast_m2 = np.nan_to_num(elu['Ast_m2'])
+    bw_m = c['b_m'] if b0_m is None else np.where(np.isnan(b0_m.astype(float)), c['b_m'], b0_m)
+    barres = (index or index_defaut()).selectionner_lot(Ast_m2, bw_m, c['dp_m'])
+
+    colonnes = dict(c)
+    colonnes.update({
+        'valide': elu['valide'], 'Ast_m2': elu['Ast_m2'], 'Asc_m2': elu['Asc_m2'],
+        'sigma_b_MPa': np.where(elu['valide'], els['sigma_b_MPa'], np.nan),
+        'sigma_s_MPa': np.where(elu['valide'], els['sigma_s_MPa'], np.nan),
+        'sigma_b_adm_MPa': els['sigma_b_adm_MPa'], 'sigma_s_adm_MPa': els['sigma_s_adm_MPa'],
+    })
+    # Espacements contrôlés seulement là où une disposition a été trouvée ;
+    # l'absence de disposition est une infraction à part entière (DISPOSITION)
+    colonnes['disposition_trouvee'] = barres['trouve']
+    trouve = barres['trouve'] & elu['valide']
+    for k in ('n1', 'phi1_mm', 'n2', 'phi2_mm', 'nb_lits'):
+        colonnes[k] = np.where(trouve, barres[k], 0)
+
+    return colonnes, moteur.evaluer(colonnes)
@@ -0,0 +1,167 @@
+# =======================================================
+# RENDU HTML DU PANNEAU DE RÉSULTATS - RAHANI Soulaimane
+# =======================================================
+#
+# Le panneau ELU / ELS complet est produit par un seul modèle compilé à
+# l'import ; l'application l'affiche en un seul st.markdown.
+
+import html
+from string import Template
+
+
+def _compiler(texte):
+    """Modèle HTML sur une ligne (sans indentation ni ligne vide, que le
+    Markdown de Streamlit interpréterait comme du code ou des paragraphes)"""
+    return Template("".join(ligne.strip() for ligne in texte.strip().splitlines()))
+
+
+MODELE_PANNEAU = _compiler("""
+<style>
+.bael-grille { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; }
+.bael-grille-2 { display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.3rem 2rem; }
+.bael-panneau details { border: 1px solid #e2e8f0; border-radius: 8px; padding: 0.5rem 1rem; margin: 1rem 0; }
+.bael-panneau summary { font-weight: 700; font-size: 1.1rem; color: #1a365d; cursor: pointer; }
+.bael-panneau .metrique-titre { margin: 0 0 0.5rem 0; color: #1a365d; }
+.bael-panneau .metrique-donnee { color: #4a5568; font-size: 0.9rem; }
+.bael-panneau .metrique-valeur { font-size: 1.6rem; font-weight: 600; }
+.bael-panneau p { margin: 0.2rem 0; }
+</style>
+<div class="section-card bael-panneau">
+<hr style="margin: 2rem 0;">
+<details>
+<summary>📋 Données de saisie</summary>
+<div class="bael-grille">$donnees</div>
+</details>
+<details open>
+<summary>🔥 ELU – État limite ultime</summary>
+<div class="bael-grille">
+<div class="results-metric"><h4 class="metrique-titre">µ réduit</h4><h2 style="margin: 0; font-size: 2rem;">$mu</h2></div>
+<div class="results-metric"><h4 class="metrique-titre">Pivot</h4><h2 style="margin: 0; font-size: 2rem;">$pivot</h2></div>
+<div class="results-metric"><h4 class="metrique-titre">Type d'armature</h4><h2 style="margin: 0; font-size: 1.5rem;">$type_armature</h2></div>
+</div>
+<hr style="margin: 1.5rem 0;">
+<div class="bael-grille-2"><div>$armatures</div><div>$parametres_elu</div></div>
+$complements_elu
+</details>
+<details open>
+<summary>✅ ELS – Vérification en service</summary>
+<p><b>📐 Calculs ELS selon BAEL :</b></p>
+<div class="bael-grille-2"><div>$geometrie_els</div><div>$contraintes_els</div></div>
+<hr>
+<div class="bael-grille-2">
+<div><h3>🧮 Vérifications</h3>$verifications</div>
+<div style="background:#fff3cd; border:3px solid #ffc107; border-radius:12px; padding:1.8rem; text-align:center; font-weight:800; font-size:1.2rem; color:#22543d;">$titre_cas</div>
+</div>
+</details>
+$conformite
+</div>
+""")
+
+MODELE_DONNEE = _compiler("""
+<div><div class="metrique-donnee">$label</div><div class="metrique-valeur">$valeur</div></div>
+""")
+
+MODELE_LIGNE = Template("<p><b>$label :</b> $valeur</p>")
+
+MODELE_CONFORMITE = _compiler("""
+<details>
+<summary>📜 Conformité BAEL</summary>
+$lignes
+</details>
+""")
+
+
+def _lignes(lignes):
+    return "".join(MODELE_LIGNE.substitute(label=l, valeur=v) for l, v in lignes)
+
+
+def rendre_panneau(data, elu, els, ferraillage=(), controles=None):
+    """
+    HTML du panneau de résultats (données, ELU, ELS, conformité)
+
+    ferraillage: [(label, texte)] des dispositions proposées
+    controles: [(conforme, description)] du moteur de règles, ou None
+    """
+    te = data.get("section") == "te"
+
+    # 1. Données de saisie
+    donnees = [("h", f"{data['h']*100:.1f} cm"), ("d", f"{data['d']*100:.1f} cm"),
+               ("d'", f"{data['dp']*100:.1f} cm"), ("b", f"{data['b']*100:.1f} cm")]
+    if te:
+        donnees += [("b0", f"{data['b0']*100:.1f} cm"), ("h0", f"{data['h0']*100:.1f} cm")]
+    donnees += [("Mu", f"{data['Mu']:.3f} MN.m"), ("Ms", f"{data['Ms']:.3f} MN.m"),
+                ("fc28", f"{data['fc28']:.0f} MPa")]
+
+    # 2. ELU
+    Asc_cm2 = round(elu.get("Asc_cm2", 0.0), 2)
+    armatures = [("Aₛₜ", f"{elu.get('Ast_cm2', 0.0):.2f} cm²")]
+    if Asc_cm2 > 0:
+        armatures.append(("Aₛ꜀", f"{Asc_cm2:.2f} cm²"))
+    armatures += [(f"Ferraillage {label}", texte) for label, texte in ferraillage]
+
+    parametres_elu = [
+        ("α", f"{elu.get('alpha', 0.0):.3f}"),
+        ("z", f"{elu.get('z_cm', 0.0):.2f} cm"),
+        ("ε<sub>sc</sub>", f"{elu.get('eps_sc_pour_mille', 0.0):.3f} ‰"),
+    ]
+
+    complements = []
+    if te:
+        table_seule = elu.get("cas_te") == "table"
+        complements += [
+            ("M<sub>Tu</sub>", f"{elu.get('MTu_MNm', 0.0):.3f} MN.m"),
+            ("Table de compression", "table seule comprimée (calcul en section b × d)" if table_seule
+             else "l'âme participe (ailes + section b0 × d)"),
+        ]
+    if elu.get("type") == "doubles":
+        complements += [
+            ("M<sub>R</sub>", f"{elu.get('MR_MNm', 0.0):.3f} MN.m"),
+            ("M<sub>r</sub>", f"{elu.get('Mr_MNm', 0.0):.3f} MN.m"),
+        ]
+
+    # 3. ELS
+    I_m4 = els.get("I_m4", 0.0)
+    k_val = data["Ms"] / I_m4 if I_m4 > 0 else 0.0
+    beton_ok = els.get("verif_beton", "NON") == "OK"
+    acier_ok = els.get("verif_acier", "NON") == "OK"
+    cas_num = els.get("cas", 1)
+    if cas_num == 1:
+        titre_cas = "🏗️ Cas 1 ELU"
+    elif cas_num == 2:
+        titre_cas = "🏗️ Cas 2 ELS armatures simples"
+    else:
+        titre_cas = "🏗️ Cas 3 ELS armatures doubles"
+
+    # 4. Conformité
+    conformite = ""
+    if controles is not None:
+        conformite = MODELE_CONFORMITE.substitute(lignes="".join(
+            f"<p>{'✅' if conforme else '❌'} {html.escape(description)}</p>" for conforme, description in controles
+        ))
+
+    return MODELE_PANNEAU.substitute(
+        donnees="".join(MODELE_DONNEE.substitute(label=l, valeur=v) for l, v in donnees),
+        mu=f"{elu.get('mu', 0):.3f}",
+        pivot=elu.get("pivot", "-"),
+        type_armature="Armatures doubles 🔩" if Asc_cm2 > 0 else "Armatures simples 🔩",
+        armatures=_lignes(armatures),
+        parametres_elu=_lignes(parametres_elu),
+        complements_elu=("<hr>" + _lignes(complements)) if complements else "",
+        geometrie_els=_lignes([
+            ("🧭 Axe neutre Y₁", f"{els.get('Y1_cm', 0.0):.2f} cm"),
+            ("📏 Inertie I₉₉'", f"{els.get('I_cm4', 0.0):.2f} cm⁴"),
+            ("📈 Pente k = Ms/I₉₉'", f"{k_val:.4f} MN/m³"),
+        ]),
+        contraintes_els=_lignes([
+            ("🧱 σb calculée", f"{els.get('sigma_b_MPa', 0.0):.2f} MPa"),
+            ("🧱 σb admissible", f"{els.get('sigma_b_adm_MPa', 0.0):.2f} MPa"),
+            ("🔩 σs calculée", f"{els.get('sigma_s_MPa', 0.0):.2f} MPa"),
+            ("🔩 σs admissible", f"{els.get('sigma_s_adm_MPa', 0.0):.2f} MPa"),
+        ]),
+        verifications=_lignes([
+            ("🧱 σb ≤ σb,adm", "✅ OUI" if beton_ok else "❌ NON"),
+            ("🔩 σs ≤ σs,adm", "✅ OUI" if acier_ok else "❌ NON"),
+        ]),
+        titre_cas=titre_cas,
+        conformite=conformite,
+    )
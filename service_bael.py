@@ -0,0 +1,344 @@
+# =======================================================
+# SERVICE HTTP/JSON BAEL (asyncio) - RAHANI Soulaimane
+# =======================================================
+#
+# Lancement :  python service_bael.py --port 8502
+#
+# POST /poutre     {"Mu_MNm": 0.32, "Ms_MNm": 0.177, "b_m": 0.25, "d_m": 0.45, "dp_m": 0.04,
+#                   "fc28_MPa": 25, "acier_type": 500, "fissuration": "FP", "acier_ha": "HA"}
+#                   (+ "b0_m", "h0_m" pour une section en Té)
+# POST /lot        {"poutres": [ {...}, {...} ]}
+# GET  /metriques  débit, profondeur de file, taille moyenne des lots
+# GET  /sante
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+from backends_bael import calcul_elu_els_lot
+from calculs_bael import CHAMPS_NUMERIQUES, CHAMPS_TE, CHAMPS_TEXTE, valider_poutre
+
+MESSAGES_HTTP = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 500: 'Internal Server Error',
+}
+
+
+# ============================================
+# 1. CALCUL D'UN LOT DE POUTRES
+# ============================================
+
+def _arrondi(valeur, decimales):
+    """Valeur JSON : arrondie, ou null si non finie (NaN n'est pas du JSON valide)"""
+    valeur = float(valeur)
+    return round(valeur, decimales) if math.isfinite(valeur) else None
+
+
+def calculer_lot(poutres):
+    """
+    Calcul ELU + ELS vectorisé d'une liste de poutres (dicts JSON)
+
+    Retourne une liste de dicts (un par poutre, dans le même ordre) ;
+    ValueError si une poutre est invalide
+    """
+    if not poutres:
+        return []
+
+    lignes = []
+    for i, poutre in enumerate(poutres):
+        try:
+            lignes.append(valider_poutre(poutre))
+        except ValueError as e:
+            raise ValueError(f"Poutre {i} : {e}" if len(poutres) > 1 else str(e))
+    colonnes = {c: np.array([ligne[c] for ligne in lignes])
+                for c in CHAMPS_NUMERIQUES + CHAMPS_TEXTE + CHAMPS_TE}
+
+    elu, els = calcul_elu_els_lot(*[colonnes[c] for c in CHAMPS_NUMERIQUES + CHAMPS_TEXTE + CHAMPS_TE])
+    Ast_m2 = np.nan_to_num(elu['Ast_m2'])
+    Asc_m2 = np.nan_to_num(elu['Asc_m2'])
+
+    resultats = []
+    for i in range(len(poutres)):
+        if not elu['valide'][i]:
+            resultats.append({
+                'valide': False,
+                'erreur': "Section sous-dimensionnée. Augmentez b ou d.",
+            })
+            continue
+        resultats.append({
+            'valide': True,
+            'type': 'doubles' if elu['doubles'][i] else 'simples',
+            'pivot': str(elu['pivot'][i]),
+            'mu': _arrondi(elu['mu'][i], 4),
+            'alpha': _arrondi(elu['alpha'][i], 4),
+            'z_cm': _arrondi(elu['z_m'][i] * 100, 2),
+            'Ast_cm2': _arrondi(Ast_m2[i] * 10000, 2),
+            'Asc_cm2': _arrondi(Asc_m2[i] * 10000, 2),
+            'Y1_cm': _arrondi(els['Y1_m'][i] * 100, 2),
+            'I_cm4': _arrondi(els['I_m4'][i] * 100000000, 0),
+            'sigma_b_MPa': _arrondi(els['sigma_b_MPa'][i], 2),
+            'sigma_s_MPa': _arrondi(els['sigma_s_MPa'][i], 2),
+            'sigma_b_adm_MPa': _arrondi(els['sigma_b_adm_MPa'][i], 2),
+            'sigma_s_adm_MPa': _arrondi(els['sigma_s_adm_MPa'][i], 2),
+            'cas': int(els['cas'][i]),
+        })
+    return resultats
+
+
+# ============================================
+# 2. REGROUPEMENT DES REQUÊTES (MICRO-BATCHING)
+# ============================================
+
+class Regroupeur:
+    """
+    Regroupe les requêtes unitaires arrivant dans une fenêtre courte
+
+    Les poutres reçues pendant `fenetre_ms` (ou jusqu'à `taille_max`)
+    sont calculées en un seul appel vectorisé ELU + ELS.
+    """
+
+    def __init__(self, fenetre_ms=2.0, taille_max=4096):
+        self.fenetre_s = fenetre_ms / 1000.0
+        self.taille_max = taille_max
+        self._file = asyncio.Queue()
+        self._tache = None
+
+        # Métriques
+        self.debut = time.monotonic()
+        self.poutres_total = 0
+        self.lots_total = 0
+        self.duree_calcul_s = 0.0
+        self._horodatages = deque(maxlen=100000)
+
+    def demarrer(self):
+        self._tache = asyncio.get_running_loop().create_task(self._boucle())
+
+    async def arreter(self):
+        if self._tache is not None:
+            self._tache.cancel()
+
+    @property
+    def profondeur_file(self):
+        return self._file.qsize()
+
+    async def soumettre(self, poutre):
+        """Soumet une poutre et attend son résultat"""
+        futur = asyncio.get_running_loop().create_future()
+        await self._file.put((poutre, futur))
+        return await futur
+
+    async def calculer(self, poutres):
+        """Calcule directement un lot complet (hors fenêtre de regroupement)"""
+        return await self._executer(poutres)
+
+    async def _executer(self, poutres):
+        t0 = time.perf_counter()
+        resultats = await asyncio.get_running_loop().run_in_executor(None, calculer_lot, poutres)
+        self.duree_calcul_s += time.perf_counter() - t0
+        self.poutres_total += len(poutres)
+        self.lots_total += 1
+        maintenant = time.monotonic()
+        self._horodatages.extend([maintenant] * min(len(poutres), self._horodatages.maxlen))
+        return resultats
+
+    async def _boucle(self):
+        while True:
+            # 1. Attente de la première requête, puis fenêtre de regroupement
+            lot = [await self._file.get()]
+            echeance = time.monotonic() + self.fenetre_s
+            while len(lot) < self.taille_max:
+                reste = echeance - time.monotonic()
+                if reste <= 0:
+                    break
+                try:
+                    lot.append(await asyncio.wait_for(self._file.get(), reste))
+                except asyncio.TimeoutError:
+                    break
+
+            # 2. Contrôle individuel : une poutre invalide n'échoue que pour elle (400)
+            valides = []
+            for poutre, futur in lot:
+                try:
+                    valider_poutre(poutre)
+                except ValueError as e:
+                    if not futur.done():
+                        futur.set_exception(e)
+                else:
+                    valides.append((poutre, futur))
+            if not valides:
+                continue
+
+            # 3. Un seul calcul vectorisé pour les poutres valides
+            try:
+                resultats = await self._executer([p for p, _ in valides])
+            except Exception:
+                # Échec du lot : calcul individuel pour isoler la poutre en cause
+                boucle = asyncio.get_running_loop()
+                resultats = []
+                for p, _ in valides:
+                    try:
+                        resultats.extend(await boucle.run_in_executor(None, calculer_lot, [p]))
+                    except Exception as e:
+                        resultats.append(e)
+
+            for (_, futur), resultat in zip(valides, resultats):
+                if futur.done():
+                    continue
+                if isinstance(resultat, Exception):
+                    futur.set_exception(resultat)
+                else:
+                    futur.set_result(resultat)
+
+    def metriques(self):
+        maintenant = time.monotonic()
+        recentes = sum(1 for t in self._horodatages if maintenant - t <= 10.0)
+        return {
+            'uptime_s': round(maintenant - self.debut, 1),
+            'poutres_total': self.poutres_total,
+            'lots_total': self.lots_total,
+            'taille_moyenne_lot': round(self.poutres_total / self.lots_total, 2) if self.lots_total else 0.0,
+            'debit_poutres_s': round(recentes / 10.0, 1),
+            'profondeur_file': self.profondeur_file,
+            'duree_moyenne_calcul_ms': round(1000 * self.duree_calcul_s / self.lots_total, 3) if self.lots_total else 0.0,
+        }
+
+
+# ============================================
+# 3. SERVEUR HTTP MINIMAL
+# ============================================
+
+class ServiceBAEL:
+    """Serveur HTTP/1.1 (keep-alive) exposant les calculs BAEL en JSON"""
+
+    def __init__(self, hote='127.0.0.1', port=8502, fenetre_ms=2.0):
+        self.hote = hote
+        self.port = port
+        self.regroupeur = Regroupeur(fenetre_ms=fenetre_ms)
+        self.requetes_total = 0
+        self._serveur = None
+
+    async def demarrer(self):
+        self.regroupeur.demarrer()
+        self._serveur = await asyncio.start_server(self._connexion, self.hote, self.port)
+        self.port = self._serveur.sockets[0].getsockname()[1]
+        return self
+
+    async def arreter(self):
+        await self.regroupeur.arreter()
+        if self._serveur is not None:
+            self._serveur.close()
+            await self._serveur.wait_closed()
+
+    async def servir(self):
+        await self.demarrer()
+        async with self._serveur:
+            await self._serveur.serve_forever()
+
+    async def _connexion(self, reader, writer):
+        try:
+            while True:
+                ligne = await reader.readline()
+                if not ligne:
+                    break
+                try:
+                    methode, chemin, _ = ligne.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    break
+
+                entetes = {}
+                while True:
+                    entete = await reader.readline()
+                    if entete in (b'\r\n', b'\n', b''):
+                        break
+                    cle, _, valeur = entete.decode('latin-1').partition(':')
+                    entetes[cle.strip().lower()] = valeur.strip()
+
+                corps = b''
+                try:
+                    longueur = int(entetes.get('content-length', 0) or 0)
+                    if longueur < 0:
+                        raise ValueError
+                except ValueError:
+                    # Corps de longueur inconnue : réponse 400 puis fermeture
+                    self.requetes_total += 1
+                    self._repondre(writer, 400, {'erreur': "Content-Length invalide"}, False)
+                    await writer.drain()
+                    break
+                if longueur:
+                    corps = await reader.readexactly(longueur)
+
+                self.requetes_total += 1
+                statut, reponse = await self._router(methode, chemin, corps)
+                garder = entetes.get('connection', '').lower() != 'close'
+                self._repondre(writer, statut, reponse, garder)
+                await writer.drain()
+                if not garder:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _router(self, methode, chemin, corps):
+        chemin = chemin.split('?', 1)[0]
+        if chemin == '/sante':
+            return 200, {'statut': 'ok'}
+        if chemin == '/metriques':
+            metriques = self.regroupeur.metriques()
+            metriques['requetes_total'] = self.requetes_total
+            return 200, metriques
+        if chemin not in ('/poutre', '/lot'):
+            return 404, {'erreur': f"Ressource inconnue : {chemin}"}
+        if methode != 'POST':
+            return 405, {'erreur': "Méthode POST attendue"}
+
+        try:
+            donnees = json.loads(corps or b'{}')
+        except json.JSONDecodeError:
+            return 400, {'erreur': "JSON invalide"}
+
+        try:
+            if chemin == '/poutre':
+                return 200, await self.regroupeur.soumettre(donnees)
+            poutres = donnees.get('poutres', []) if isinstance(donnees, dict) else donnees
+            return 200, {'resultats': await self.regroupeur.calculer(poutres)}
+        except ValueError as e:
+            return 400, {'erreur': str(e)}
+        except Exception as e:
+            return 500, {'erreur': f"Erreur de calcul : {e}"}
+
+    @staticmethod
+    def _repondre(writer, statut, reponse, garder):
+        corps = json.dumps(reponse, ensure_ascii=False).encode('utf-8')
+        entetes = (
+            f"HTTP/1.1 {statut} {MESSAGES_HTTP.get(statut, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corps)}\r\n"
+            f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n"
+        )
+        writer.write(entetes.encode('latin-1') + corps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service HTTP/JSON de calcul BAEL")
+    parser.add_argument('--hote', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--fenetre-ms', type=float, default=2.0,
+                        help="fenêtre de regroupement des requêtes unitaires")
+    args = parser.parse_args()
+
+    service = ServiceBAEL(args.hote, args.port, args.fenetre_ms)
+    print(f"Service BAEL sur http://{args.hote}:{args.port}")
+    try:
+        asyncio.run(service.servir())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# =======================================================
+# STANDARDISATION DES SECTIONS (FAMILLES DE POUTRES) - RAHANI Soulaimane
+# =======================================================
+#
+# Regroupe les poutres rectangulaires d'un bâtiment en au plus K familles
+# de sections b × h (dimensions arrondies au pas de coffrage). Chaque poutre
+# d'une famille est recalculée à la section de la famille (même enrobage
+# h - d, même d') : Ast est le plus grand des aciers ELU et ELS (σs = σs
+# admissible), et la poutre doit y passer l'ELU et l'ELS.
+#
+# La matrice poutre × section candidate (coût ou infini si la poutre ne
+# passe pas) est calculée une seule fois ; le choix des familles pour un K
+# donné n'est ensuite qu'un problème de K-médianes sur cette matrice.
+
+import math
+
+import numpy as np
+
+from backends_bael import calcul_elu_lot, verification_els_lot
+from calculs_bael import CalculBAEL
+from ferraillage import MASSE_VOLUMIQUE_ACIER
+
+# Prix unitaires indicatifs servant de pondération béton / acier
+PRIX_BETON_M3 = 150.0
+PRIX_ACIER_KG = 1.5
+
+
+def armatures_els(Ms_MNm, b_m, d_m, sigma_s_adm_MPa):
+    """
+    Armatures simples donnant σs = σs admissible à l'ELS (section rectangulaire)
+
+    Avec α = Y1/d, l'équilibre et σb = σs·Y1 / (15(d - Y1)) donnent
+    α³ - 3α² - 90μs·α + 90μs = 0 avec μs = Ms / (b·d²·σs,adm) ; racine dans
+    [0, 1) par la formule trigonométrique. Ast = Ms / (d(1 - α/3)·σs,adm)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu_s = Ms_MNm / (b_m * d_m * d_m * sigma_s_adm_MPa)
+        m = 1 + 30 * mu_s
+        theta = np.arccos(np.clip(m ** -1.5, -1.0, 1.0))
+        alpha = 1 + 2 * np.sqrt(m) * np.cos(theta / 3 - 2 * math.pi / 3)
+        return Ms_MNm / (d_m * (1 - alpha / 3) * sigma_s_adm_MPa)
+
+
+class Standardisation:
+    """
+    Standardisation des sections d'un lot de poutres rectangulaires
+
+    Les sections candidates croisent les largeurs et hauteurs du lot
+    arrondies au pas supérieur ; familles(K) retourne l'affectation des
+    poutres et les surcoûts (coût, acier, béton) par rapport à l'optimum
+    de chaque poutre prise isolément parmi les sections candidates.
+    """
+
+    def __init__(self, Mu_MNm, Ms_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type,
+                 fissuration, acier_ha, longueur_m=1.0, pas_m=0.05,
+                 prix_beton_m3=PRIX_BETON_M3, prix_acier_kg=PRIX_ACIER_KG,
+                 taille_bloc=1 << 20):
+        entrees = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float))
+              for x in (Mu_MNm, Ms_MNm, b_m, h_m, d_m, dp_m, fc28_MPa, acier_type, longueur_m)]
+        )
+        (self.Mu_MNm, self.Ms_MNm, self.b_m, self.h_m, self.d_m, self.dp_m,
+         self.fc28_MPa, self.acier_type, self.longueur_m) = entrees
+        n = self.b_m.shape[0]
+        self.fissuration = np.broadcast_to(np.asarray(fissuration), (n,))
+        self.acier_ha = np.broadcast_to(np.asarray(acier_ha), (n,))
+        self.enrobage_m = self.h_m - self.d_m
+        self.prix_beton_m3 = prix_beton_m3
+        self.prix_acier_kg = prix_acier_kg
+
+        # 1. Sections candidates : largeurs × hauteurs du lot arrondies au pas supérieur
+        arrondi = lambda x: np.unique(np.round(np.ceil(x / pas_m - 1e-9) * pas_m, 4))
+        B, H = np.meshgrid(arrondi(self.b_m), arrondi(self.h_m), indexing='ij')
+        candidates = np.column_stack([B.ravel(), H.ravel()])
+        self.sections = candidates
+
+        # 2. Matrice des coûts poutre × section (inf si ELU ou ELS non vérifié)
+        nb_sections = len(candidates)
+        self.couts = np.empty((n, nb_sections), dtype=np.float32)
+        aciers = np.empty((n, nb_sections), dtype=np.float32)
+        par_bloc = max(1, taille_bloc // max(n, 1))
+        lignes = np.arange(n)
+        for debut in range(0, nb_sections, par_bloc):
+            fin = min(debut + par_bloc, nb_sections)
+            k = np.arange(debut, fin)
+            i = np.tile(lignes, len(k))
+            s = np.repeat(k, n)
+            dim = self._dimensionner(candidates[s, 0], candidates[s, 1], i)
+            self.couts[:, debut:fin] = dim['cout'].reshape(len(k), n).T
+            aciers[:, debut:fin] = np.where(dim['ok'], dim['acier_kg'], np.inf).reshape(len(k), n).T
+
+        # Poutres qui passent à au moins une section candidate ; une poutre
+        # non couverte coûte plus que n'importe quelle affectation
+        self.standardisables = np.isfinite(self.couts).any(axis=1)
+        finis = np.where(np.isfinite(self.couts), self.couts, 0.0)
+        self._penalite = 10.0 * max(float(finis.max()) if finis.size else 0.0, 1.0)
+        self._chemin = []
+
+        # 3. Optimums individuels (références des surcoûts) parmi les sections
+        # candidates vérifiées : la moins chère, la moins armée, la moins volumineuse
+        optimum = np.argmin(self.couts, axis=1)
+        self.section_optimale = np.where(self.standardisables, optimum, -1)
+        self.individuel = self._dimensionner(candidates[optimum, 0], candidates[optimum, 1], lignes)
+        sobre = np.argmin(aciers, axis=1)
+        self.acier_min_kg = self._dimensionner(candidates[sobre, 0], candidates[sobre, 1], lignes)['acier_kg']
+        aire = np.where(np.isfinite(self.couts), (candidates[:, 0] * candidates[:, 1])[None, :], np.inf)
+        self.beton_min_m3 = aire.min(axis=1) * self.longueur_m
+
+    # ============================================
+    # 1. DIMENSIONNEMENT D'UNE POUTRE À UNE SECTION
+    # ============================================
+
+    def _dimensionner(self, b_m, h_m, i):
+        """
+        ELU + ELS des poutres i à la section b × h ; coût (inf si non vérifiée)
+
+        Ast = max(Ast ELU, Ast ELS simple) ; les aciers comprimés de l'ELU ne
+        font que réduire σs, l'ELS est ensuite vérifié avec Asc
+        """
+        d_m = h_m - self.enrobage_m[i]
+        elu = calcul_elu_lot(
+            self.Mu_MNm[i], b_m, d_m, self.dp_m[i], self.fc28_MPa[i], self.acier_type[i]
+        )
+        _, sigma_s_adm_MPa = CalculBAEL.calcul_contraintes_admissibles_lot(
+            self.fc28_MPa[i], self.acier_type[i], self.fissuration[i], self.acier_ha[i]
+        )
+        # Marge relative de 1e-6 : σs = σs,adm exactement échouerait sur un arrondi
+        Ast_els_m2 = armatures_els(self.Ms_MNm[i], b_m, d_m, sigma_s_adm_MPa) * (1 + 1e-6)
+        Ast_m2 = np.fmax(np.nan_to_num(elu['Ast_m2']), Ast_els_m2)
+        Asc_m2 = np.nan_to_num(elu['Asc_m2'])
+        els = verification_els_lot(
+            self.Ms_MNm[i], b_m, d_m, self.dp_m[i], self.fc28_MPa[i], self.acier_type[i],
+            self.fissuration[i], self.acier_ha[i], Ast_m2, Asc_m2,
+        )
+        ok = elu['valide'] & els['verif_beton'] & els['verif_acier'] & (d_m > self.dp_m[i])
+
+        beton_m3 = b_m * h_m * self.longueur_m[i]
+        acier_kg = (Ast_m2 + Asc_m2) * MASSE_VOLUMIQUE_ACIER * self.longueur_m[i]
+        cout = self.prix_beton_m3 * beton_m3 + self.prix_acier_kg * acier_kg
+        return {
+            'ok': ok,
+            'Ast_m2': np.where(ok, Ast_m2, np.nan),
+            'Asc_m2': np.where(ok, Asc_m2, np.nan),
+            'beton_m3': beton_m3,
+            'acier_kg': np.where(ok, acier_kg, np.nan),
+            'cout': np.where(ok, cout, np.inf),
+        }
+
+    # ============================================
+    # 2. CHOIX DES FAMILLES (K-MÉDIANES)
+    # ============================================
+
+    def _penaliser(self, couts):
+        """Coûts des poutres standardisables, pénalité pour une poutre non couverte"""
+        couts = couts[self.standardisables]
+        return np.where(np.isfinite(couts), couts, self._penalite)
+
+    def _glouton(self, K):
+        """Prolonge le chemin glouton (une section ajoutée par étape) jusqu'à K"""
+        meilleur = (self.couts[:, self._chemin].min(axis=1) if self._chemin
+                    else np.full(len(self.couts), np.inf, dtype=np.float32))
+        while len(self._chemin) < min(K, self.couts.shape[1]):
+            candidats = np.minimum(meilleur[:, None], self.couts)
+            totaux = self._penaliser(candidats).sum(axis=0)
+            totaux[self._chemin] = np.inf
+            s = int(np.argmin(totaux))
+            self._chemin.append(s)
+            meilleur = np.minimum(meilleur, self.couts[:, s])
+
+    def _affiner(self, choix, nb_iterations=10):
+        """Échanges de type K-médoïdes : chaque famille prend la section la moins chère pour ses poutres"""
+        choix = list(choix)
+        total = self._penaliser(self.couts[:, choix].min(axis=1)[:, None]).sum()
+        for _ in range(nb_iterations):
+            sous_matrice = self.couts[:, choix]
+            affectation = np.argmin(sous_matrice, axis=1)
+            couverte = np.isfinite(sous_matrice.min(axis=1))
+            nouveau = list(choix)
+            for f in range(len(choix)):
+                membres = np.nonzero((affectation == f) & couverte)[0]
+                if membres.size == 0:
+                    continue
+                sommes = self.couts[membres].astype(np.float64).sum(axis=0)
+                sommes[[c for j, c in enumerate(nouveau) if j != f]] = np.inf
+                if np.isfinite(sommes.min()):
+                    nouveau[f] = int(np.argmin(sommes))
+            total_nouveau = self._penaliser(self.couts[:, nouveau].min(axis=1)[:, None]).sum()
+            if total_nouveau >= total - 1e-9 * abs(total):
+                break
+            choix, total = nouveau, total_nouveau
+        return choix
+
+    def familles(self, K, affiner=True):
+        """
+        Au plus K familles de sections
+
+        Retourne un dict : sections (K × [b, h]), famille de chaque poutre
+        (-1 si non couverte), Ast/Asc à la section de famille, taux de
+        couverture des poutres standardisables et surcoûts par rapport aux
+        optimums individuels : coût (section la moins chère), acier kg
+        (section la moins armée), béton m³ (section la plus petite). Le coût
+        compte la pénalité de chaque poutre standardisable non couverte ;
+        acier et béton portent sur les seules poutres couvertes. Aucune
+        famille si aucune poutre ne passe.
+        """
+        n = len(self.couts)
+        choix = []
+        if self.standardisables.any():
+            self._glouton(K)
+            choix = self._chemin[:K]
+            if affiner:
+                choix = self._affiner(choix)
+
+        if choix:
+            sous_matrice = self.couts[:, choix]
+            famille = np.argmin(sous_matrice, axis=1)
+            couverte = np.isfinite(sous_matrice[np.arange(n), famille])
+        else:
+            famille = np.full(n, -1)
+            couverte = np.zeros(n, dtype=bool)
+        # Familles vides retirées (au plus K familles)
+        utilisees = np.unique(famille[couverte])
+        choix = [choix[f] for f in utilisees]
+        famille = np.where(couverte, np.searchsorted(utilisees, famille), -1)
+        sections = self.sections[choix].reshape(-1, 2)
+
+        # Recalcul exact des poutres couvertes à la section de leur famille
+        lignes = np.nonzero(couverte)[0]
+        dim = self._dimensionner(sections[famille[lignes], 0], sections[famille[lignes], 1], lignes)
+        Ast_m2 = np.full(n, np.nan)
+        Asc_m2 = np.full(n, np.nan)
+        Ast_m2[lignes] = dim['Ast_m2']
+        Asc_m2[lignes] = dim['Asc_m2']
+
+        # Surcoûts rapportés aux optimums individuels ; une poutre standardisable
+        # non couverte coûte la pénalité du choix des familles
+        non_couvertes = self.standardisables & ~couverte
+        nb_standardisables = int(self.standardisables.sum())
+        references = {
+            'cout': self.individuel['cout'][self.standardisables].sum(),
+            'acier': self.acier_min_kg[lignes].sum(),
+            'beton': self.beton_min_m3[lignes].sum(),
+        }
+        surcouts = {
+            'cout': dim['cout'].sum() + self._penalite * non_couvertes.sum() - references['cout'],
+            'acier': dim['acier_kg'].sum() - references['acier'],
+            'beton': dim['beton_m3'].sum() - references['beton'],
+        }
+        pct = {c: float(100 * surcouts[c] / references[c]) if references[c] else 0.0 for c in surcouts}
+
+        return {
+            'K': len(choix),
+            'sections': sections,
+            'famille': famille,
+            'nb_poutres': np.bincount(famille[couverte], minlength=len(choix)),
+            'Ast_m2': Ast_m2,
+            'Asc_m2': Asc_m2,
+            'nb_non_couvertes': int((~couverte).sum()),
+            'taux_couverture': len(lignes) / nb_standardisables if nb_standardisables else 1.0,
+            'surcout_cout': float(surcouts['cout']),
+            'surcout_acier_kg': float(surcouts['acier']),
+            'surcout_beton_m3': float(surcouts['beton']),
+            'surcout_cout_pct': pct['cout'],
+            'surcout_acier_pct': pct['acier'],
+            'surcout_beton_pct': pct['beton'],
+        }
+
+    def balayage(self, K_max, affiner=False):
+        """Résumé des surcoûts pour K = 1 … K_max (chemin glouton partagé)"""
+        resumes = []
+        for K in range(1, K_max + 1):
+            r = self.familles(K, affiner=affiner)
+            resumes.append({c: r[c] for c in (
+                'K', 'nb_non_couvertes', 'taux_couverture', 'surcout_cout', 'surcout_acier_kg', 'surcout_beton_m3',
+                'surcout_cout_pct', 'surcout_acier_pct', 'surcout_beton_pct',
+            )})
+        return resumes
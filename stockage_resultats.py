@@ -0,0 +1,224 @@
+# =======================================================
+# STOCKAGE COLONNAIRE DES RÉSULTATS (hors mémoire) - RAHANI Soulaimane
+# =======================================================
+
+import json
+import operator
+import os
+
+import numpy as np
+
+from backends_bael import calcul_elu_els_lot
+
+# Colonnes par défaut : entrées du balayage puis résultats ELU / ELS
+SCHEMA_DEFAUT = {
+    'Mu_MNm': 'float', 'Ms_MNm': 'float', 'b_m': 'float', 'd_m': 'float', 'dp_m': 'float',
+    'fc28_MPa': 'float', 'acier_type': 'int16', 'fissuration': 'cat', 'acier_ha': 'cat',
+    'Ast_m2': 'float', 'Asc_m2': 'float', 'sigma_b_MPa': 'float', 'sigma_s_MPa': 'float',
+    'cas': 'int8', 'valide': 'bool',
+}
+
+# Codage des colonnes catégorielles
+CATEGORIES = {
+    'fissuration': ('FPP', 'FP', 'FTP'),
+    'acier_ha': ('HA', 'RL'),
+}
+
+OPERATEURS = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+
+class StockageResultats:
+    """
+    Stockage colonnaire de résultats sur fichiers .npy projetés en mémoire
+
+    Chaque colonne est un fichier .npy ouvert en memmap : l'ajout se fait par
+    blocs, la lecture et les tranches sont sans copie et les filtres sont
+    évalués bloc par bloc, sans jamais charger tout le balayage en RAM.
+    """
+
+    FICHIER_SCHEMA = 'schema.json'
+
+    def __init__(self, dossier, schema=None, precision='float64', capacite_initiale=1 << 16):
+        self.dossier = dossier
+        chemin_schema = os.path.join(dossier, self.FICHIER_SCHEMA)
+
+        if os.path.exists(chemin_schema):
+            with open(chemin_schema, encoding='utf-8') as f:
+                meta = json.load(f)
+            self.dtypes = {c: np.dtype(t) for c, t in meta['dtypes'].items()}
+            self.nb_lignes = meta['nb_lignes']
+            self.capacite = meta['capacite']
+        else:
+            if precision not in ('float64', 'float32'):
+                raise ValueError(f"Précision non reconnue: {precision}")
+            os.makedirs(dossier, exist_ok=True)
+            schema = SCHEMA_DEFAUT if schema is None else schema
+            self.dtypes = {
+                c: np.dtype(precision if t == 'float' else 'int8' if t == 'cat' else t)
+                for c, t in schema.items()
+            }
+            self.nb_lignes = 0
+            self.capacite = int(capacite_initiale)
+            for c, dtype in self.dtypes.items():
+                np.lib.format.open_memmap(self._chemin(c), mode='w+', dtype=dtype, shape=(self.capacite,))
+            self._ecrire_schema()
+
+        self._colonnes = {c: self._ouvrir(c) for c in self.dtypes}
+
+    # ============================================
+    # 1. FICHIERS
+    # ============================================
+
+    def _chemin(self, colonne):
+        return os.path.join(self.dossier, f"{colonne}.npy")
+
+    def _ouvrir(self, colonne):
+        return np.load(self._chemin(colonne), mmap_mode='r+')
+
+    def _ecrire_schema(self):
+        meta = {
+            'dtypes': {c: d.str for c, d in self.dtypes.items()},
+            'nb_lignes': self.nb_lignes,
+            'capacite': self.capacite,
+        }
+        temporaire = os.path.join(self.dossier, self.FICHIER_SCHEMA + '.tmp')
+        with open(temporaire, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temporaire, os.path.join(self.dossier, self.FICHIER_SCHEMA))
+
+    def _agrandir(self, capacite_min, taille_bloc=1 << 20):
+        """Double la capacité des fichiers (copie par blocs)"""
+        capacite = self.capacite
+        while capacite < capacite_min:
+            capacite *= 2
+
+        for c, dtype in self.dtypes.items():
+            temporaire = self._chemin(c) + '.tmp.npy'
+            nouveau = np.lib.format.open_memmap(temporaire, mode='w+', dtype=dtype, shape=(capacite,))
+            ancien = self._colonnes[c]
+            for debut in range(0, self.nb_lignes, taille_bloc):
+                fin = min(debut + taille_bloc, self.nb_lignes)
+                nouveau[debut:fin] = ancien[debut:fin]
+            nouveau.flush()
+            del nouveau, ancien
+            self._colonnes[c] = None
+            os.replace(temporaire, self._chemin(c))
+            self._colonnes[c] = self._ouvrir(c)
+
+        self.capacite = capacite
+
+    # ============================================
+    # 2. ÉCRITURE
+    # ============================================
+
+    @staticmethod
+    def encoder(colonne, valeurs):
+        """Code une colonne catégorielle (ex: 'FP' → 1)"""
+        valeurs = np.asarray(valeurs)
+        if colonne not in CATEGORIES or valeurs.dtype.kind not in 'US':
+            return valeurs
+        codes = np.full(valeurs.shape, -1, dtype=np.int8)
+        for code, libelle in enumerate(CATEGORIES[colonne]):
+            codes[valeurs == libelle] = code
+        return codes
+
+    def ajouter(self, lot):
+        """Ajoute un bloc de lignes (dict colonne → tableau de même longueur)"""
+        manquantes = set(self.dtypes) - set(lot)
+        if manquantes:
+            raise ValueError(f"Colonnes manquantes: {sorted(manquantes)}")
+
+        n = len(np.atleast_1d(lot[next(iter(self.dtypes))]))
+        if self.nb_lignes + n > self.capacite:
+            self._agrandir(self.nb_lignes + n)
+
+        debut, fin = self.nb_lignes, self.nb_lignes + n
+        for c, dtype in self.dtypes.items():
+            valeurs = np.broadcast_to(self.encoder(c, lot[c]), (n,))
+            self._colonnes[c][debut:fin] = valeurs.astype(dtype, copy=False)
+
+        # Données écrites sur disque avant de publier le nouveau nombre de lignes
+        self.flush()
+        self.nb_lignes = fin
+        self._ecrire_schema()
+
+    def ajouter_calcul(self, entrees):
+        """
+        Calcule ELU + ELS d'un bloc d'entrées puis l'ajoute au stockage
+
+        entrees: Mu_MNm, Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration, acier_ha
+        Sections refusées à l'ELU : cas = CAS_INVALIDE (ELS sans objet)
+        """
+        n = max(len(np.atleast_1d(v)) for v in entrees.values())
+        e = {c: np.broadcast_to(np.atleast_1d(v), (n,)) for c, v in entrees.items()}
+
+        elu, els = calcul_elu_els_lot(
+            e['Mu_MNm'], e['Ms_MNm'], e['b_m'], e['d_m'], e['dp_m'], e['fc28_MPa'],
+            e['acier_type'], e['fissuration'], e['acier_ha'],
+        )
+
+        lot = dict(e)
+        lot.update({
+            'Ast_m2': elu['Ast_m2'], 'Asc_m2': elu['Asc_m2'],
+            'sigma_b_MPa': els['sigma_b_MPa'], 'sigma_s_MPa': els['sigma_s_MPa'],
+            'cas': els['cas'], 'valide': elu['valide'],
+        })
+        self.ajouter(lot)
+
+    def flush(self):
+        for colonne in self._colonnes.values():
+            colonne.flush()
+
+    # ============================================
+    # 3. LECTURE ET REQUÊTES
+    # ============================================
+
+    def __len__(self):
+        return self.nb_lignes
+
+    def colonne(self, nom):
+        """Vue sans copie sur les lignes remplies d'une colonne"""
+        return self._colonnes[nom][:self.nb_lignes]
+
+    def iterer_blocs(self, taille_bloc=1 << 20, colonnes=None):
+        """Itère sur des blocs de lignes (dicts de vues sans copie)"""
+        colonnes = list(self.dtypes) if colonnes is None else colonnes
+        for debut in range(0, self.nb_lignes, taille_bloc):
+            fin = min(debut + taille_bloc, self.nb_lignes)
+            yield debut, {c: self._colonnes[c][debut:fin] for c in colonnes}
+
+    def filtrer(self, taille_bloc=1 << 20, **conditions):
+        """
+        Indices des lignes vérifiant toutes les conditions
+
+        Ex: filtrer(cas=1, Ast_m2=('<', 5e-4), fissuration='FP')
+        """
+        criteres = []
+        for c, condition in conditions.items():
+            if c not in self.dtypes:
+                raise ValueError(f"Colonne inconnue: {c}")
+            op, valeur = condition if isinstance(condition, tuple) else ('==', condition)
+            if op not in OPERATEURS:
+                raise ValueError(f"Opérateur non reconnu: {op}")
+            if c in CATEGORIES and isinstance(valeur, str):
+                valeur = CATEGORIES[c].index(valeur)
+            criteres.append((c, OPERATEURS[op], valeur))
+
+        if not criteres:
+            return np.arange(self.nb_lignes)
+
+        indices = []
+        for debut, bloc in self.iterer_blocs(taille_bloc, [c for c, _, _ in criteres]):
+            masque = np.ones(len(bloc[criteres[0][0]]), dtype=bool)
+            for c, op, valeur in criteres:
+                masque &= op(bloc[c], valeur)
+            indices.append(np.nonzero(masque)[0] + debut)
+        return np.concatenate(indices) if indices else np.empty(0, dtype=np.int64)
+
+    def selection(self, indices, colonnes=None):
+        """Extrait les lignes demandées (copie limitée à la sélection)"""
+        colonnes = list(self.dtypes) if colonnes is None else colonnes
+        return {c: self._colonnes[c][indices] for c in colonnes}
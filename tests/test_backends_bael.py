@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import backends_bael
+from backends_bael import backend_effectif, choisir_backend, verifier_backends
+from calculs_bael import CalculBAEL
+from flexion_composee import FlexionComposee
+from service_bael import calculer_lot
+from standardisation import Standardisation
+
+POUTRE = {
+    'Mu_MNm': 0.32, 'Ms_MNm': 0.177, 'b_m': 0.25, 'd_m': 0.45, 'dp_m': 0.04,
+    'fc28_MPa': 25, 'acier_type': 500, 'fissuration': 'FP', 'acier_ha': 'HA',
+}
+
+
+@pytest.fixture
+def backend_scalaire():
+    precedent = choisir_backend('scalaire')
+    yield
+    choisir_backend(precedent)
+
+
+def test_bael_backend_inconnu_repli_numpy(monkeypatch):
+    monkeypatch.setenv('BAEL_BACKEND', 'gpu')
+    with pytest.warns(UserWarning, match='repli sur numpy'):
+        assert backends_bael._backend_environnement() == 'numpy'
+    monkeypatch.setenv('BAEL_BACKEND', 'scalaire')
+    assert backends_bael._backend_environnement() == 'scalaire'
+
+
+def test_backends_concordent():
+    r = verifier_backends(n=500)
+    assert r['conforme'], r['ecarts']
+
+
+def test_jit_concorde():
+    pytest.importorskip('numba')
+    assert backend_effectif('jit') == 'jit'
+    r = verifier_backends(n=500)
+    assert 'jit' in r['backends']
+    assert r['conforme'], r['ecarts']
+
+
+def test_calculs_par_lots_suivent_le_backend_global(backend_scalaire, monkeypatch):
+    # Le chemin NumPy de CalculBAEL ne doit plus être appelé directement
+    def interdit(*args, **kwargs):
+        raise AssertionError("CalculBAEL appelé hors du backend choisi")
+    monkeypatch.setattr(CalculBAEL, 'calcul_elu_lot', staticmethod(interdit))
+    monkeypatch.setattr(CalculBAEL, 'verification_els_lot', staticmethod(interdit))
+
+    assert calculer_lot([POUTRE])[0]['Ast_cm2'] == 21.08
+    assert FlexionComposee.calcul_elu(0.2, 0.1, 0.30, 0.60, 0.55, 0.05, 25, 500)['Ast_cm2'] == 2.09
+    s = Standardisation([0.2], [0.14], [0.25], [0.50], [0.45], 0.04, 25, 500, 'FP', 'HA')
+    assert s.familles(1)['taux_couverture'] == 1.0
+
+
+def test_refus_mu_1_identique_sur_tous_les_backends():
+    args = ([0.05, 0.2], 0.30, 0.55, 0.05, 25, 500)
+    for backend in ('scalaire', 'numpy'):
+        r = backends_bael.calcul_elu_lot(*args, refus_mu_1=False, backend=backend)
+        assert r['valide'].all()
+        assert not backends_bael.calcul_elu_lot(*args, backend=backend)['valide'][0]
+    np.testing.assert_allclose(
+        backends_bael.calcul_elu_lot(*args, refus_mu_1=False, backend='scalaire')['Ast_m2'],
+        backends_bael.calcul_elu_lot(*args, refus_mu_1=False, backend='numpy')['Ast_m2'],
+    )
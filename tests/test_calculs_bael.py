@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from calculs_bael import CalculBAEL
+
+# Section en Té: table 80 × 10 cm, âme 25 cm, d = 55 cm, d' = 4 cm, fc28 = 25 MPa, FeE 500
+# σbc = 0,85 × 25 / 1,5 = 14,167 MPa ; σst = 500 / 1,15 = 434,78 MPa
+# MTu = 0,80 × 0,10 × 14,167 × (0,55 - 0,05) = 0,5667 MN.m
+TE = dict(b_m=0.80, b0_m=0.25, h0_m=0.10, d_m=0.55, dp_m=0.04, fc28_MPa=25, acier_type=500)
+
+
+def test_te_table_seule_pivot_a():
+    # Mu = 0,2 ≤ MTu → rectangle 80 × 55 : μ = 0,2 / (0,80 × 0,55² × 14,167) = 0,0583 < μ₁
+    # α = 1,25 (1 - √(1 - 2μ)) = 0,0752 ; z = 0,55 (1 - 0,4α) = 0,5335 m
+    # Ast = 0,2 / (0,5335 × 434,78) = 8,62 cm²
+    r = CalculBAEL.calcul_elu_te(0.2, **TE)
+    assert r['cas_te'] == 'table'
+    assert r['pivot'] == 'A'
+    assert r['mu'] == pytest.approx(0.0583, abs=1e-4)
+    assert r['z_m'] == pytest.approx(0.5335, abs=1e-4)
+    assert r['Ast_cm2'] == pytest.approx(8.62, abs=0.01)
+
+
+def test_te_ame_participante_pivot_a():
+    # Mu = 0,575 > MTu : ailes Mu,ailes = 0,55 × 0,10 × 14,167 × 0,50 = 0,3896 MN.m
+    #   Ast,ailes = 0,3896 / (0,50 × 434,78) = 17,92 cm²
+    # âme 25 × 55 : Mu = 0,1854, μ = 0,1854 / (0,25 × 0,55² × 14,167) = 0,1731 < μ₁
+    #   α = 0,2392 ; z = 0,4974 m ; Ast,âme = 0,1854 / (0,4974 × 434,78) = 8,57 cm²
+    r = CalculBAEL.calcul_elu_te(0.575, **TE)
+    assert r['cas_te'] == 'ame'
+    assert r['Mu_ailes_MNm'] == pytest.approx(0.3896, abs=1e-4)
+    assert r['mu'] == pytest.approx(0.1731, abs=1e-4)
+    assert r['Ast_cm2'] == pytest.approx(17.92 + 8.57, abs=0.02)
+
+
+def test_rectangle_pivot_a_sous_mu_1_refuse():
+    with pytest.raises(ValueError, match='sous-dimensionnée'):
+        CalculBAEL.calcul_elu(0.05, 0.30, 0.55, 0.04, 25, 500)
+
+
+def test_lot_te_comme_calcul_unitaire():
+    lot = CalculBAEL.calcul_elu_lot(
+        [0.2, 0.575, 0.05], [0.80, 0.80, 0.30], 0.55, 0.04, 25, 500,
+        b0_m=[0.25, 0.25, np.nan], h0_m=[0.10, 0.10, np.nan],
+    )
+    assert lot['valide'].tolist() == [True, True, False]
+    for i, Mu in enumerate((0.2, 0.575)):
+        assert lot['Ast_m2'][i] == pytest.approx(CalculBAEL.calcul_elu_te(Mu, **TE)['Ast_m2'])
+    assert math.isnan(lot['Ast_m2'][2])
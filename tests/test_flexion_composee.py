@@ -0,0 +1,31 @@
+import pytest
+
+from flexion_composee import FlexionComposee
+
+# Section 30 × 60 cm, d = 55 cm, d' = 5 cm, fc28 = 25 MPa, FeE 500
+# σbc = 14,167 MPa ; σst = 434,78 MPa ; bd²σbc = 0,30 × 0,55² × 14,167 = 1,2856 MN.m
+SECTION = dict(b_m=0.30, h_m=0.60, d_m=0.55, dp_m=0.05, fc28_MPa=25, acier_type=500)
+
+
+@pytest.mark.parametrize('Nu, Mu, MuA, Ast_cm2', [
+    # MuA = 0,05 + 0,3 × 0,25 = 0,125 ; μ = 0,0972 ; z = 0,5218 m
+    # Ast = 0,125 / (0,5218 × 434,78) - 0,3 / 434,78 < 0 → 0
+    (0.3, 0.05, 0.125, 0.0),
+    # MuA = 0,15 ; μ = 0,1167 ; z = 0,5158 m ; Ast = 6,69 - 4,60 = 2,09 cm²
+    (0.2, 0.1, 0.15, 2.09),
+    # Tirant excentré (e0 = 0,667 m > d - h/2) : MuA = 0,2 - 0,3 × 0,25 = 0,125
+    # Ast = 5,51 + 6,90 = 12,41 cm²
+    (-0.3, 0.2, 0.125, 12.41),
+])
+def test_partiellement_comprimee_pivot_a(Nu, Mu, MuA, Ast_cm2):
+    r = FlexionComposee.calcul_elu(Nu, Mu, **SECTION)
+    assert r['etat'] == 'PC'
+    assert r['MuA_MNm'] == pytest.approx(MuA)
+    assert r['Ast_cm2'] == pytest.approx(Ast_cm2, abs=0.01)
+    assert r['Asc_cm2'] == 0.0
+
+
+def test_lot_sans_refus_sous_mu_1():
+    lot = FlexionComposee.calcul_elu_lot([0.3, 0.2, -0.3], [0.05, 0.1, 0.2], **SECTION)
+    assert lot['valide'].all()
+    assert (lot['mu'] < 0.180).all()
@@ -0,0 +1,25 @@
+import numpy as np
+
+from metre_acier import MetreAcier
+
+
+def test_poutres_sans_disposition_ecartees_et_signalees():
+    metre = MetreAcier()
+    # Ast non fini, puis Ast sans disposition possible (1 m²)
+    metre.ajouter_poutres([5e-4, np.nan, 1.0, 8e-4], 0.30, 0.05, 5.0, 'R+1', 'P')
+    assert metre.nb_poutres == 2
+    assert metre.non_metrees == [1, 2]
+
+    metre.ajouter_poutres([5e-4, 5e-4], 0.30, 0.05, 5.0, 'R+2', 'P',
+                          Asc_m2=[np.nan, 0.0], ids=['A7', 'A8'])
+    assert metre.nb_poutres == 3
+    assert metre.non_metrees == [1, 2, 'A7']
+
+
+def test_masse_poutres_metrees():
+    metre = MetreAcier()
+    metre.ajouter_poutres([5e-4, 1.0], 0.30, 0.05, [4.0, 5.0], 'R+1', 'P')
+    seule = MetreAcier()
+    seule.ajouter_poutres([5e-4], 0.30, 0.05, [4.0], 'R+1', 'P')
+    assert metre.totaux() == seule.totaux()
+    assert metre.masse_totale_kg() > 0
@@ -0,0 +1,29 @@
+from notes_calcul import rendre_note
+
+POUTRE = {
+    'repere': 'P1', 'Mu_MNm': 0.32, 'Ms_MNm': 0.177, 'b_m': 0.25, 'd_m': 0.45, 'dp_m': 0.04,
+    'fc28_MPa': 25, 'acier_type': 500, 'fissuration': 'FP', 'acier_ha': 'HA',
+}
+
+
+def _note(**champs):
+    return rendre_note({**POUTRE, **champs}, 1, 1, 1, 'notes_001.html')
+
+
+def test_valeur_non_finie_refusee_avant_calcul():
+    html, conforme = _note(b_m=float('nan'))
+    assert not conforme
+    assert 'Valeur numérique invalide : b_m' in html
+    assert 'Pas de solution réelle' not in html
+
+
+def test_dimensions_incoherentes_refusees():
+    html, conforme = _note(h_m=0.40)
+    assert not conforme
+    assert 'Dimensions invalides' in html
+
+
+def test_note_poutre_valide():
+    html, _ = _note(h_m=0.50)
+    assert 'Dimensions invalides' not in html
+    assert 'Note de calcul – Poutre P1' in html
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+import pytest
+
+from service_bael import ServiceBAEL, valider_poutre
+
+POUTRE = {
+    'Mu_MNm': 0.32, 'Ms_MNm': 0.177, 'b_m': 0.25, 'd_m': 0.45, 'dp_m': 0.04,
+    'fc28_MPa': 25, 'acier_type': 500, 'fissuration': 'FP', 'acier_ha': 'HA',
+}
+
+
+@pytest.mark.parametrize('champs', [
+    {'b_m': -1}, {'b_m': 0}, {'d_m': 0}, {'dp_m': 0.45}, {'dp_m': -0.01},
+    {'b0_m': 0.30, 'h0_m': 0.10}, {'b0_m': 0.10, 'h0_m': 0.50}, {'b0_m': 0.10, 'h0_m': 0},
+])
+def test_dimensions_incoherentes_refusees(champs):
+    with pytest.raises(ValueError, match='Dimensions invalides'):
+        valider_poutre({**POUTRE, **champs})
+
+
+def test_section_te_acceptee():
+    ligne = valider_poutre({**POUTRE, 'b_m': 0.80, 'b0_m': 0.25, 'h0_m': 0.10})
+    assert ligne['b0_m'] == 0.25
+
+
+async def _requete(port, corps, entetes):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'POST /poutre HTTP/1.1\r\n' + entetes + b'\r\n' + corps)
+    await writer.drain()
+    reponse = await reader.read()
+    writer.close()
+    statut = int(reponse.split(b' ', 2)[1])
+    return statut, json.loads(reponse.split(b'\r\n\r\n', 1)[1])
+
+
+def _envoyer(corps, entetes):
+    async def scenario():
+        service = await ServiceBAEL(port=0).demarrer()
+        try:
+            return await _requete(service.port, corps, entetes)
+        finally:
+            await service.arreter()
+    return asyncio.run(scenario())
+
+
+def test_http_dimension_negative_400():
+    corps = json.dumps({**POUTRE, 'b_m': -1}).encode()
+    statut, reponse = _envoyer(
+        corps, b'Content-Length: %d\r\nConnection: close\r\n' % len(corps)
+    )
+    assert statut == 400
+    assert 'Dimensions invalides' in reponse['erreur']
+
+
+@pytest.mark.parametrize('longueur', [b'abc', b'-5'])
+def test_http_content_length_invalide_400(longueur):
+    statut, reponse = _envoyer(b'{}', b'Content-Length: ' + longueur + b'\r\n')
+    assert statut == 400
+    assert reponse['erreur'] == 'Content-Length invalide'
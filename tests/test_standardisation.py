@@ -0,0 +1,26 @@
+import numpy as np
+
+from standardisation import Standardisation
+
+
+def _standardisation(n=120):
+    rng = np.random.default_rng(0)
+    b_m = rng.choice([0.20, 0.25, 0.30, 0.35], n)
+    h_m = rng.choice([0.40, 0.50, 0.60, 0.70], n)
+    d_m = h_m - 0.05
+    # Pivot B (μ > μ₁) à la section d'origine : seules les sections voisines conviennent
+    Mu_MNm = rng.uniform(0.19, 0.30, n) * b_m * d_m**2 * (0.85 * 25 / 1.5)
+    return Standardisation(Mu_MNm, 0.7 * Mu_MNm, b_m, h_m, d_m, 0.04, 25, 500, 'FP', 'HA')
+
+
+def test_couverture_et_penalite_des_poutres_non_couvertes():
+    s = _standardisation()
+    resumes = s.balayage(8)
+    nb = int(s.standardisables.sum())
+
+    for r in resumes:
+        assert r['taux_couverture'] == (nb - r['nb_non_couvertes']) / nb
+    # K = 1 ne couvre pas tout le lot : le surcoût pénalisé dépasse celui d'un K couvrant
+    assert resumes[0]['taux_couverture'] < 1.0
+    complet = next(r for r in resumes if r['taux_couverture'] == 1.0)
+    assert resumes[0]['surcout_cout_pct'] > complet['surcout_cout_pct'] >= 0.0
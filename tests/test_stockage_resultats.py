@@ -0,0 +1,28 @@
+import numpy as np
+
+from calculs_bael import CAS_INVALIDE
+from stockage_resultats import StockageResultats
+from travaux_lots import calcul_elu_els
+
+# Poutre 0 refusée à l'ELU (pivot A, μ < μ₁), poutre 1 valide
+ENTREES = {
+    'Mu_MNm': [0.05, 0.32], 'Ms_MNm': [0.03, 0.177], 'b_m': 0.25, 'd_m': 0.45, 'dp_m': 0.04,
+    'fc28_MPa': 25, 'acier_type': 500, 'fissuration': 'FP', 'acier_ha': 'HA',
+}
+
+
+def test_cas_sentinelle_section_refusee(tmp_path):
+    stockage = StockageResultats(str(tmp_path / 'balayage'))
+    stockage.ajouter_calcul(ENTREES)
+    assert stockage.colonne('valide')[:].tolist() == [False, True]
+    assert stockage.colonne('cas')[0] == CAS_INVALIDE
+    assert stockage.filtrer(cas=CAS_INVALIDE).tolist() == [0]
+    assert 0 not in stockage.filtrer(cas=3).tolist()
+
+
+def test_travail_cas_sentinelle_section_refusee():
+    bloc = {c: np.broadcast_to(np.asarray(v), (2,)) for c, v in ENTREES.items()}
+    r = calcul_elu_els(bloc)
+    assert r['valide'].tolist() == [False, True]
+    assert r['cas'][0] == CAS_INVALIDE
+    assert r['cas'][1] in (1, 2, 3, 4)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from travaux_lots import TravailLots
+
+ENTREES = {
+    'Mu_MNm': [0.05, 0.32, 0.20], 'Ms_MNm': [0.03, 0.177, 0.14], 'b_m': 0.25, 'd_m': 0.45,
+    'dp_m': 0.04, 'fc28_MPa': 25, 'acier_type': 500, 'fissuration': 'FP', 'acier_ha': 'HA',
+}
+
+
+def test_empreinte_colonnes_objet_par_valeur():
+    a = {'fissuration': np.array(['FP', 'FTP'], dtype=object)}
+    b = {'fissuration': np.array([''.join(['F', 'P']), 'FTP'], dtype=object)}
+    c = {'fissuration': np.array(['FP', 'FP'], dtype=object)}
+    assert TravailLots.empreinte(a) == TravailLots.empreinte(b)
+    assert TravailLots.empreinte(a) != TravailLots.empreinte(c)
+
+
+def test_nettoyage_limite_aux_temporaires_du_travail(tmp_path):
+    dossier = tmp_path / 'reprise'
+    dossier.mkdir()
+    (dossier / 'bloc_000000000000_000000000002.npz.tmp.npz').write_bytes(b'')
+    (dossier / 'notes.tmp.txt').write_text('autre')
+    TravailLots(str(dossier), ENTREES, taille_bloc=2)
+    assert sorted(p.name for p in dossier.iterdir()) == ['notes.tmp.txt', 'travail.json']
+
+
+def test_reprise_et_resultats(tmp_path):
+    travail = TravailLots(str(tmp_path), ENTREES, taille_bloc=2).executer(progression=None)
+    assert travail.termine
+    r = TravailLots(str(tmp_path), ENTREES).resultats()
+    assert r['valide'].tolist() == [False, True, True]
+    assert r['cas'][0] == 0
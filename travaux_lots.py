@@ -0,0 +1,224 @@
+# =======================================================
+# TRAVAUX PAR LOTS REPRENABLES (POINTS DE REPRISE) - RAHANI Soulaimane
+# =======================================================
+#
+# Un travail découpe ses entrées en blocs de lignes ; chaque bloc calculé est
+# écrit dans le dossier de reprise sous forme d'un fichier .npz publié de
+# façon atomique (fichier temporaire puis os.replace). Un bloc existe donc
+# entièrement ou pas du tout : après un arrêt, seuls les blocs manquants
+# sont recalculés.
+
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from backends_bael import calcul_elu_els_lot
+
+
+def calcul_elu_els(bloc):
+    """
+    Fonction de travail par défaut: ELU + ELS vectorisés d'un bloc
+
+    bloc: Mu_MNm, Ms_MNm, b_m, d_m, dp_m, fc28_MPa, acier_type, fissuration,
+    acier_ha (+ b0_m, h0_m) ; cas = CAS_INVALIDE pour une section refusée à l'ELU
+    """
+    elu, els = calcul_elu_els_lot(
+        bloc['Mu_MNm'], bloc['Ms_MNm'], bloc['b_m'], bloc['d_m'], bloc['dp_m'], bloc['fc28_MPa'],
+        bloc['acier_type'], bloc['fissuration'], bloc['acier_ha'],
+        bloc.get('b0_m'), bloc.get('h0_m'),
+    )
+    return {
+        'valide': elu['valide'], 'Ast_m2': elu['Ast_m2'], 'Asc_m2': elu['Asc_m2'],
+        'sigma_b_MPa': els['sigma_b_MPa'], 'sigma_s_MPa': els['sigma_s_MPa'],
+        'cas': els['cas'],
+    }
+
+
+def afficher_progression(etat):
+    """Progression par défaut sur la sortie d'erreur"""
+    eta = etat['eta_s']
+    texte_eta = "--" if eta is None else time.strftime('%H:%M:%S', time.gmtime(eta))
+    sys.stderr.write(
+        f"\r{etat['lignes_faites']}/{etat['nb_lignes']} lignes "
+        f"({100 * etat['fraction']:.1f} %) – {etat['debit_lignes_s']:.0f} lignes/s – ETA {texte_eta}"
+    )
+    if etat['fraction'] >= 1.0:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+class TravailLots:
+    """
+    Travail par lots avec points de reprise sur disque
+
+    Le manifeste (travail.json) fixe le découpage et l'empreinte des
+    entrées : relancer le même travail sur le même dossier reprend là où il
+    s'était arrêté, un travail différent est refusé.
+    """
+
+    FICHIER_MANIFESTE = 'travail.json'
+
+    def __init__(self, dossier, entrees, fonction=calcul_elu_els, taille_bloc=1 << 16):
+        n = max(len(np.atleast_1d(v)) for v in entrees.values())
+        self.entrees = {c: np.broadcast_to(np.atleast_1d(np.asarray(v)), (n,)) for c, v in entrees.items()}
+        self.nb_lignes = n
+        self.fonction = fonction
+        self.dossier = dossier
+
+        manifeste = {
+            'nb_lignes': n,
+            'taille_bloc': int(taille_bloc),
+            'fonction': f"{fonction.__module__}.{fonction.__qualname__}",
+            'empreinte': self.empreinte(self.entrees),
+        }
+        chemin = os.path.join(dossier, self.FICHIER_MANIFESTE)
+        if os.path.exists(chemin):
+            with open(chemin, encoding='utf-8') as f:
+                existant = json.load(f)
+            for cle in ('nb_lignes', 'fonction', 'empreinte'):
+                if existant[cle] != manifeste[cle]:
+                    raise ValueError(f"Dossier de reprise d'un autre travail ({cle} différent)")
+            # Le découpage d'origine fait foi
+            manifeste['taille_bloc'] = existant['taille_bloc']
+        else:
+            os.makedirs(dossier, exist_ok=True)
+            self._ecrire_atomique(chemin, json.dumps(manifeste, indent=1).encode('utf-8'))
+
+        self.taille_bloc = manifeste['taille_bloc']
+
+        # Fichiers temporaires de ce travail interrompu : jamais publiés, supprimés
+        for nom in os.listdir(dossier):
+            if fnmatch.fnmatch(nom, 'bloc_*.tmp*') or nom == self.FICHIER_MANIFESTE + '.tmp':
+                os.remove(os.path.join(dossier, nom))
+
+    # ============================================
+    # 1. DÉCOUPAGE ET FICHIERS
+    # ============================================
+
+    @staticmethod
+    def empreinte(entrees):
+        """
+        Empreinte SHA-1 des entrées (noms, types et contenu des colonnes)
+
+        Colonnes objet (textes Python) converties en chaînes : leurs octets
+        bruts ne sont que des adresses mémoire
+        """
+        h = hashlib.sha1()
+        for c in sorted(entrees):
+            v = np.asarray(entrees[c])
+            if v.dtype == object:
+                v = v.astype('U')
+            v = np.ascontiguousarray(v)
+            h.update(f"{c}:{v.dtype.str}:{v.shape}".encode('utf-8'))
+            h.update(v.tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def _ecrire_atomique(chemin, octets):
+        temporaire = chemin + '.tmp'
+        with open(temporaire, 'wb') as f:
+            f.write(octets)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporaire, chemin)
+        TravailLots._synchroniser_dossier(os.path.dirname(chemin))
+
+    @staticmethod
+    def _synchroniser_dossier(dossier):
+        """fsync du dossier : le renommage atomique survit à une coupure"""
+        try:
+            descripteur = os.open(dossier or '.', os.O_RDONLY)
+        except OSError:
+            # Windows : pas de descripteur sur un dossier, renommage déjà durable
+            return
+        try:
+            os.fsync(descripteur)
+        finally:
+            os.close(descripteur)
+
+    def blocs(self):
+        """Plages [début, fin) de tous les blocs"""
+        return [(debut, min(debut + self.taille_bloc, self.nb_lignes))
+                for debut in range(0, self.nb_lignes, self.taille_bloc)]
+
+    def _chemin_bloc(self, debut, fin):
+        return os.path.join(self.dossier, f"bloc_{debut:012d}_{fin:012d}.npz")
+
+    def blocs_faits(self):
+        """Plages des blocs déjà enregistrés"""
+        return [(debut, fin) for debut, fin in self.blocs()
+                if os.path.exists(self._chemin_bloc(debut, fin))]
+
+    def _enregistrer_bloc(self, debut, fin, resultat):
+        chemin = self._chemin_bloc(debut, fin)
+        temporaire = chemin + '.tmp.npz'
+        with open(temporaire, 'wb') as f:
+            np.savez(f, **{c: np.asarray(v) for c, v in resultat.items()})
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporaire, chemin)
+        self._synchroniser_dossier(self.dossier)
+
+    # ============================================
+    # 2. EXÉCUTION
+    # ============================================
+
+    def executer(self, progression=afficher_progression):
+        """
+        Calcule les blocs manquants, dans l'ordre
+
+        progression: fonction(état) appelée après chaque bloc (ou None) ;
+        état = lignes_faites, nb_lignes, fraction, debit_lignes_s, eta_s
+        """
+        faits = set(self.blocs_faits())
+        a_faire = [plage for plage in self.blocs() if plage not in faits]
+        lignes_faites = sum(fin - debut for debut, fin in faits)
+
+        debut_session = time.monotonic()
+        lignes_session = 0
+        for debut, fin in a_faire:
+            bloc = {c: v[debut:fin] for c, v in self.entrees.items()}
+            self._enregistrer_bloc(debut, fin, self.fonction(bloc))
+
+            lignes_faites += fin - debut
+            lignes_session += fin - debut
+            if progression:
+                duree = time.monotonic() - debut_session
+                debit = lignes_session / duree if duree > 0 else 0.0
+                reste = self.nb_lignes - lignes_faites
+                progression({
+                    'lignes_faites': lignes_faites,
+                    'nb_lignes': self.nb_lignes,
+                    'fraction': lignes_faites / self.nb_lignes,
+                    'debit_lignes_s': debit,
+                    'eta_s': reste / debit if debit > 0 else None,
+                })
+        return self
+
+    @property
+    def termine(self):
+        return len(self.blocs_faits()) == len(self.blocs())
+
+    # ============================================
+    # 3. RÉSULTATS
+    # ============================================
+
+    def iterer_resultats(self):
+        """Itère sur (début, dict de tableaux) des blocs enregistrés"""
+        for debut, fin in self.blocs_faits():
+            with np.load(self._chemin_bloc(debut, fin), allow_pickle=False) as f:
+                yield debut, {c: f[c] for c in f.files}
+
+    def resultats(self):
+        """Assemble les résultats de tous les blocs (travail terminé)"""
+        if not self.termine:
+            raise ValueError("Travail incomplet : relancer executer()")
+        morceaux = [r for _, r in self.iterer_resultats()]
+        if not morceaux:
+            return {}
+        return {c: np.concatenate([m[c] for m in morceaux]) for c in morceaux[0]}